@@ -0,0 +1,187 @@
+"""Benchmarks for MDC for Django.
+
+Run all benchmarks, or those of a module, with ``python -m``::
+
+    $ python -m mdc.benchmarks
+    $ python -m mdc.benchmarks.pagination
+
+Each benchmark reports operations per second and the peak memory
+allocated by an operation. Results can be saved as a baseline with
+``--save`` and compared with a saved baseline with ``--baseline``.
+
+The benchmarks configure minimal Django settings by themselves unless
+``DJANGO_SETTINGS_MODULE`` is given, so they run without any project or
+network access.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+RENDERERS = {
+    'django': 'django.forms.renderers.DjangoTemplates',
+    'compiled': 'mdc.forms.renderers.CompiledDjangoTemplates',
+    'jinja2': 'mdc.forms.renderers.Jinja2',
+}
+
+
+def setup_django(renderer='django'):
+    """Configure minimal settings for benchmarks and set up Django.
+
+    Args:
+        renderer (:obj:`str`, optional): Key of :obj:`RENDERERS` used as
+            `FORM_RENDERER`. Default to `'django'`.
+    """
+    import django
+    from django.conf import settings
+
+    if not settings.configured and \
+            'DJANGO_SETTINGS_MODULE' not in os.environ:
+        settings.configure(
+            DEBUG=False,
+            SECRET_KEY='mdc-benchmarks',
+            INSTALLED_APPS=[
+                'django.contrib.contenttypes',
+                'django.contrib.auth',
+                'django.contrib.humanize',
+                'django.contrib.staticfiles',
+                'django.forms',
+                'mdc',
+            ],
+            DATABASES={
+                'default': {
+                    'ENGINE': 'django.db.backends.sqlite3',
+                    'NAME': ':memory:',
+                },
+            },
+            TEMPLATES=[{
+                'BACKEND': 'django.template.backends.django.DjangoTemplates',
+                'APP_DIRS': True,
+            }],
+            FORM_RENDERER=RENDERERS[renderer],
+            STATIC_URL='/static/',
+            USE_I18N=True,
+            USE_L10N=True,
+        )
+    django.setup()
+
+
+def measure(func, number=None, repeat=5):
+    """Measure the best time of a call of `func`.
+
+    Args:
+        func (callable): Function called without arguments.
+        number (:obj:`int`, optional): Calls per trial. If omitted, it is
+            decided automatically so that a trial takes at least 0.2s.
+        repeat (:obj:`int`, optional): Number of trials. Default to 5.
+    Returns:
+        float: Seconds per call in the best trial.
+    """
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def measure_memory(func):
+    """Return the peak bytes allocated during a call of `func`."""
+    func()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def self_timed(func):
+    """Mark `func` as returning seconds it measured by itself.
+
+    The best of the returned seconds is reported instead of the time of
+    calls, e.g. for operations run in another process.
+    """
+    func.self_timed = True
+    return func
+
+
+def run(cases, baseline=None, tolerance=0.1, repeat=5):
+    """Run benchmarks and print the results.
+
+    Args:
+        cases (iterable): Tuples of the name and the function of
+            benchmarks.
+        baseline (:obj:`dict`, optional): Results saved previously.
+        tolerance (:obj:`float`, optional): Allowed ratio of slowdown
+            against `baseline`. Default to 0.1.
+        repeat (:obj:`int`, optional): Number of trials. Default to 5.
+    Returns:
+        tuple: Results keyed by the name, and names of regressions.
+    """
+    results = {}
+    regressions = []
+    print(f'{"benchmark":<48} {"ops/sec":>12} {"peak":>10} {"change":>8}')
+    for name, func in cases:
+        if getattr(func, 'self_timed', False):
+            ops = 1 / min(func() for _ in range(repeat))
+        else:
+            ops = 1 / measure(func, repeat=repeat)
+        peak = measure_memory(func)
+        results[name] = {'ops': ops, 'peak': peak}
+        change = ''
+        if baseline and name in baseline:
+            ratio = ops / baseline[name]['ops'] - 1
+            change = f'{ratio:+.1%}'
+            if ratio < -tolerance:
+                regressions.append(name)
+                change += ' !'
+        print(f'{name:<48} {ops:>12,.1f} {peak / 1024:>8,.1f}KB {change:>8}',
+              flush=True)
+    return results, regressions
+
+
+def main(modules, argv=None):
+    """Run benchmarks of `modules` from the command line.
+
+    Args:
+        modules (list): Names of modules defining `cases()` that returns
+            tuples of the name and the function of benchmarks.
+        argv (:obj:`list`, optional): Command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-k', dest='keyword', default='',
+                        help='run only benchmarks including KEYWORD')
+    parser.add_argument('--renderer', choices=RENDERERS, default='django',
+                        help='form renderer used for widgets')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of trials (default: 5)')
+    parser.add_argument('--save', metavar='PATH',
+                        help='save the results as a baseline')
+    parser.add_argument('--baseline', metavar='PATH',
+                        help='compare the results with a baseline')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='allowed ratio of slowdown (default: 0.1)')
+    args = parser.parse_args(argv)
+
+    setup_django(args.renderer)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    cases = (
+        (name, func)
+        for module in modules
+        for name, func in importlib.import_module(module).cases()
+        if args.keyword in name
+    )
+    results, regressions = run(cases, baseline, args.tolerance, args.repeat)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if regressions:
+        print(f'{len(regressions)} benchmark(s) slower than baseline by more'
+              f' than {args.tolerance:.0%}.', file=sys.stderr)
+        sys.exit(1)
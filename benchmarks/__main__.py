@@ -0,0 +1,9 @@
+from mdc.benchmarks import main
+
+main([
+    'mdc.benchmarks.widgets',
+    'mdc.benchmarks.forms',
+    'mdc.benchmarks.pagination',
+    'mdc.benchmarks.tables',
+    'mdc.benchmarks.imports',
+])
@@ -0,0 +1,83 @@
+"""Benchmark of rendering forms using `mdc.forms`::
+
+    $ python -m mdc.benchmarks.forms
+"""
+
+from mdc.benchmarks import main
+from mdc.benchmarks.widgets import LARGE_CHOICES, SMALL_CHOICES
+
+FIELD_COUNTS = (50, 300, 1000)
+FORMSET_COUNTS = (100, 1000)
+
+
+def field_factories():
+    """Return functions creating fields used in a realistic form."""
+    from mdc import forms
+
+    return [
+        lambda: forms.CharField(max_length=100),
+        lambda: forms.CharField(widget=forms.TextInput(hint='Hint')),
+        lambda: forms.IntegerField(min_value=0, max_value=100),
+        lambda: forms.EmailField(required=False),
+        lambda: forms.ChoiceField(choices=SMALL_CHOICES),
+        lambda: forms.BooleanField(required=False),
+        lambda: forms.CharField(widget=forms.Textarea, required=False),
+        lambda: forms.ChoiceField(choices=SMALL_CHOICES,
+                                  widget=forms.RadioSelect),
+        lambda: forms.IntegerField(widget=forms.Slider),
+        lambda: forms.CharField(widget=forms.PasswordInput),
+    ]
+
+
+def form_class(count, *extra_fields):
+    """Return a form class having `count` fields of various types."""
+    from mdc import forms
+
+    factories = field_factories()
+    attrs = {
+        f'field{i}': factories[i % len(factories)]()
+        for i in range(count)
+    }
+    attrs.update(extra_fields)
+    return type(f'Form{count}', (forms.Form,), attrs)
+
+
+def _validate(form, name):
+    form.validate_field(name)
+    return form[name]
+
+
+def cases():
+    from mdc import forms
+
+    for count in FIELD_COUNTS:
+        form = form_class(count)
+        yield f'form/{count}-fields/unbound', lambda f=form: str(f())
+        data = {f'field{i}': '' for i in range(count)}
+        yield f'form/{count}-fields/bound', lambda f=form: str(f(data))
+        cached = type(form.__name__, (forms.RenderCacheMixin, form), {})
+        yield (f'form/{count}-fields/unbound/render_cache',
+               lambda f=cached: str(f()))
+        validated = type(form.__name__, (forms.FieldValidationMixin, form),
+                         {'validation_url': '/validate/'})
+        yield (f'form/{count}-fields/validate_field',
+               lambda f=validated: str(_validate(f(data), 'field0')))
+    for compile_options in (False, True):
+        form = form_class(10, ('sku', forms.ChoiceField(
+            choices=LARGE_CHOICES,
+            widget=forms.Select(compile_options=compile_options),
+        )))
+        name = '/compile_options' if compile_options else ''
+        yield f'form/20k-choices{name}', lambda f=form: str(f())
+    form = form_class(10)
+    for count in FORMSET_COUNTS:
+        formset = forms.formset_factory(
+            form, formset=forms.BaseStreamingFormSet, extra=count)
+        yield (f'formset/{count}-forms/as_table',
+               lambda f=formset: f().as_table())
+        yield (f'formset/{count}-forms/stream',
+               lambda f=formset: sum(map(len, f().stream())))
+
+
+if __name__ == '__main__':
+    main([__name__])
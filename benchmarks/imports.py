@@ -0,0 +1,91 @@
+"""Benchmark of importing MDC for Django::
+
+    $ python -m mdc.benchmarks.imports
+
+Each benchmark starts a new interpreter running ``python -X importtime``,
+so that imports are measured without modules cached in `sys.modules`,
+and reports the cumulative time of the imports parsed from its output,
+excluding the start-up of the interpreter.
+Running this module also prints the modules imported by `mdc.forms`
+taking the most time.
+"""
+
+import os
+import subprocess
+import sys
+
+from mdc.benchmarks import main, self_timed
+
+STATEMENTS = {
+    'django.forms': 'import django.forms',
+    'mdc.forms': 'import mdc.forms',
+    'mdc.forms.renderers': 'import mdc.forms.renderers',
+    'mdc.forms.CharField': 'from mdc.forms import CharField',
+    'mdc.forms.PasswordInput': 'from mdc.forms import PasswordInput',
+}
+"""Statements benchmarked, keyed by the name of the benchmark."""
+
+
+_START = 'mdc-benchmarks-start'
+
+
+def importtime(statement):
+    """Return microseconds taken by modules imported by `statement`.
+
+    Modules imported on start-up of the interpreter are excluded.
+
+    Returns:
+        dict: Tuples of the time of the module itself, the cumulative
+            time including its imports and the depth of the nesting,
+            keyed by the name of the module.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         f'import sys; print({_START!r}, file=sys.stderr); {statement}'],
+        env=env, stderr=subprocess.PIPE, universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    lines = result.stderr.splitlines()
+    for line in lines[lines.index(_START) + 1:]:
+        if not line.startswith('import time:'):
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        if self_time.strip().isdigit():
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            times[name.strip()] = (int(self_time), int(cumulative), depth)
+    return times
+
+
+def import_seconds(statement):
+    """Return seconds taken by imports of `statement`.
+
+    It is the sum of the cumulative times of the modules imported
+    directly by `statement`, including ones imported lazily on access of
+    names, excluding the start-up of the interpreter.
+    """
+    return sum(cumulative for _, cumulative, depth
+               in importtime(statement).values() if not depth) / 1e6
+
+
+def report(statement, limit=10):
+    """Print modules imported by `statement` taking the most time."""
+    print(f'\n{statement}: {import_seconds(statement) * 1e6:,.0f}us')
+    times = importtime(statement)
+    ranking = sorted(times.items(), key=lambda item: -item[1][0])
+    for name, (self_time, cumulative, _) in ranking[:limit]:
+        print(f'{name:<48} {self_time:>10,}us {cumulative:>10,}us')
+
+
+def cases():
+    for name, statement in STATEMENTS.items():
+        yield f'import/{name}', self_timed(
+            lambda s=statement: import_seconds(s))
+
+
+if __name__ == '__main__':
+    try:
+        main([__name__])
+    finally:
+        report(STATEMENTS['mdc.forms'])
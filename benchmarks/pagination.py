@@ -0,0 +1,42 @@
+"""Benchmark of pagination tags.
+
+Rendering `paginater_num` should take the same time regardless of the
+total number of pages. Cases ending with `/uncached` render the HTML
+without `pagination_cache`::
+
+    $ python -m mdc.benchmarks.pagination
+"""
+
+from mdc.benchmarks import main
+
+PAGE_COUNTS = (10, 1_000, 100_000, 10_000_000)
+
+
+def cases():
+    from django.test import RequestFactory
+    from mdc.templatetags.pagination import (
+        PageURLBuilder, _render_paginater_num, paginater_num,
+    )
+
+    request = RequestFactory().get('/list/', {
+        **{f'filter{i}': f'value{i}' for i in range(20)},
+        'page': 1,
+    })
+    for num_pages in PAGE_COUNTS:
+        for position, page_number in (('first', 1),
+                                      ('middle', num_pages // 2),
+                                      ('last', num_pages)):
+            yield (
+                f'pagination/{num_pages}-pages/{position}',
+                lambda n=num_pages, p=page_number:
+                    paginater_num(request, n, p),
+            )
+            yield (
+                f'pagination/{num_pages}-pages/{position}/uncached',
+                lambda n=num_pages, p=page_number: _render_paginater_num(
+                    PageURLBuilder(request), n, p, 2, 3, None),
+            )
+
+
+if __name__ == '__main__':
+    main([__name__])
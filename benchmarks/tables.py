@@ -0,0 +1,44 @@
+"""Benchmark of data tables.
+
+Streaming :obj:`mdc.tables.DataTable` should keep the peak memory the
+same regardless of the number of rows::
+
+    $ python -m mdc.benchmarks.tables
+"""
+
+from mdc.benchmarks import main
+
+ROW_COUNTS = (100, 10_000, 50_000)
+
+
+def cases():
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+    from django.test import RequestFactory
+    from mdc.tables import Column, DataTable
+
+    call_command('migrate', 'auth', verbosity=0)
+    User.objects.bulk_create([
+        User(username=f'user{i}', email=f'user{i}@example.com')
+        for i in range(max(ROW_COUNTS))
+    ], batch_size=500)
+    request = RequestFactory().get('/users/', {'sort': '-username'})
+    columns = [
+        Column('username'), Column('email'), Column('date_joined'),
+        Column('is_active'),
+    ]
+
+    def stream(count):
+        table = DataTable(User.objects.order_by('pk')[:count], columns)
+        for _ in table.streaming_response().streaming_content:
+            pass
+
+    for count in ROW_COUNTS:
+        yield f'tables/stream/{count}-rows', lambda n=count: stream(n)
+    table = DataTable(User.objects.all(), columns, request)
+    table.paginate(50)
+    yield 'tables/page/50-rows', table.render
+
+
+if __name__ == '__main__':
+    main([__name__])
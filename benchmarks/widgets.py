@@ -0,0 +1,87 @@
+"""Benchmark of rendering each widget of `mdc.forms.widgets`::
+
+    $ python -m mdc.benchmarks.widgets
+"""
+
+import datetime
+
+from mdc.benchmarks import main
+
+SMALL_CHOICES = [(f'c{i}', f'Choice {i}') for i in range(10)]
+LARGE_CHOICES = [(f'SKU{i:06d}', f'Product {i}') for i in range(20_000)]
+
+
+def widget_cases():
+    """Return tuples of the name, the widget and the value to render."""
+    from mdc.forms import widgets
+
+    now = datetime.datetime(2018, 9, 1, 12, 34, 56)
+    return [
+        ('TextInput', widgets.TextInput(label='Text', hint='Hint'), 'text'),
+        ('NumberInput', widgets.NumberInput(label='Number'), 123),
+        ('EmailInput', widgets.EmailInput(label='Email'), 'a@example.com'),
+        ('URLInput', widgets.URLInput(label='URL'), 'https://example.com'),
+        ('PasswordInput', widgets.PasswordInput(label='Password'), ''),
+        ('PasswordInput/auth_validate',
+         widgets.PasswordInput(label='Password', auth_validate=True), ''),
+        ('HiddenInput', widgets.HiddenInput(), 'hidden'),
+        ('MultipleHiddenInput', widgets.MultipleHiddenInput(), ['a', 'b']),
+        ('FileInput', widgets.FileInput(), None),
+        ('ClearableFileInput', widgets.ClearableFileInput(), None),
+        ('Textarea', widgets.Textarea(label='Textarea'), 'text\n' * 10),
+        ('DateInput', widgets.DateInput(), now.date()),
+        ('DateTimeInput', widgets.DateTimeInput(), now),
+        ('TimeInput', widgets.TimeInput(), now.time()),
+        ('CheckboxInput', widgets.CheckboxInput(label='Check'), True),
+        ('Select', widgets.Select(label='Select', choices=SMALL_CHOICES),
+         'c5'),
+        ('Select/20k', widgets.Select(choices=LARGE_CHOICES), 'SKU010000'),
+        ('Select/20k/compile_options',
+         widgets.Select(choices=LARGE_CHOICES, compile_options=True),
+         'SKU010000'),
+        ('AsyncSelect',
+         widgets.AsyncSelect(url='/choices/', choices=LARGE_CHOICES),
+         'SKU010000'),
+        ('NullBooleanSelect', widgets.NullBooleanSelect(), True),
+        ('SelectMultiple', widgets.SelectMultiple(choices=SMALL_CHOICES),
+         ['c1', 'c2']),
+        ('RadioSelect',
+         widgets.RadioSelect(label='Radio', choices=SMALL_CHOICES), 'c5'),
+        ('RadioSelect/compile_options',
+         widgets.RadioSelect(choices=SMALL_CHOICES, compile_options=True),
+         'c5'),
+        ('CheckboxSelectMultiple',
+         widgets.CheckboxSelectMultiple(choices=SMALL_CHOICES), ['c1']),
+        ('MultiWidget',
+         widgets.MultiWidget([widgets.TextInput(), widgets.TextInput()]),
+         ['a', 'b']),
+        ('SplitDateTimeWidget', widgets.SplitDateTimeWidget(), now),
+        ('SplitHiddenDateTimeWidget', widgets.SplitHiddenDateTimeWidget(),
+         now),
+        ('SelectDateWidget', widgets.SelectDateWidget(), now.date()),
+        ('Slider', widgets.Slider(label='Slider', discrete=True), 50),
+    ]
+
+
+def cases():
+    from django.forms import Widget
+    from mdc.forms import widgets
+
+    benchmarks = widget_cases()
+    covered = {name.split('/')[0] for name, widget, value in benchmarks}
+    missing = [
+        name for name in widgets.__all__
+        if isinstance(getattr(widgets, name), type) and
+        issubclass(getattr(widgets, name), Widget) and
+        name not in covered | {'Widget'}
+    ]
+    if missing:
+        raise RuntimeError(f'No benchmark of {", ".join(missing)}')
+    for name, widget, value in benchmarks:
+        attrs = {'id': f'id_{name}', 'required': True}
+        yield (f'widget/{name}',
+               lambda w=widget, v=value, a=attrs: w.render('field', v, a))
+
+
+if __name__ == '__main__':
+    main([__name__])
@@ -0,0 +1,171 @@
+"""CSS chunks of MDC components used by pages.
+
+Add :obj:`CSSChunksMiddleware` to `MIDDLEWARE` and use `mdc_css_chunks`
+tag of `mdcimport` instead of the whole MDC bundle and `complement.scss`::
+
+    {% load mdcimport %}
+    {% mdc_css_chunks %}
+
+While a request is processed, MDC widgets and pagination tags record the
+components they render, and the middleware replaces the tag with links of
+the chunks of the components only. Compile the chunks in advance by
+`compile_mdc_sass --chunks`.
+
+Without the middleware, the tag links the whole MDC bundle and
+`complement.scss`.
+"""
+
+import re
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+
+__all__ = (
+    'CHUNKS', 'PLACEHOLDER', 'chunk_path', 'component_of', 'is_recording',
+    'record', 'capture', 'resolve', 'CSSChunksMiddleware',
+)
+
+CHUNKS = {
+    'base': (),
+    'layout-grid': (),
+    'card': (),
+    'button': (),
+    'form': (),
+    'text-field': ('form',),
+    'select': ('form',),
+    'checkbox': ('form',),
+    'radio': ('form',),
+    'slider': (),
+    'data-table': ('button',),
+}
+"""Dependencies of chunks keyed by the name of the component.
+
+The chunks are linked in this order, so that the later ones override
+the former ones.
+"""
+
+PLACEHOLDER = '<!-- mdc-css-chunks -->'
+
+_local = threading.local()
+
+
+def chunk_path(name):
+    """Return the path of Sass of the chunk named `name`."""
+    return f'mdc/chunks/{name}.scss'
+
+
+@lru_cache(maxsize=None)
+def component_of(mdc_class):
+    """Return the component of the class name, e.g. `'mdc-slider'`.
+
+    Returns:
+        str: Name of the component, or `None` if the class is not one of
+            MDC components.
+    """
+    match = re.match(r'mdc-([a-z-]+?)(?:__|--|$)', mdc_class or '')
+    return match and match.group(1)
+
+
+def is_recording():
+    """Return whether components of the current request are recorded."""
+    return getattr(_local, 'components', None) is not None
+
+
+def record(*components):
+    """Record components rendered in the current request, if recording."""
+    recorded = getattr(_local, 'components', None)
+    if recorded is not None:
+        recorded.update(components)
+
+
+@contextmanager
+def capture():
+    """Context manager collecting components recorded within the block.
+
+    The components are recorded in the current request as well, if
+    recording. Use it to replay them by :func:`record` when the HTML is
+    reused without rendering.
+    """
+    outer = getattr(_local, 'components', None)
+    captured = set()
+    _local.components = captured
+    try:
+        yield captured
+    finally:
+        _local.components = outer
+        if outer is not None:
+            outer.update(captured)
+
+
+def resolve(components):
+    """Return names of chunks required by `components` in link order.
+
+    The `base` chunk is always included. Unknown components are ignored.
+    """
+    required = {'base'}
+    pending = [c for c in components if c in CHUNKS]
+    while pending:
+        name = pending.pop()
+        if name not in required:
+            required.add(name)
+            pending.extend(CHUNKS[name])
+    return [name for name in CHUNKS if name in required]
+
+
+def _replace_first(content, old, new):
+    """Yield byte strings of `content` replacing the first `old` with `new`.
+
+    Chunks are held back by the length of `old` so that `old` split across
+    chunks is found as well.
+    """
+    content = iter(content)
+    keep = len(old) - 1
+    pending = b''
+    for chunk in content:
+        pending += chunk
+        if old in pending:
+            yield pending.replace(old, new, 1)
+            yield from content
+            return
+        if len(pending) > keep:
+            yield pending[:-keep]
+            pending = pending[-keep:]
+    yield pending
+
+
+class CSSChunksMiddleware:
+    """Middleware replacing `mdc_css_chunks` tag with links of used chunks.
+
+    In streaming responses the placeholder is replaced with links of all
+    chunks, since the components rendered later are not known when the
+    head of the page is sent.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        _local.components = set()
+        try:
+            response = self.get_response(request)
+            if 'html' not in response.get('Content-Type', ''):
+                return response
+            streaming = getattr(response, 'streaming', False)
+            placeholder = PLACEHOLDER.encode()
+            if not streaming and placeholder not in response.content:
+                return response
+            components = CHUNKS if streaming else _local.components
+        finally:
+            _local.components = None
+
+        from mdc.templatetags.mdcimport import chunk_links
+        links = chunk_links(map(chunk_path, resolve(components)))
+        links = links.encode(response.charset)
+        if streaming:
+            response.streaming_content = _replace_first(
+                response.streaming_content, placeholder, links)
+            return response
+        response.content = response.content.replace(placeholder, links)
+        if response.has_header('Content-Length'):
+            response['Content-Length'] = len(response.content)
+        return response
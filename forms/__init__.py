@@ -1,8 +1,60 @@
-from django.core.exceptions import ValidationError  # NOQA
-from django.forms.boundfield import *  # NOQA
-from django.forms.forms import *  # NOQA
-from django.forms.formsets import *  # NOQA
-from django.forms.models import *  # NOQA
-
-from .widgets import *  # NOQA
-from .fields import *  # NOQA
+"""Forms of MDC for Django, a drop-in replacement of `django.forms`.
+
+Names are resolved on the first access by module `__getattr__`, so that
+importing this package, or one of its modules such as `renderers`, does
+not import all the modules of forms.
+"""
+
+import importlib
+
+_MODULES = (
+    'mdc.forms.formsets',
+    'mdc.forms.forms',
+    'mdc.forms.fields',
+    'mdc.forms.widgets',
+    'django.forms.models',
+    'django.forms.formsets',
+    'django.forms.forms',
+    'django.forms.boundfield',
+)
+"""Modules exporting their `__all__`, in order of precedence."""
+
+_NAMES = {
+    'ValidationError': 'django.core.exceptions',
+}
+"""Modules of names not in `__all__` of :obj:`_MODULES`."""
+
+_SUBMODULES = (
+    'compiled', 'fields', 'forms', 'formsets', 'renderers', 'widgets',
+)
+
+
+def _all():
+    names = set(_NAMES)
+    for module in _MODULES:
+        names.update(importlib.import_module(module).__all__)
+    return sorted(names)
+
+
+def __getattr__(name):
+    if name == '__all__':
+        return _all()
+    if name in _SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+    if name in _NAMES:
+        value = getattr(importlib.import_module(_NAMES[name]), name)
+    else:
+        for module_name in _MODULES:
+            module = importlib.import_module(module_name)
+            if name in module.__all__:
+                value = getattr(module, name)
+                break
+        else:
+            raise AttributeError(
+                f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_all()))
@@ -0,0 +1,309 @@
+"""Functions compiled from the templates of widgets.
+
+Each function of :obj:`COMPILED_TEMPLATES` renders the same HTML as the
+template of MDC for Django, without the template engine. They are used by
+the renderers of :obj:`mdc.forms.renderers` and by widgets rendering
+options in one pass.
+"""
+
+from django.utils.formats import localize
+from django.utils.html import conditional_escape, escape
+from django.utils.safestring import SafeData
+from django.utils.timezone import template_localtime
+
+__all__ = (
+    'var', 'stringformat', 'render_attrs', 'render_input',
+    'render_optgroups', 'render_text', 'render_password', 'render_textarea',
+    'render_checkbox', 'render_select', 'render_select_option',
+    'render_mdc_select_option', 'render_radio', 'render_radio_option',
+    'render_slider', 'COMPILED_TEMPLATES', 'NESTED_TEMPLATES',
+)
+
+
+def var(value):
+    """Return `value` rendered as `{{ value }}`."""
+    return conditional_escape(localize(template_localtime(value)))
+
+
+def stringformat(value):
+    """Return `value` rendered as `{{ value|stringformat:'s' }}`."""
+    if isinstance(value, SafeData):
+        return '%s' % value
+    return escape('%s' % value)
+
+
+def render_attrs(attrs):
+    """Return `attrs` rendered as `django/forms/widgets/attrs.html`."""
+    return ''.join(
+        f' {var(name)}' if value is True
+        else f' {var(name)}="{stringformat(value)}"'
+        for name, value in attrs.items() if value is not False
+    )
+
+
+def render_input(widget):
+    """Return `widget` rendered as `django/forms/widgets/input.html`."""
+    value = ''
+    if widget['value'] is not None:
+        value = f' value="{stringformat(widget["value"])}"'
+    return (f'<input type="{var(widget["type"])}"'
+            f' name="{var(widget["name"])}"{value}'
+            f'{render_attrs(widget["attrs"])}>\n')
+
+
+def render_optgroups(widget, context, render):
+    """Return options of `widget` rendered as `django/.../select.html`."""
+    html = []
+    for group_name, group_choices, group_index in widget['optgroups']:
+        if group_name:
+            html.append(f'\n  <optgroup label="{var(group_name)}">')
+        for option in group_choices:
+            html.append('\n  ')
+            html.append(render(option['template_name'],
+                               dict(context, widget=option)))
+        if group_name:
+            html.append('\n  </optgroup>')
+    return ''.join(html)
+
+
+def render_text(context, render):
+    widget = context['widget']
+    attrs = widget['attrs']
+    hint = context.get('hint')
+    html = ['<div>' if hint else '', '<div class="mdc-text-field']
+    if context.get('dense'):
+        html.append(' mdc-text-field--dense')
+    if attrs.get('disabled'):
+        html.append(' mdc-text-field--disabled')
+    if attrs.get('autofocus'):
+        html.append(' mdc-text-field--focused')
+    html.append('"')
+    if widget.get('auto_init'):
+        html.append(f' {widget["auto_init"]}="MDCTextField"')
+    html.append('>\n  ')
+    html.append(render_input(widget))
+    if widget.get('label'):
+        html.append('\n  <label class="mdc-floating-label')
+        if attrs.get('autofocus'):
+            html.append(' mdc-floating-label--float-above')
+        html.append(f'" for="{var(attrs.get("id", ""))}">'
+                    f'{var(widget["label"])}</label>')
+    html.append('\n  <div class="mdc-line-ripple')
+    if attrs.get('autofocus'):
+        html.append(' mdc-line-ripple--active')
+    html.append('"></div>\n</div>')
+    if hint:
+        html.append('\n<p class="mdc-text-field-helper-text')
+        if context.get('persistent'):
+            html.append(' mdc-text-field-helper-text--persistent')
+        if context.get('valid_msg'):
+            html.append(' mdc-text-field-helper-text--validation-msg')
+        html.append(f'">{var(hint)}</p></div>')
+    return ''.join(html)
+
+
+def render_password(context, render):
+    widget = context['widget']
+    html = ['<div class="mdc-text-field"']
+    if widget.get('auto_init'):
+        html.append(f' {widget["auto_init"]}="MDCTextField"')
+    html.append('>\n  ')
+    html.append(render_input(widget))
+    if widget.get('label'):
+        html.append('\n  <label class="mdc-text-field__label"'
+                    f' for="{var(widget["attrs"].get("id", ""))}">'
+                    f'{var(widget["label"])}</label>')
+    html.append('\n</div>')
+    if widget.get('hint'):
+        html.append('\n<p class="mdc-text-field-helptext'
+                    ' mdc-text-field-helptext--persistent'
+                    ' mdc-text-field-helptext--validation-msg">'
+                    f'{var(widget["hint"])}</p>')
+    return ''.join(html)
+
+
+def render_textarea(context, render):
+    widget = context['widget']
+    attrs = widget['attrs']
+    html = ['<div class="mdc-text-field mdc-text-field--textarea']
+    if attrs.get('disabled'):
+        html.append(' mdc-text-field--disabled')
+    html.append('"')
+    if widget.get('auto_init'):
+        html.append(f' {widget["auto_init"]}="MDCTextField"')
+    html.append(f'>\n  <textarea name="{var(widget["name"])}"'
+                f'{render_attrs(attrs)}>\n')
+    if widget['value']:
+        html.append(var(widget['value']))
+    html.append('</textarea>\n')
+    if widget.get('label'):
+        html.append(f'\n  <label for="{var(attrs.get("id", ""))}"'
+                    ' class="mdc-text-field__label">'
+                    f'{var(widget["label"])}</label>')
+    html.append('\n</div>')
+    return ''.join(html)
+
+
+def render_checkbox(context, render):
+    widget = context['widget']
+    auto_init = widget.get('auto_init')
+    return ''.join((
+        '<div class="mdc-form-field"',
+        f' {auto_init}="MDCFormField"' if auto_init else '',
+        '>\n  <div class="mdc-checkbox"',
+        f' {auto_init}="MDCCheckbox"' if auto_init else '',
+        '>\n    ',
+        render_input(widget),
+        '\n    <div class="mdc-checkbox__background">'
+        '\n      <svg class="mdc-checkbox__checkmark" viewBox="0 0 24 24">'
+        '\n        <path class="mdc-checkbox__checkmark-path" fill="none"'
+        ' stroke="white" d="M1.73,12.91 8.1,19.28 22.79,4.59"/>'
+        '\n      </svg>'
+        '\n      <div class="mdc-checkbox__mixedmark"></div>'
+        '\n    </div>'
+        '\n  </div>',
+        f'\n  <label for="{var(widget["attrs"].get("id", ""))}">'
+        f'{var(widget["label"])}</label>\n</div>',
+    ))
+
+
+def render_select(context, render):
+    widget = context['widget']
+    html = ['<div class="mdc-select"']
+    if widget.get('auto_init'):
+        html.append(f' {widget["auto_init"]}="MDCSelect"')
+    html.append(f'>\n  <select name="{var(widget["name"])}"'
+                f'{render_attrs(widget["attrs"])}>')
+    if widget.get('options') is None:
+        html.append(render_optgroups(widget, context, render))
+    else:
+        html.append(widget['options'])
+    html.append('\n</select>\n')
+    if widget.get('label'):
+        html.append('\n  <label class="mdc-floating-label"'
+                    f' for="{var(widget["attrs"].get("id", ""))}">'
+                    f'{var(widget["label"])}</label>')
+    html.append('\n  <div class="mdc-line-ripple"></div>\n</div>')
+    return ''.join(html)
+
+
+def render_select_option(context, render):
+    widget = context['widget']
+    return (f'<option value="{stringformat(widget["value"])}"'
+            f'{render_attrs(widget["attrs"])}>'
+            f'{var(widget["label"])}</option>\n')
+
+
+def render_mdc_select_option(context, render):
+    widget = context['widget']
+    return ('<li class="mdc-list-item" role="option"'
+            f' data-value="{stringformat(widget["value"])}"'
+            f'{render_attrs(widget["attrs"])}>{var(widget["label"])}</li>')
+
+
+def render_radio(context, render):
+    widget = context['widget']
+    id_ = widget['attrs'].get('id', '')
+    html = ['<fieldset']
+    if id_:
+        html.append(f' id="{var(id_)}"')
+    html.append(' class="mdcd-fieldset">')
+    if widget.get('label'):
+        html.append('\n<legend class="mdc-text-field__label'
+                    ' mdc-text-field__label--float-above">'
+                    f'{var(widget["label"])}</legend>')
+    if widget.get('options') is None:
+        option_context = dict(context, id=id_,
+                              auto_init=widget.get('auto_init'))
+        for group, options, index in widget['optgroups']:
+            for option in options:
+                html.append('\n')
+                html.append(render(option['template_name'],
+                                   dict(option_context, widget=option)))
+    else:
+        html.append(widget['options'])
+    html.append('\n</fieldset>')
+    return ''.join(html)
+
+
+def render_radio_option(context, render):
+    widget = context['widget']
+    auto_init = context.get('auto_init')
+    html = [
+        '<div class="mdc-form-field"',
+        f' {auto_init}="MDCFormField"' if auto_init else '',
+        '>\n  <div class="mdc-radio"',
+        f' {auto_init}="MDCRadio"' if auto_init else '',
+        '>\n    ',
+        render_input(widget),
+        '\n    <div class="mdc-radio__background">'
+        '\n      <div class="mdc-radio__outer-circle"></div>'
+        '\n      <div class="mdc-radio__inner-circle"></div>'
+        '\n    </div>'
+        '\n  </div>',
+    ]
+    if context.get('wrap_label'):
+        id_ = widget['attrs'].get('id')
+        html.append('\n  <label')
+        if id_:
+            html.append(f' for="{var(id_)}"')
+        html.append(f'>{var(widget["label"])}</label>')
+    html.append('\n</div>')
+    return ''.join(html)
+
+
+def render_slider(context, render):
+    widget = context['widget']
+    value = stringformat(widget['value'])
+    html = [f'<div aria-valuenow="{value}"']
+    if widget.get('auto_init'):
+        html.append(f' {widget["auto_init"]}="MDCSlider"')
+    html.append(render_attrs(widget['attrs']))
+    html.append('>\n  <div class="mdc-slider__track-container">'
+                '\n    <div class="mdc-slider__track"></div>')
+    if context.get('displaymerkers'):
+        html.append('\n    <div class="mdc-slider__track-marker-container">'
+                    '</div>')
+    html.append('\n  </div>\n  <div class="mdc-slider__thumb-container">')
+    if context.get('discrete'):
+        html.append('\n    <div class="mdc-slider__pin">'
+                    '\n      <span class="mdc-slider__pin-value-marker">'
+                    f'{value}</span>\n    </div>')
+    html.append('\n    <svg class="mdc-slider__thumb" width="21" height="21">'
+                '\n      <circle cx="10.5" cy="10.5" r="7.875"></circle>'
+                '\n    </svg>'
+                '\n    <div class="mdc-slider__focus-ring"></div>'
+                '\n  </div>')
+    if widget.get('label'):
+        html.append('\n  <span class="mdc-text-field__label'
+                    ' mdc-text-field__label--float-above">'
+                    f'{var(widget["label"])}</span>')
+    if context.get('usesform'):
+        html.append(f'\n  <input type="hidden" name="{var(widget["name"])}"'
+                    f' value="{value}" />')
+    html.append('\n</div>')
+    return ''.join(html)
+
+
+COMPILED_TEMPLATES = {
+    'mdc/forms/widgets/text.html': render_text,
+    'mdc/forms/widgets/password.html': render_password,
+    'mdc/forms/widgets/textarea.html': render_textarea,
+    'mdc/forms/widgets/checkbox.html': render_checkbox,
+    'mdc/forms/widgets/select.html': render_select,
+    'mdc/forms/widgets/select_option.html': render_mdc_select_option,
+    'mdc/forms/widgets/radio.html': render_radio,
+    'mdc/forms/widgets/radio_option.html': render_radio_option,
+    'mdc/forms/widgets/slider.html': render_slider,
+}
+"""dict: Functions rendering templates keyed by the template name.
+
+A function takes the context and a function to render nested templates,
+and returns HTML. Options of :obj:`Select` render through Django's
+`select_option.html`, which is compiled only within MDC templates.
+"""
+
+NESTED_TEMPLATES = {
+    'django/forms/widgets/select_option.html': render_select_option,
+}
+"""dict: Functions rendering templates nested in MDC templates."""
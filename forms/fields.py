@@ -7,7 +7,10 @@ See also:
     https://docs.djangoproject.com/en/1.11/ref/forms/fields/
 """
 
-from django.forms import fields
+import re
+
+from django.core import validators
+from django.forms import fields, models
 from django.forms.fields import (
     Field,
     DateField, TimeField, DateTimeField, DurationField,
@@ -18,6 +21,8 @@ from django.forms.fields import (
     SlugField, TypedChoiceField, TypedMultipleChoiceField, UUIDField,
 )
 
+from django.utils.translation import ungettext_lazy
+
 from mdc.forms import widgets
 
 __all__ = (
@@ -28,9 +33,210 @@ __all__ = (
     'ComboField', 'MultiValueField', 'FloatField', 'DecimalField',
     'SplitDateTimeField', 'GenericIPAddressField', 'FilePathField',
     'SlugField', 'TypedChoiceField', 'TypedMultipleChoiceField', 'UUIDField',
+    'AsyncModelChoiceField',
 )
 
 
+MIN_LENGTH_HINT = ungettext_lazy(
+    'Ensure this value has at least %(limit_value)d character.',
+    'Ensure this value has at least %(limit_value)d characters.',
+    'limit_value')
+MAX_LENGTH_HINT = ungettext_lazy(
+    'Ensure this value has at most %(limit_value)d character.',
+    'Ensure this value has at most %(limit_value)d characters.',
+    'limit_value')
+
+# Syntax of regular expressions only Python supports, e.g. inline flags.
+_PYTHON_ONLY_REGEX = re.compile(r'\(\?(?:P=|#|\(|[aiLmsux-]+[:)])')
+# Characters to escape in classes of the `v` flag, which browsers compile
+# pattern attributes with.
+_CLASS_SYNTAX_CHARACTERS = '()[]{}/|-'
+_CLASS_DOUBLE_PUNCTUATORS = '&!#$%*+,.:;<=>?@^`~'
+# Characters which may be escaped by themselves with the `v` flag, out of
+# classes and additionally in classes.
+_SYNTAX_CHARACTERS = '^$\\.*+?()[]{}|/'
+_CLASS_RESERVED_PUNCTUATORS = '&-!#%,:;<=>@`~'
+# Unicode classes of Python, which are ASCII only in JavaScript. `None`
+# means no equivalent exists.
+_UNICODE_CLASSES = {
+    r'\w': (r'[\p{L}\p{N}_]', r'\p{L}\p{N}_'),
+    r'\W': (r'[^\p{L}\p{N}_]', None),
+    r'\d': (r'\p{Nd}', r'\p{Nd}'),
+    r'\D': (r'\P{Nd}', None),
+    r'\b': (None, None),
+    r'\B': (None, None),
+}
+
+
+def _is_class_atom(item):
+    """Return whether `item` can be the start of a range in a class.
+
+    Shorthands of classes, and properties they are expanded into, cannot.
+    """
+    if len(item) == 1:
+        return item not in '[^'
+    return len(item) == 2 and item[0] == '\\' and item[1] not in 'dDsSwW-'
+
+
+def _is_identity_escape(escape, in_class):
+    """Return whether `escape` is a character escaped needlessly.
+
+    Such escapes, e.g. `\\-` out of classes, are valid in Python but
+    syntax errors with the `v` flag.
+    """
+    if len(escape) != 2:
+        return False
+    char = escape[1]
+    if char.isascii() and char.isalnum():
+        return False
+    return char not in _SYNTAX_CHARACTERS and \
+        not (in_class and char in _CLASS_RESERVED_PUNCTUATORS)
+
+
+def _translate_regex(pattern, unicode=True):
+    r"""Return `pattern` translated into the syntax of JavaScript.
+
+    Characters reserved in classes are escaped, needless escapes are
+    removed, and Unicode classes such as `\w` are replaced with Unicode
+    properties if `unicode` is `True`.
+    A hyphen in a class is escaped unless it makes a range of two single
+    characters, so that `[\w-x]` and `[a-c-e]` match a literal hyphen.
+
+    Returns:
+        str: Translated pattern, or `None` if it can't be translated.
+    """
+    result = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escape = pattern[i:i + 2]
+            if unicode and escape in _UNICODE_CLASSES:
+                escape = _UNICODE_CLASSES[escape][in_class]
+                if escape is None:
+                    return None
+            elif _is_identity_escape(escape, in_class):
+                escape = escape[1:]
+            result.append(escape)
+            i += 2
+            continue
+        if not in_class:
+            if char == '[':
+                in_class = True
+                result.append(char)
+                if pattern[i + 1:i + 2] == '^':
+                    result.append('^')
+                    i += 1
+                if pattern[i + 1:i + 2] == ']':
+                    result.append('\\]')
+                    i += 1
+            else:
+                result.append(char)
+        elif char == ']':
+            in_class = False
+            result.append(char)
+        elif char in _CLASS_DOUBLE_PUNCTUATORS and \
+                pattern[i + 1:i + 2] == char:
+            return None
+        elif char == '-' and _is_class_atom(result[-1]) and \
+                result[-2] != '-' and pattern[i + 1:i + 2] not in (']', ''):
+            result.append(char)
+        elif char in _CLASS_SYNTAX_CHARACTERS:
+            result.append('\\' + char)
+        else:
+            result.append(char)
+        i += 1
+    return ''.join(result)
+
+
+def _js_pattern(regex):
+    """Return `regex` in the syntax of JavaScript, or `None` if impossible.
+    """
+    if regex.flags & ~(re.UNICODE | re.ASCII):
+        return None
+    pattern = regex.pattern.replace('(?P<', '(?<').replace(
+        r'\A', '^').replace(r'\Z', '$')
+    if _PYTHON_ONLY_REGEX.search(pattern):
+        return None
+    return _translate_regex(pattern, not regex.flags & re.ASCII)
+
+
+def get_constraints(field):
+    """Return HTML5 constraint attributes and hints of `field`.
+
+    Constraints are collected from `required` and validators of the
+    field, which are checked by the browser without submitting the form.
+
+    Returns:
+        tuple: Dictionary of the attributes, and tuples of the message and
+            the parameters to format the message.
+    """
+    attrs = {}
+    hints = []
+    lookaheads = []
+    if field.required:
+        hints.append((field.error_messages['required'], None))
+    for validator in field.validators:
+        limit_value = getattr(validator, 'limit_value', None)
+        if callable(limit_value):
+            continue
+        params = {'limit_value': limit_value}
+        if isinstance(validator, validators.MinLengthValidator):
+            attrs['minlength'] = limit_value
+            hints.append((MIN_LENGTH_HINT, params))
+        elif isinstance(validator, validators.MaxLengthValidator):
+            attrs['maxlength'] = limit_value
+            hints.append((MAX_LENGTH_HINT, params))
+        elif isinstance(validator, validators.MinValueValidator):
+            attrs['min'] = limit_value
+            hints.append((validator.message, params))
+        elif isinstance(validator, validators.MaxValueValidator):
+            attrs['max'] = limit_value
+            hints.append((validator.message, params))
+        elif isinstance(validator, validators.EmailValidator):
+            lookaheads.append(r'(?=[^@\s]+@[^@\s]+$)')
+            hints.append((validator.message, None))
+        elif isinstance(validator, validators.RegexValidator):
+            pattern = _js_pattern(validator.regex)
+            if pattern is None:
+                continue
+            if validator.inverse_match:
+                lookaheads.append(f'(?!.*(?:{pattern}))')
+            else:
+                lookaheads.append(f'(?=.*(?:{pattern}))')
+            hints.append((validator.message, None))
+    if lookaheads:
+        attrs['pattern'] = ''.join(lookaheads) + '.*'
+    return attrs, tuple(hints)
+
+
+class ConstraintFieldMixin:
+    """Mixin to fields validating the value in the browser as well.
+
+    HTML5 constraint attributes are added to the widget from the
+    validators, and their messages are displayed by the widget given
+    `valid_msg=True`. Attributes specified to the widget take precedence.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.update_constraints()
+
+    def update_constraints(self):
+        """Set constraints of the current validators to the widget."""
+        if not isinstance(self.widget, widgets.MDCTextMixin) or \
+                self.widget.is_hidden:
+            return
+        attrs, hints = get_constraints(self)
+        if self.widget.input_type != 'number':
+            attrs.pop('min', None)
+            attrs.pop('max', None)
+        for name, value in attrs.items():
+            self.widget.attrs.setdefault(name, value)
+        self.widget.constraint_hints = hints
+
+
 class LabelFieldMixin:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -59,15 +265,16 @@ class SliderFieldMixin:
             self.widget.attrs['aria-valuemax'] = self.max_value
 
 
-class CharField(LabelFieldMixin, fields.CharField):
+class CharField(ConstraintFieldMixin, LabelFieldMixin, fields.CharField):
     widget = widgets.TextInput
 
 
-class IntegerField(SliderFieldMixin, LabelFieldMixin, fields.IntegerField):
+class IntegerField(ConstraintFieldMixin, SliderFieldMixin, LabelFieldMixin,
+                   fields.IntegerField):
     widget = widgets.NumberInput
 
 
-class EmailField(LabelFieldMixin, fields.EmailField):
+class EmailField(ConstraintFieldMixin, LabelFieldMixin, fields.EmailField):
     widget = widgets.EmailInput
 
 
@@ -79,9 +286,31 @@ class BooleanField(LabelFieldMixin, fields.BooleanField):
     widget = widgets.CheckboxInput
 
 
-class FloatField(SliderFieldMixin, LabelFieldMixin, fields.FloatField):
+class FloatField(ConstraintFieldMixin, SliderFieldMixin, LabelFieldMixin,
+                 fields.FloatField):
     widget = widgets.NumberInput
 
 
-class DecimalField(SliderFieldMixin, LabelFieldMixin, fields.DecimalField):
+class DecimalField(ConstraintFieldMixin, SliderFieldMixin, LabelFieldMixin,
+                   fields.DecimalField):
     widget = widgets.NumberInput
+
+
+class AsyncModelChoiceField(LabelFieldMixin, models.ModelChoiceField):
+    """Model choice field whose choices are loaded by the browser.
+
+    The field uses :obj:`mdc.forms.widgets.AsyncSelect`, and a submitted
+    value is validated by looking up only that row.
+
+    Args:
+        queryset (:obj:`QuerySet`): Queryset of choices.
+        url (:obj:`str`, optional): URL of the endpoint providing choices.
+            See :obj:`mdc.views.AsyncChoicesView`.
+    """
+
+    widget = widgets.AsyncSelect
+
+    def __init__(self, queryset, *, url=None, **kwargs):
+        super().__init__(queryset, **kwargs)
+        if url is not None:
+            self.widget.url = url
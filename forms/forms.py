@@ -0,0 +1,269 @@
+"""Form classes caching the rendered HTML and validating single fields.
+
+See also:
+    https://docs.djangoproject.com/en/1.11/ref/forms/api/
+"""
+
+import copy
+import hashlib
+import re
+from functools import lru_cache
+from time import perf_counter
+
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.forms.boundfield import BoundField
+from django.forms.fields import FileField
+from django.forms.utils import ErrorDict
+from django.utils.encoding import force_str
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+from mdc import chunks, instrumentation
+from mdc.forms.widgets import MDCTextMixin
+
+__all__ = ('RenderCacheMixin', 'ValidatedBoundField', 'FieldValidationMixin')
+
+
+@lru_cache(maxsize=32)
+def _template_version(renderer, template_names):
+    """Return the hash of the sources of templates rendered by widgets."""
+    md5 = hashlib.md5()
+    for name in template_names:
+        template = renderer.get_template(name)
+        source = getattr(getattr(template, 'template', None), 'source', '')
+        md5.update(f'{name}\0{source}\0'.encode())
+    return md5.hexdigest()
+
+
+# Default reprs of objects, which differ by instance.
+_ADDRESS = re.compile(r' at 0x[0-9a-fA-F]+>')
+
+
+def _value_key(value):
+    """Return text of `value` for the cache key, or `None` if unstable."""
+    if isinstance(value, (list, tuple)):
+        keys = tuple(map(_value_key, value))
+        return None if None in keys else keys
+    text = force_str(value)
+    if _ADDRESS.search(text):
+        return None
+    return type(value).__name__, text
+
+
+class RenderCacheMixin:
+    """Mixin to forms caching HTML of unbound forms by Django's cache.
+
+    The HTML of `as_table()`, `as_ul()` and `as_p()` of an unbound form is
+    cached by the form class, the initial values, the active language and
+    the version of widget templates. Bound forms are always rendered
+    fresh, so errors are never cached.
+
+    Widgets of the fields in `render_cache_exclude`, such as the ones
+    having values per request, are rendered fresh on every render and put
+    into the cached HTML. If such a widget is not found as is in the HTML
+    of the form, the form is not cached.
+
+    Forms whose fields vary by instance, e.g. choices set in `__init__`,
+    should add the variation to :meth:`get_render_cache_key`. Forms whose
+    initial values have no stable text, such as objects without
+    `__str__()`, are not cached.
+
+    Components of MDC rendered by the form are cached with the HTML, and
+    recorded for :obj:`mdc.chunks.CSSChunksMiddleware` on each render.
+    """
+
+    render_cache_alias = 'default'
+    render_cache_timeout = 300
+    render_cache_exclude = ()
+
+    def get_render_cache_key(self, **kwargs):
+        """Return the cache key of HTML rendered with `kwargs`.
+
+        Returns:
+            str: Cache key, or `None` if the form cannot be cached.
+        """
+        cls = type(self)
+        template_names = tuple(sorted({
+            field.widget.template_name for field in self.fields.values()
+        }))
+        initial = tuple(
+            (name, _value_key(self[name].value())) for name in self.fields
+            if name not in self.render_cache_exclude
+        )
+        if any(value is None for name, value in initial):
+            return None
+        key = repr((
+            f'{cls.__module__}.{cls.__qualname__}', tuple(self.fields),
+            initial, self.prefix, self.auto_id, self.label_suffix,
+            get_language(), _template_version(self.renderer, template_names),
+            sorted(kwargs.items()),
+        ))
+        return 'mdc.form-html.' + hashlib.md5(key.encode()).hexdigest()
+
+    def _html_output(self, *args, **kwargs):
+        if self.is_bound or args:
+            return super()._html_output(*args, **kwargs)
+        start = perf_counter()
+        key = self.get_render_cache_key(**kwargs)
+        if key is None:
+            return super()._html_output(**kwargs)
+        cache = caches[self.render_cache_alias]
+        cached = cache.get(key)
+        excluded = [
+            (f'<!-- mdc-form-field:{name} -->', str(self[name]))
+            for name in self.render_cache_exclude if name in self.fields
+        ]
+        if cached is None:
+            with chunks.capture() as components:
+                html = super()._html_output(**kwargs)
+            cached = html
+            for placeholder, field_html in excluded:
+                cached = cached.replace(field_html, placeholder, 1)
+                if placeholder not in cached:
+                    # The field is rendered differently in the form, so
+                    # its HTML of this request would be cached.
+                    return html
+            cache.set(key, (cached, sorted(components)),
+                      self.render_cache_timeout)
+            return html
+        html, components = cached
+        chunks.record(*components)
+        for placeholder, field_html in excluded:
+            html = html.replace(placeholder, field_html, 1)
+        if instrumentation.is_enabled():
+            instrumentation.record(type(self), 'cached-form',
+                                   type(self).__name__,
+                                   perf_counter() - start, len(html))
+        return mark_safe(html)
+
+
+class ValidatedBoundField(BoundField):
+    """Bound field rendered in a wrapper validated by `autoinit.js`.
+
+    The widget is wrapped in `<div class="mdcd-field">` with the URL of
+    :obj:`mdc.views.FieldValidationView`, and rendered in the error state
+    if the field has errors: the input gets `aria-invalid` and text-input
+    widgets display the errors as the persistent hint.
+    """
+
+    def as_widget(self, widget=None, attrs=None, only_initial=False):
+        widget = widget or self.field.widget
+        url = self.form.validation_url
+        if widget.is_hidden or only_initial or url is None:
+            return super().as_widget(widget, attrs, only_initial)
+        errors = self.errors if self.form.is_bound else ()
+        error = ' '.join(errors)
+        if errors:
+            attrs = dict(attrs or {}, **{'aria-invalid': 'true'})
+            if isinstance(widget, MDCTextMixin):
+                widget = copy.copy(widget)
+                widget.hint = error
+                widget.persistent = True
+                widget.valid_msg = True
+        return format_html(
+            '<div class="mdcd-field" data-mdcd-field="{}"'
+            ' data-mdcd-validate-url="{}"{}>{}</div>',
+            self.html_name, url,
+            format_html(' data-mdcd-error="{}"', error) if errors else '',
+            super().as_widget(widget, attrs, only_initial),
+        )
+
+
+class FieldValidationMixin:
+    """Mixin to forms validating a field on blur without submitting.
+
+    Set `validation_url` to the URL of :obj:`mdc.views.FieldValidationView`
+    of the form. `autoinit.js` posts the form when a field loses focus
+    after changed, and the view responds the HTML of the field only, which
+    replaces the old one.
+
+    The field is cleaned by itself and its `clean_<name>()` method, so
+    the validation of the whole form in `clean()` isn't run. Checks across
+    fields are registered by `field_dependencies`, fields cleaned before
+    the field so that `clean_<name>()` can read them from `cleaned_data`,
+    and `field_checks`, names of methods called after the field is
+    cleaned, also when the whole form is validated::
+
+        class SignupForm(FieldValidationMixin, forms.Form):
+            validation_url = reverse_lazy('signup-validate')
+            field_dependencies = {'password2': ('password1',)}
+            field_checks = {'username': ('check_username_available',)}
+
+    Errors of the fields are rendered in the widgets, so `field.errors`
+    doesn't need to be rendered separately.
+    """
+
+    validation_url = None
+    field_dependencies = {}
+    field_checks = {}
+
+    def __getitem__(self, name):
+        if name not in self._bound_fields_cache and name in self.fields:
+            self._bound_fields_cache[name] = ValidatedBoundField(
+                self, self.fields[name], name)
+        return super().__getitem__(name)
+
+    def field_name_of(self, html_name):
+        """Return the name of the field whose HTML name is `html_name`.
+
+        Returns:
+            str: Name of the field, or `None` if no field has the name.
+        """
+        for name in self.fields:
+            if self.add_prefix(name) == html_name:
+                return name
+        return None
+
+    def _clean_field(self, name):
+        field = self.fields[name]
+        if field.disabled:
+            value = self.get_initial_for_field(field, name)
+        else:
+            value = field.widget.value_from_datadict(
+                self.data, self.files, self.add_prefix(name))
+        try:
+            if isinstance(field, FileField):
+                initial = self.get_initial_for_field(field, name)
+                value = field.clean(value, initial)
+            else:
+                value = field.clean(value)
+            self.cleaned_data[name] = value
+            if hasattr(self, f'clean_{name}'):
+                self.cleaned_data[name] = getattr(self, f'clean_{name}')()
+        except ValidationError as e:
+            self.add_error(name, e)
+
+    def _check_field(self, name):
+        if name not in self.cleaned_data:
+            return
+        for check in self.field_checks.get(name, ()):
+            try:
+                getattr(self, check)()
+            except ValidationError as e:
+                self.add_error(name, e)
+                return
+
+    def _clean_fields(self):
+        super()._clean_fields()
+        for name in self.field_checks:
+            self._check_field(name)
+
+    def validate_field(self, name):
+        """Validate the field `name` only, with its registered checks.
+
+        After the validation, `errors` has the errors of the field only.
+
+        Returns:
+            :obj:`ErrorList`: Errors of the field.
+        """
+        self._errors = ErrorDict()
+        self.cleaned_data = {}
+        for dependency in self.field_dependencies.get(name, ()):
+            self._clean_field(dependency)
+        self._clean_field(name)
+        self._check_field(name)
+        errors = self._errors.get(name)
+        self._errors = ErrorDict({name: errors} if errors else {})
+        return errors or self.error_class()
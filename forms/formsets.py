@@ -0,0 +1,98 @@
+"""Formset classes rendering forms one by one.
+
+:obj:`StreamingFormSetMixin` yields HTML of each form as it is rendered,
+instead of constructing all forms and joining their HTML, so that huge
+formsets can be sent by :obj:`StreamingHttpResponse` with the time to the
+first byte and the memory not growing with the number of forms::
+
+    ItemFormSet = formset_factory(ItemForm, formset=BaseStreamingFormSet,
+                                  extra=5000)
+    return StreamingHttpResponse(ItemFormSet().stream())
+
+See also:
+    https://docs.djangoproject.com/en/1.11/topics/forms/formsets/
+"""
+
+import copy
+from functools import lru_cache
+
+from django.forms.formsets import BaseFormSet
+from django.forms.renderers import get_default_renderer
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
+
+__all__ = ('StreamingFormSetMixin', 'BaseStreamingFormSet')
+
+
+class StreamingFormSetMixin:
+    """Mixin to formsets yielding HTML of forms one by one.
+
+    Each form is constructed, rendered and discarded in turn, unless the
+    forms are constructed already e.g. by validation. Widgets of all forms
+    share the renderer, which looks up each template only once.
+
+    `str()` of the formset returns the same HTML as :meth:`stream` at once.
+    """
+
+    renderer = None
+
+    def __str__(self):
+        return self.as_fieldsets()
+
+    def as_fieldsets(self):
+        """Return HTML of :meth:`stream` joined."""
+        return mark_safe(''.join(self.stream()))
+
+    def iter_forms(self, **kwargs):
+        """Yield forms constructed one by one.
+
+        Args:
+            **kwargs: Keyword arguments given to the form class besides
+                the ones of :meth:`get_form_kwargs`.
+        """
+        if 'forms' in self.__dict__:
+            for form in self.forms:
+                if 'renderer' in kwargs:
+                    form.renderer = kwargs['renderer']
+                yield form
+            return
+        for i in range(self.total_form_count()):
+            yield self._construct_form(
+                i, **dict(self.get_form_kwargs(i), **kwargs))
+
+    def get_stream_renderer(self):
+        """Return a copy of the renderer memoizing templates."""
+        renderer = copy.copy(self.renderer or get_default_renderer())
+        renderer.get_template = lru_cache(maxsize=None)(
+            renderer.get_template)
+        return renderer
+
+    def stream(self):
+        """Yield HTML of the management form, then of each form.
+
+        A form is rendered as a fieldset of its widgets, in which errors
+        of the form and the fields precede them.
+        """
+        yield str(self.management_form)
+        non_form_errors = self.non_form_errors() if self.is_bound else None
+        if non_form_errors:
+            yield str(non_form_errors)
+        for form in self.iter_forms(renderer=self.get_stream_renderer()):
+            yield self.render_form(form)
+
+    def render_form(self, form):
+        """Return HTML of `form` as a fieldset of its widgets."""
+        html = ['\n<fieldset class="mdcd-fieldset">']
+        if form.is_bound:
+            html.append(str(form.non_field_errors()))
+        for field in form:
+            if form.is_bound and field.errors:
+                html.append(str(field.errors))
+            html.append('\n')
+            html.append(conditional_escape(field))
+        html.append('\n</fieldset>')
+        return ''.join(html)
+
+
+class BaseStreamingFormSet(StreamingFormSetMixin, BaseFormSet):
+    """Base formset with :meth:`stream` yielding HTML of forms."""
@@ -0,0 +1,168 @@
+"""Form renderers for *Material Components for the Web*.
+
+This module defines renderers that render the widgets of MDC for Django
+with Python functions compiled from their templates in
+:obj:`mdc.forms.compiled`, instead of the template engine. The output is
+identical to the one of the templates.
+
+Set one of the renderers to `FORM_RENDERER` setting to use it::
+
+    FORM_RENDERER = 'mdc.forms.renderers.CompiledDjangoTemplates'
+
+:obj:`Jinja2` renders Jinja2 versions of the templates instead, with the
+same output.
+
+See also:
+    https://docs.djangoproject.com/en/1.11/ref/forms/renderers/
+"""
+
+import os
+
+from django.forms import renderers
+from django.utils.functional import cached_property
+from django.utils.html import strip_spaces_between_tags
+from django.utils.safestring import mark_safe
+
+from mdc.forms.compiled import COMPILED_TEMPLATES, NESTED_TEMPLATES, var
+
+__all__ = (
+    'CompiledRendererMixin', 'CompiledDjangoTemplates',
+    'CompiledTemplatesSetting', 'Jinja2',
+)
+
+
+_PACKAGED_DIRS = (
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates'),
+    str(renderers.ROOT / 'templates'),
+)
+"""Directories of the templates the functions are compiled from."""
+
+_JINJA2_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                           'jinja2')
+
+
+class CompiledRendererMixin:
+    """Mixin to renderers rendering MDC templates with compiled functions.
+
+    Templates not in `compiled_templates` are rendered by the template
+    engine as usual. So are the templates the project overrides, e.g. by
+    `mdc/forms/widgets/text.html` in its template directories, since the
+    functions are compiled from the templates of MDC for Django. Whether
+    a template is overridden is checked once per renderer, so overrides
+    added while the server runs take effect after a restart.
+    """
+
+    compiled_templates = COMPILED_TEMPLATES
+
+    @cached_property
+    def _compiled(self):
+        return {}
+
+    def get_compiled(self, template_name, nested=False):
+        """Return the function rendering `template_name`.
+
+        Args:
+            template_name (str): Name of the template.
+            nested (:obj:`bool`, optional): If `True`, templates compiled
+                only within MDC templates are looked up too.
+        Returns:
+            callable: Function compiled from the template, or `None` if
+                not compiled or overridden by the project.
+        """
+        key = (template_name, nested)
+        try:
+            return self._compiled[key]
+        except KeyError:
+            pass
+        compiled = self.compiled_templates.get(template_name)
+        if compiled is None and nested:
+            compiled = NESTED_TEMPLATES.get(template_name)
+        if compiled is not None and self._is_overridden(template_name):
+            compiled = None
+        self._compiled[key] = compiled
+        return compiled
+
+    def _is_overridden(self, template_name):
+        template = self.get_template(template_name)
+        origin = getattr(getattr(template, 'template', None), 'origin', None)
+        name = getattr(origin, 'name', None)
+        if not name:
+            return True
+        return os.path.realpath(name) not in (
+            os.path.realpath(os.path.join(directory, template_name))
+            for directory in _PACKAGED_DIRS
+        )
+
+    def render(self, template_name, context, request=None):
+        compiled = self.get_compiled(template_name)
+        if compiled is None:
+            return super().render(template_name, context, request)
+        return mark_safe(compiled(context, self._render_nested).strip())
+
+    def _render_nested(self, template_name, context):
+        compiled = self.get_compiled(template_name, nested=True)
+        if compiled is None:
+            return self.get_template(template_name).render(context)
+        return compiled(context, self._render_nested)
+
+
+class CompiledDjangoTemplates(CompiledRendererMixin,
+                              renderers.DjangoTemplates):
+    """Compiled version of :obj:`django.forms.renderers.DjangoTemplates`."""
+
+
+class CompiledTemplatesSetting(CompiledRendererMixin,
+                               renderers.TemplatesSetting):
+    """Compiled version of :obj:`django.forms.renderers.TemplatesSetting`."""
+
+
+def _spaceless(html):
+    """Return `html` rendered as `{% spaceless %}` of Django templates."""
+    from markupsafe import Markup
+
+    return Markup(strip_spaces_between_tags(html.strip()))
+
+
+class Jinja2(renderers.Jinja2):
+    """Renderer of Jinja2 templates of widgets in `jinja2` directories.
+
+    Values are escaped and localized as `{{ value }}` of Django templates,
+    and included templates keep their trailing newlines, so that the
+    output is identical to the one of Django templates. Templates of
+    Django's widgets whose Jinja2 versions differ, e.g. in whitespace, are
+    replaced by the ones in `mdc/jinja2/django`. Loaded templates are kept
+    by the name unless they are reloaded on changes, which is the case
+    when `DEBUG` is `True`.
+    """
+
+    @cached_property
+    def engine(self):
+        import jinja2
+
+        engine = self.backend({
+            'APP_DIRS': True,
+            'DIRS': [
+                _JINJA2_DIR,
+                str(renderers.ROOT / self.backend.app_dirname),
+            ],
+            'NAME': 'mdcforms',
+            'OPTIONS': {
+                'finalize': var,
+                'keep_trailing_newline': True,
+                'undefined': jinja2.Undefined,
+            },
+        })
+        engine.env.filters['spaceless'] = _spaceless
+        return engine
+
+    @cached_property
+    def _templates(self):
+        return {}
+
+    def get_template(self, template_name):
+        template = self._templates.get(template_name)
+        if template is None:
+            template = super().get_template(template_name)
+            if not self.engine.env.auto_reload:
+                self._templates[template_name] = template
+        return template
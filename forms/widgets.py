@@ -7,10 +7,13 @@ See also:
     https://docs.djangoproject.com/en/1.11/ref/forms/widgets/
 """
 
+import threading
+from time import perf_counter
+
 from django.conf import settings
-from django.contrib.auth.password_validation import (
-    get_password_validators, MinimumLengthValidator, NumericPasswordValidator,
-)
+from django.core.exceptions import ValidationError
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.forms import widgets
 from django.forms.widgets import (
     Media, MediaDefiningClass, Widget,
@@ -21,7 +24,14 @@ from django.forms.widgets import (
     CheckboxSelectMultiple, MultiWidget, SplitDateTimeWidget,
     SplitHiddenDateTimeWidget, SelectDateWidget,
 )
-from django.utils.translation import ugettext as _, ungettext
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language, ugettext as _, ungettext
+
+from mdc import chunks, instrumentation
+from mdc.forms.compiled import (
+    render_radio_option, render_select_option, var,
+)
+from mdc.utils import LRUCache
 
 __all__ = (
     'Media', 'MediaDefiningClass', 'Widget', 'TextInput', 'NumberInput',
@@ -30,7 +40,7 @@ __all__ = (
     'DateInput', 'DateTimeInput', 'TimeInput', 'CheckboxInput', 'Select',
     'NullBooleanSelect', 'SelectMultiple', 'RadioSelect',
     'CheckboxSelectMultiple', 'MultiWidget', 'SplitDateTimeWidget',
-    'SplitHiddenDateTimeWidget', 'SelectDateWidget', 'Slider',
+    'SplitHiddenDateTimeWidget', 'SelectDateWidget', 'Slider', 'AsyncSelect',
 )
 
 
@@ -38,6 +48,10 @@ class MDCWidgetMixin:
     """Mixin to widgets using *Material Component for Web*."""
 
     mdc_class = None
+    auto_init_attrs = {
+        True: 'data-mdc-auto-init',
+        'lazy': 'data-mdcd-lazy-init',
+    }
 
     def __init__(self, *args, label=None, auto_init=True, **kwargs):
         super().__init__(*args, **kwargs)
@@ -52,15 +66,43 @@ class MDCWidgetMixin:
             else:
                 context['widget']['attrs']['class'] = self.mdc_class
         context['widget']['label'] = self.label or ''
-        context['widget']['auto_init'] = self.auto_init
+        context['widget']['auto_init'] = self.auto_init_attr
         return context
 
+    @property
+    def auto_init_attr(self):
+        """Name of the attribute for instantiation of components.
+
+        `'data-mdcd-lazy-init'` if `auto_init` is `'lazy'`, `None` if it is
+        false, otherwise `'data-mdc-auto-init'`.
+        """
+        if not self.auto_init:
+            return None
+        return self.auto_init_attrs.get(self.auto_init,
+                                        self.auto_init_attrs[True])
+
+    def render(self, name, value, attrs=None, renderer=None):
+        chunks.record(chunks.component_of(self.mdc_class))
+        if not instrumentation.is_enabled():
+            return super().render(name, value, attrs, renderer)
+        start = perf_counter()
+        html = super().render(name, value, attrs, renderer)
+        instrumentation.record(type(self), 'widget', type(self).__name__,
+                               perf_counter() - start, len(html))
+        return html
+
 
 class MDCTextMixin(MDCWidgetMixin):
-    """Mixin to widgets text-input components."""
+    """Mixin to widgets text-input components.
+
+    If `valid_msg` is `True` and no hint is given, messages of the
+    constraints in `constraint_hints` are displayed as the hint. Fields of
+    `mdc.forms.fields` set them from their validators.
+    """
 
     template_name = 'mdc/forms/widgets/text.html'
     mdc_class = 'mdc-text-field__input'
+    constraint_hints = ()
 
     def __init__(self, *args, hint=None, persistent=False, valid_msg=False,
                  dense=False, **kwargs):
@@ -73,6 +115,11 @@ class MDCTextMixin(MDCWidgetMixin):
     def get_context(self, name, value, attrs):
         context = super().get_context(name, value, attrs)
         context['hint'] = self.hint or ''
+        if not context['hint'] and self.valid_msg and self.constraint_hints:
+            context['hint'] = ' '.join(dict.fromkeys(
+                message % params if params else str(message)
+                for message, params in self.constraint_hints
+            ))
         context['persistent'] = self.persistent
         context['valid_msg'] = self.valid_msg
         context['dense'] = self.dense
@@ -86,8 +133,10 @@ class TextInput(MDCTextMixin, widgets.TextInput):
         attrs (:obj:`dict`, optional): A dictionary containing HTML
             attributes to be set on the rendered widget.
         label (:obj:`str`, optional): Words displayed on a form.
-        auto_init (:obj:`bool`, optional): If spacify `True`, You can use
-            automatical instantiation of components by *mdc-auto-init*.
+        auto_init (:obj:`bool` or :obj:`str`, optional): If spacify `True`,
+            You can use automatical instantiation of components by
+            *mdc-auto-init*. Specifying `'lazy'`, components are
+            instantiated when they approach the viewport by `autoinit.js`.
             If you want to instantiate components manually, specify `False`.
             Default to `True`.
         hint (:obj:`str`, optional): Words displayed as hint.
@@ -108,8 +157,10 @@ class NumberInput(MDCTextMixin, widgets.NumberInput):
         attrs (:obj:`dict`, optional): A dictionary containing HTML
             attributes to be set on the rendered widget.
         label (:obj:`str`, optional): Words displayed on a form.
-        auto_init (:obj:`bool`, optional): If spacify `True`, You can use
-            automatical instantiation of components by *mdc-auto-init*.
+        auto_init (:obj:`bool` or :obj:`str`, optional): If spacify `True`,
+            You can use automatical instantiation of components by
+            *mdc-auto-init*. Specifying `'lazy'`, components are
+            instantiated when they approach the viewport by `autoinit.js`.
             If you want to instantiate components manually, specify `False`.
             Default to `True`.
         hint (:obj:`str`, optional): Words displayed as hint.
@@ -130,8 +181,10 @@ class EmailInput(MDCTextMixin, widgets.EmailInput):
         attrs (:obj:`dict`, optional): A dictionary containing HTML
             attributes to be set on the rendered widget.
         label (:obj:`str`, optional): Words displayed on a form.
-        auto_init (:obj:`bool`, optional): If spacify `True`, You can use
-            automatical instantiation of components by *mdc-auto-init*.
+        auto_init (:obj:`bool` or :obj:`str`, optional): If spacify `True`,
+            You can use automatical instantiation of components by
+            *mdc-auto-init*. Specifying `'lazy'`, components are
+            instantiated when they approach the viewport by `autoinit.js`.
             If you want to instantiate components manually, specify `False`.
             Default to `True`.
         hint (:obj:`str`, optional): Words displayed as hint.
@@ -152,8 +205,10 @@ class URLInput(MDCTextMixin, widgets.URLInput):
         attrs (:obj:`dict`, optional): A dictionary containing HTML
             attributes to be set on the rendered widget.
         label (:obj:`str`, optional): Words displayed on a form.
-        auto_init (:obj:`bool`, optional): If spacify `True`, You can use
-            automatical instantiation of components by *mdc-auto-init*.
+        auto_init (:obj:`bool` or :obj:`str`, optional): If spacify `True`,
+            You can use automatical instantiation of components by
+            *mdc-auto-init*. Specifying `'lazy'`, components are
+            instantiated when they approach the viewport by `autoinit.js`.
             If you want to instantiate components manually, specify `False`.
             Default to `True`.
         hint (:obj:`str`, optional): Words displayed as hint.
@@ -167,6 +222,54 @@ class URLInput(MDCTextMixin, widgets.URLInput):
     """
 
 
+_auth_validations = {}
+
+
+@receiver(setting_changed)
+def _clear_auth_validations(*, setting, **kwargs):
+    if setting in ('AUTH_PASSWORD_VALIDATORS', 'LANGUAGE_CODE',
+                   'LOCALE_PATHS'):
+        _auth_validations.clear()
+
+
+def _get_auth_validation():
+    """Return the pattern and the hint of Django's password validation.
+
+    Constraints of all validators implementable in the browser are
+    combined. The result is cached for each language until the settings
+    change.
+    """
+    language = get_language()
+    try:
+        return _auth_validations[language]
+    except KeyError:
+        pass
+    # Imported here since it imports auth and HTTP modules of Django.
+    from django.contrib.auth.password_validation import (
+        get_password_validators, MinimumLengthValidator,
+        NumericPasswordValidator,
+    )
+
+    patterns = []
+    hints = []
+    for validator in get_password_validators(settings.AUTH_PASSWORD_VALIDATORS):  # NOQA
+        if isinstance(validator, MinimumLengthValidator):
+            patterns.append(r'.{%d}' % validator.min_length)
+            hints.append(ungettext(
+                "Your password must contain at least %(min_length)d character.",   # NOQA
+                "Your password must contain at least %(min_length)d characters.",  # NOQA
+                validator.min_length
+            ) % {'min_length': validator.min_length})
+        elif isinstance(validator, NumericPasswordValidator):
+            patterns.append(r'.*[^\d]')
+            hints.append(_("Your password can't be entirely numeric."))
+    pattern = None
+    if patterns:
+        pattern = ''.join(f'(?={pattern})' for pattern in patterns) + '.*'
+    validation = _auth_validations[language] = (pattern, ' '.join(hints))
+    return validation
+
+
 class PasswordInput(MDCTextMixin, widgets.PasswordInput):
     """Password input widget compatible with Material Components for the Web.
 
@@ -174,8 +277,10 @@ class PasswordInput(MDCTextMixin, widgets.PasswordInput):
         attrs (:obj:`dict`, optional): A dictionary containing HTML
             attributes to be set on the rendered widget.
         label (:obj:`str`, optional): Words displayed on a form.
-        auto_init (:obj:`bool`, optional): If spacify `True`, You can use
-            automatical instantiation of components by *mdc-auto-init*.
+        auto_init (:obj:`bool` or :obj:`str`, optional): If spacify `True`,
+            You can use automatical instantiation of components by
+            *mdc-auto-init*. Specifying `'lazy'`, components are
+            instantiated when they approach the viewport by `autoinit.js`.
             If you want to instantiate components manually, specify `False`.
             Default to `True`.
         hint (:obj:`str`, optional): Words displayed as hint.
@@ -198,27 +303,167 @@ class PasswordInput(MDCTextMixin, widgets.PasswordInput):
     def get_context(self, name, value, attrs):
         context = super().get_context(name, value, attrs)
         if (self.auth_validate):
-            for validator in get_password_validators(settings.AUTH_PASSWORD_VALIDATORS):  # NOQA
-                if isinstance(validator, MinimumLengthValidator):
-                    if 'pattern' not in context['widget']['attrs']:
-                        context['widget']['attrs']['pattern'] = r'.{%d}.*' % validator.min_length  # NOQA
-                    if not context['hint']:
-                        context['hint'] = ungettext(
-                            "Your password must contain at least %(min_length)d character.",   # NOQA
-                            "Your password must contain at least %(min_length)d characters.",  # NOQA
-                            validator.min_length
-                        ) % {'min_length': validator.min_length}
-                    break
-                if isinstance(validator, NumericPasswordValidator):
-                    if 'pattern' not in context['widget']['attrs']:
-                        context['widget']['attrs']['pattern'] = r'.*[^\d].*'
-                    if not context['hint']:
-                        context['hint'] = _("Your password can't be entirely numeric.")  # NOQA
-                    break
+            pattern, hint = _get_auth_validation()
+            if pattern and 'pattern' not in context['widget']['attrs']:
+                context['widget']['attrs']['pattern'] = pattern
+            if not self.hint:
+                context['hint'] = ' '.join(filter(None, (
+                    hint, context['hint'])))
         return context
 
 
-class Select(MDCWidgetMixin, widgets.Select):
+_compiling = threading.local()
+
+
+def _choices_key(choices):
+    """Return the key of `choices` in the cache of compiled options.
+
+    Values and labels are keyed with their types, since `1` and `True`, or
+    `'1.5'` and `1.5`, are equal but render differently.
+    """
+    key = []
+    for value, label in choices:
+        if isinstance(label, (list, tuple)):
+            label = _choices_key(label)
+        else:
+            label = (type(label), str(label))
+        key.append(((type(value), str(value)), label))
+    return tuple(key)
+
+
+class CompiledOptionsMixin:
+    """Mixin to choice widgets rendering options without templates.
+
+    If `compile_options` is `True`, options are rendered in one pass by
+    functions compiled from the option template, and passed to the
+    template as `widget.options` instead of `widget.optgroups`. Options
+    of static choices are cached without selection, and only selected
+    options are rendered on each render. `optgroups()`, and so subwidgets
+    of bound fields, give the options as usual.
+    """
+
+    compiled_option_templates = {
+        'django/forms/widgets/select_option.html': render_select_option,
+        'mdc/forms/widgets/radio_option.html': render_radio_option,
+    }
+    option_prefix = '\n'
+    optgroup_format = None
+    options_cache = LRUCache(maxsize=32)
+
+    def __init__(self, *args, compile_options=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.compile_options = compile_options
+
+    def _uses_compiled_options(self):
+        return self.compile_options and \
+            self.option_template_name in self.compiled_option_templates
+
+    def get_context(self, name, value, attrs):
+        if not self._uses_compiled_options():
+            context = super().get_context(name, value, attrs)
+            context['widget']['options'] = None
+            return context
+        # Options are rendered below instead of `widget.optgroups`.
+        _compiling.widget = self
+        try:
+            context = super().get_context(name, value, attrs)
+        finally:
+            _compiling.widget = None
+        context['widget']['options'] = self.render_options(
+            name, context['widget']['value'], attrs)
+        return context
+
+    def optgroups(self, name, value, attrs=None):
+        if getattr(_compiling, 'widget', None) is self:
+            return []
+        return super().optgroups(name, value, attrs)
+
+    def render_options(self, name, value, attrs=None):
+        """Return HTML of all options with `value` selected."""
+        html, positions = self._get_compiled_options(name, attrs)
+        selected = sorted(
+            position
+            for subvalue in set(value)
+            for position in positions.get(subvalue, ())
+        )
+        if not self.allow_multiple_selected:
+            del selected[1:]
+        results = []
+        end = 0
+        for start, next_end, (subvalue, sublabel, index, subindex) in selected:
+            results.append(html[end:start])
+            results.append(self._render_option(self.create_option(
+                name, subvalue, sublabel, True, index,
+                subindex=subindex, attrs=attrs)))
+            end = next_end
+        results.append(html[end:])
+        return mark_safe(''.join(results))
+
+    def _render_option(self, option):
+        return self.compiled_option_templates[self.option_template_name](
+            {'widget': option, 'auto_init': self.auto_init_attr}, None)
+
+    def _get_compiled_options(self, name, attrs):
+        if not isinstance(self.choices, (list, tuple)):
+            return self._compile_options(name, attrs)
+        try:
+            key = (
+                type(self), self.option_template_name, name,
+                get_language(), self.auto_init_attr,
+                tuple(self.attrs.items()), tuple((attrs or {}).items()),
+                _choices_key(self.choices),
+            )
+            hash(key)
+        except TypeError:
+            return self._compile_options(name, attrs)
+        cached = self.options_cache.get(key)
+        if cached is None:
+            cached = self._compile_options(name, attrs)
+            self.options_cache.set(key, cached)
+        return cached
+
+    def _compile_options(self, name, attrs):
+        """Return HTML of unselected options and their positions by value.
+
+        This follows :meth:`django.forms.widgets.ChoiceWidget.optgroups`.
+        """
+        parts = []
+        positions = {}
+        offset = 0
+        for index, (option_value, option_label) in enumerate(self.choices):
+            if option_value is None:
+                option_value = ''
+            if isinstance(option_label, (list, tuple)):
+                group_name = option_value
+                subindex = 0
+                choices = option_label
+            else:
+                group_name = None
+                subindex = None
+                choices = [(option_value, option_label)]
+            if group_name and self.optgroup_format:
+                parts.append(self.optgroup_format[0] % var(group_name))
+                offset += len(parts[-1])
+            for subvalue, sublabel in choices:
+                option = self._render_option(self.create_option(
+                    name, subvalue, sublabel, False, index,
+                    subindex=subindex, attrs=attrs))
+                offset += len(self.option_prefix)
+                positions.setdefault(str(subvalue), []).append(
+                    (offset, offset + len(option),
+                     (subvalue, sublabel, index, subindex)))
+                parts.append(self.option_prefix)
+                parts.append(option)
+                offset += len(option)
+                if subindex is not None:
+                    subindex += 1
+            if group_name and self.optgroup_format:
+                parts.append(self.optgroup_format[1])
+                offset += len(parts[-1])
+        return ''.join(parts), positions
+
+
+class Select(CompiledOptionsMixin, MDCWidgetMixin, widgets.Select):
     """Select widget compatible with Material Components for the Web.
 
     args:
@@ -227,15 +472,109 @@ class Select(MDCWidgetMixin, widgets.Select):
         choices (:obj:`iter`, optional): If this argument is specified,
             the widget override choices that is specified by :obj:`Field`.
         label (:obj:`str`, optional): Words displayed on a form.
-        auto_init (:obj:`bool`, optional): If spacify `True`, You can use
-            automatical instantiation of components by *mdc-auto-init*.
+        auto_init (:obj:`bool` or :obj:`str`, optional): If spacify `True`,
+            You can use automatical instantiation of components by
+            *mdc-auto-init*. Specifying `'lazy'`, components are
+            instantiated when they approach the viewport by `autoinit.js`.
             If you want to instantiate components manually, specify `False`.
             Default to `True`.
+        compile_options (:obj:`bool`, optional): If `True` is specified,
+            options are rendered without templates and cached. Use it for
+            a large number of choices. Default to `False`.
     """
 
     template_name = 'mdc/forms/widgets/select.html'
     option_template_name = 'django/forms/widgets/select_option.html'
     mdc_class = 'mdc-select__native-control'
+    option_prefix = '\n  '
+    optgroup_format = ('\n  <optgroup label="%s">', '\n  </optgroup>')
+
+
+class AsyncSelect(Select):
+    """Select widget loading choices from a JSON endpoint.
+
+    Only the selected choices are rendered, and the other choices are
+    fetched from `url` by `autoinit.js` in pages. The endpoint should
+    respond like :obj:`mdc.views.AsyncChoicesView`.
+
+    args:
+        attrs (:obj:`dict`, optional): A dictionary containing HTML
+            attributes to be set on the rendered widget.
+        url (:obj:`str`, optional): URL of the endpoint providing choices.
+            It can be lazy, e.g. `reverse_lazy('choices')`. If omitted,
+            only the selected choices are rendered.
+        label (:obj:`str`, optional): Words displayed on a form.
+        auto_init (:obj:`bool` or :obj:`str`, optional): If spacify `True`,
+            You can use automatical instantiation of components by
+            *mdc-auto-init*. Specifying `'lazy'`, components are
+            instantiated when they approach the viewport by `autoinit.js`.
+            If you want to instantiate components manually, specify `False`.
+            Default to `True`.
+    """
+
+    def __init__(self, attrs=None, url=None, **kwargs):
+        super().__init__(attrs, **kwargs)
+        self.url = url
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        if self.url is not None:
+            context['widget']['attrs']['data-mdcd-async-url'] = str(self.url)
+        return context
+
+    def _uses_compiled_options(self):
+        return False
+
+    def use_required_attribute(self, initial):
+        return widgets.Widget.use_required_attribute(self, initial)
+
+    def optgroups(self, name, value, attrs=None):
+        choices = self.selected_choices(value)
+        if not choices or not self.is_required:
+            choices.insert(0, ('', self._empty_label()))
+        return [
+            (None, [self.create_option(name, option_value, option_label,
+                                       str(option_value) in value, index,
+                                       attrs=attrs)], index)
+            for index, (option_value, option_label) in enumerate(choices)
+        ]
+
+    def selected_choices(self, value):
+        """Return a list of choices of `value` without loading others."""
+        value = [v for v in value if v != '']
+        if not value:
+            return []
+        iterator = self.choices
+        if hasattr(iterator, 'queryset') and hasattr(iterator, 'choice'):
+            opts = iterator.queryset.model._meta
+            key = iterator.field.to_field_name or 'pk'
+            model_field = opts.pk if key == 'pk' else opts.get_field(key)
+            # Invalid values, e.g. of tampered data, select nothing as
+            # `ModelChoiceField.to_python()` rejects them.
+            values = []
+            for v in value:
+                try:
+                    values.append(model_field.to_python(v))
+                except (ValueError, TypeError, ValidationError):
+                    pass
+            if not values:
+                return []
+            queryset = iterator.queryset.filter(**{f'{key}__in': values})
+            return [iterator.choice(obj) for obj in queryset]
+        selected = []
+        for option_value, option_label in iterator:
+            if isinstance(option_label, (list, tuple)):
+                selected.extend(
+                    choice for choice in option_label
+                    if str(choice[0]) in value
+                )
+            elif str(option_value) in value:
+                selected.append((option_value, option_label))
+        return selected
+
+    def _empty_label(self):
+        field = getattr(self.choices, 'field', None)
+        return getattr(field, 'empty_label', None) or ''
 
 
 class CheckboxInput(MDCWidgetMixin, widgets.CheckboxInput):
@@ -245,8 +584,10 @@ class CheckboxInput(MDCWidgetMixin, widgets.CheckboxInput):
         attrs (:obj:`dict`, optional): A dictionary containing HTML
             attributes to be set on the rendered widget.
         label (:obj:`str`, optional): Words displayed on a form.
-        auto_init (:obj:`bool`, optional): If spacify `True`, You can use
-            automatical instantiation of components by *mdc-auto-init*.
+        auto_init (:obj:`bool` or :obj:`str`, optional): If spacify `True`,
+            You can use automatical instantiation of components by
+            *mdc-auto-init*. Specifying `'lazy'`, components are
+            instantiated when they approach the viewport by `autoinit.js`.
             If you want to instantiate components manually, specify `False`.
             Default to `True`.
     """
@@ -255,7 +596,7 @@ class CheckboxInput(MDCWidgetMixin, widgets.CheckboxInput):
     mdc_class = 'mdc-checkbox__native-control'
 
 
-class RadioSelect(MDCWidgetMixin, widgets.RadioSelect):
+class RadioSelect(CompiledOptionsMixin, MDCWidgetMixin, widgets.RadioSelect):
     """Radio button widget compatible with Material Components for the Web.
 
     args:
@@ -264,26 +605,29 @@ class RadioSelect(MDCWidgetMixin, widgets.RadioSelect):
         choices (:obj:`iter`, optional): If this argument is specified,
             the widget override choices that is specified by :obj:`Field`.
         label (:obj:`str`, optional): Words displayed on a form.
-        auto_init (:obj:`bool`, optional): If spacify `True`, You can use
-            automatical instantiation of components by *mdc-auto-init*.
+        auto_init (:obj:`bool` or :obj:`str`, optional): If spacify `True`,
+            You can use automatical instantiation of components by
+            *mdc-auto-init*. Specifying `'lazy'`, components are
+            instantiated when they approach the viewport by `autoinit.js`.
             If you want to instantiate components manually, specify `False`.
             Default to `True`.
+        compile_options (:obj:`bool`, optional): If `True` is specified,
+            options are rendered without templates and cached. Use it for
+            a large number of choices. Default to `False`.
     """
 
     template_name = 'mdc/forms/widgets/radio.html'
     option_template_name = 'mdc/forms/widgets/radio_option.html'
     mdc_class = 'mdc-radio__native-control'
 
-    def get_context(self, name, value, attrs):
-        context = super().get_context(name, value, attrs)
+    def create_option(self, *args, **kwargs):
+        option = super().create_option(*args, **kwargs)
         if self.mdc_class:
-            for optgroup in context['widget']['optgroups']:
-                for option in optgroup[1]:
-                    if 'class' in option['attrs']:
-                        option['attrs']['class'] += ' ' + self.mdc_class
-                    else:
-                        option['attrs']['class'] = self.mdc_class
-        return context
+            if 'class' in option['attrs']:
+                option['attrs']['class'] += ' ' + self.mdc_class
+            else:
+                option['attrs']['class'] = self.mdc_class
+        return option
 
 
 class Textarea(MDCWidgetMixin, widgets.Textarea):
@@ -293,8 +637,10 @@ class Textarea(MDCWidgetMixin, widgets.Textarea):
         attrs (:obj:`dict`, optional): A dictionary containing HTML
             attributes to be set on the rendered widget.
         label (:obj:`str`, optional): Words displayed on a form.
-        auto_init (:obj:`bool`, optional): If spacify `True`, You can use
-            automatical instantiation of components by *mdc-auto-init*.
+        auto_init (:obj:`bool` or :obj:`str`, optional): If spacify `True`,
+            You can use automatical instantiation of components by
+            *mdc-auto-init*. Specifying `'lazy'`, components are
+            instantiated when they approach the viewport by `autoinit.js`.
             If you want to instantiate components manually, specify `False`.
             Default to `True`.
     """
@@ -310,8 +656,10 @@ class Slider(MDCWidgetMixin, Widget):
         attrs (:obj:`dict`, optional): A dictionary containing HTML
             attributes to be set on the rendered widget.
         label (:obj:`str`, optional): Words displayed on a form.
-        auto_init (:obj:`bool`, optional): If spacify `True`, You can use
-            automatical instantiation of components by *mdc-auto-init*.
+        auto_init (:obj:`bool` or :obj:`str`, optional): If spacify `True`,
+            You can use automatical instantiation of components by
+            *mdc-auto-init*. Specifying `'lazy'`, components are
+            instantiated when they approach the viewport by `autoinit.js`.
             If you want to instantiate components manually, specify `False`.
             Default to `True`.
         hint (:obj:`str`, optional): Words displayed as hint.
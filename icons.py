@@ -0,0 +1,111 @@
+"""Icons of Material Design rendered by tags of MDC for Django.
+
+By default, icons are ligatures of the Material Icons font, which the
+page loads by itself. Set `MDC_ICONS = 'sprite'` to render them as
+references to an inline SVG sprite instead, and put `mdc_icon_sprite` tag
+of `mdcimport` at the beginning of `<body>`::
+
+    {% load mdcimport %}
+    <body>
+      {% mdc_icon_sprite %}
+
+The sprite contains the icons of :obj:`ICONS`, or the ones built for the
+project by `build_mdc_assets` command, which collects icons used by the
+templates of the project.
+"""
+
+import json
+from functools import lru_cache
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+
+__all__ = (
+    'ICONS', 'MANIFEST', 'uses_sprite', 'get_icons', 'icon', 'sprite',
+)
+
+ICONS = {
+    'chevron_left': ('0 0 24 24', '<path d="M15.41 7.41L14 6l-6 6 6 6'
+                                  ' 1.41-1.41L10.83 12z"/>'),
+    'chevron_right': ('0 0 24 24', '<path d="M10 6L8.59 7.41 13.17 12l-4.58'
+                                   ' 4.59L10 18l6-6z"/>'),
+    'more_horiz': ('0 0 24 24', '<path d="M6 10c-1.1 0-2 .9-2 2s.9 2 2 2 2-.9'
+                                ' 2-2-.9-2-2-2zm12 0c-1.1 0-2 .9-2 2s.9 2 2 2'
+                                ' 2-.9 2-2-.9-2-2-2zm-6 0c-1.1 0-2 .9-2 2s.9 2'
+                                ' 2 2 2-.9 2-2-.9-2-2-2z"/>'),
+}
+"""Tuples of the view box and the SVG content of icons used by the tags,
+keyed by the name of the ligature.
+"""
+
+MANIFEST = 'mdc/icons/manifest.json'
+
+_uses_sprite = None
+
+
+@receiver(setting_changed)
+def _clear_icons(*, setting, **kwargs):
+    global _uses_sprite
+    if setting == 'MDC_ICONS':
+        _uses_sprite = None
+    elif setting in ('STATICFILES_DIRS', 'STATICFILES_FINDERS'):
+        get_icons.cache_clear()
+
+
+def uses_sprite():
+    """Return whether `MDC_ICONS` setting is `'sprite'`."""
+    global _uses_sprite
+    if _uses_sprite is None:
+        _uses_sprite = getattr(settings, 'MDC_ICONS', 'font') == 'sprite'
+    return _uses_sprite
+
+
+@lru_cache(maxsize=None)
+def get_icons():
+    """Return icons of the sprite.
+
+    Returns:
+        dict: Tuples of the view box and the SVG content keyed by the name,
+            which are the ones built by `build_mdc_assets` command if any,
+            otherwise :obj:`ICONS`.
+    """
+    path = finders.find(MANIFEST)
+    if not path:
+        return ICONS
+    with open(path) as f:
+        return {
+            name: (icon['viewBox'], icon['content'])
+            for name, icon in json.load(f)['icons'].items()
+        }
+
+
+def icon(name):
+    """Return HTML of the icon named `name`."""
+    return _icon(name, uses_sprite())
+
+
+@lru_cache(maxsize=256)
+def _icon(name, sprite):
+    if sprite:
+        return format_html(
+            '<svg class="mdcd-icon" aria-hidden="true">'
+            '<use href="#mdcd-icon-{}"></use></svg>', name)
+    return format_html('<i class="material-icons">{}</i>', name)
+
+
+def sprite():
+    """Return HTML of the hidden SVG sprite of icons."""
+    return format_html(
+        '<svg xmlns="http://www.w3.org/2000/svg" style="display: none">'
+        '{}</svg>',
+        format_html_join(
+            '', '<symbol id="mdcd-icon-{}" viewBox="{}">{}</symbol>', (
+                (name, view_box, mark_safe(content))
+                for name, (view_box, content) in sorted(get_icons().items())
+            ),
+        ),
+    )
@@ -0,0 +1,162 @@
+"""Instrumentation of rendering by MDC for Django.
+
+Set `MDC_INSTRUMENTATION = True` to measure renders of MDC widgets,
+pagination tags and forms reused from the cache of `RenderCacheMixin`.
+Each render is counted per widget class, tag or form class with the
+elapsed time and the output size, sent as :obj:`rendered` signal and
+logged to `mdc.instrumentation` logger at DEBUG level with
+`mdc_category`, `mdc_name`, `mdc_elapsed` and `mdc_size` attributes. Add
+:obj:`ServerTimingMiddleware` to `MIDDLEWARE` to get the summary of a
+request in `Server-Timing` header.
+
+When disabled, only a flag is checked on each render.
+"""
+
+import logging
+import threading
+from functools import wraps
+from time import perf_counter
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import Signal, receiver
+
+__all__ = (
+    'rendered', 'is_enabled', 'record', 'instrument', 'get_stats',
+    'reset_stats', 'ServerTimingMiddleware',
+)
+
+logger = logging.getLogger(__name__)
+
+rendered = Signal()
+"""Signal sent on each render with `category`, `name`, `elapsed` and `size`.
+"""
+
+_enabled = None
+_lock = threading.Lock()
+_stats = {}
+_local = threading.local()
+
+
+@receiver(setting_changed)
+def _clear_enabled(*, setting, **kwargs):
+    global _enabled
+    if setting == 'MDC_INSTRUMENTATION':
+        _enabled = None
+
+
+def is_enabled():
+    """Return whether `MDC_INSTRUMENTATION` setting is `True`."""
+    global _enabled
+    if _enabled is None:
+        _enabled = bool(getattr(settings, 'MDC_INSTRUMENTATION', False))
+    return _enabled
+
+
+def _add(stats, key, elapsed, size):
+    counter = stats.get(key)
+    if counter is None:
+        stats[key] = {'count': 1, 'time': elapsed, 'bytes': size}
+    else:
+        counter['count'] += 1
+        counter['time'] += elapsed
+        counter['bytes'] += size
+
+
+def record(sender, category, name, elapsed, size):
+    """Record a render.
+
+    Args:
+        sender: Sender of :obj:`rendered` signal.
+        category (str): Category of the render, e.g. `'widget'`.
+        name (str): Name of the widget class or the tag.
+        elapsed (float): Seconds taken by the render.
+        size (int): Length of the output.
+    """
+    key = (category, name)
+    with _lock:
+        _add(_stats, key, elapsed, size)
+    request_stats = getattr(_local, 'stats', None)
+    if request_stats is not None:
+        _add(request_stats, key, elapsed, size)
+    rendered.send(sender=sender, category=category, name=name,
+                  elapsed=elapsed, size=size)
+    logger.debug('%s %s rendered in %.3fms (%d bytes)',
+                 category, name, elapsed * 1000, size,
+                 extra={'mdc_category': category, 'mdc_name': name,
+                        'mdc_elapsed': elapsed, 'mdc_size': size})
+
+
+def instrument(category):
+    """Decorator recording renders of a function returning HTML.
+
+    Nested calls of instrumented functions of the same category are not
+    recorded, so that the time is not counted twice.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not is_enabled():
+                return func(*args, **kwargs)
+            depth = getattr(_local, category, 0)
+            setattr(_local, category, depth + 1)
+            start = perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                setattr(_local, category, depth)
+            if not depth:
+                record(func, category, func.__name__,
+                       perf_counter() - start, len(result))
+            return result
+        return wrapper
+    return decorator
+
+
+def get_stats():
+    """Return counters of renders keyed by the category and the name.
+
+    Returns:
+        dict: Dictionaries with `count`, `time` and `bytes` keyed by
+            tuples of the category and the name.
+    """
+    with _lock:
+        return {key: dict(counter) for key, counter in _stats.items()}
+
+
+def reset_stats():
+    """Reset counters of renders."""
+    with _lock:
+        _stats.clear()
+
+
+class ServerTimingMiddleware:
+    """Middleware adding renders in the request to `Server-Timing` header.
+
+    Each widget class and tag is reported as a metric like
+    `mdc-widget-TextInput;dur=1.234;desc="12 renders, 3456 bytes"`.
+    Renders after the response is returned, such as the ones of
+    streaming responses, are not included.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not is_enabled():
+            return self.get_response(request)
+        _local.stats = {}
+        try:
+            response = self.get_response(request)
+        finally:
+            stats, _local.stats = _local.stats, None
+        if stats:
+            metrics = [
+                f'mdc-{category}-{name};dur={counter["time"] * 1000:.3f};'
+                f'desc="{counter["count"]} renders, {counter["bytes"]} bytes"'
+                for (category, name), counter in sorted(stats.items())
+            ]
+            if response.has_header('Server-Timing'):
+                metrics.insert(0, response['Server-Timing'])
+            response['Server-Timing'] = ', '.join(metrics)
+        return response
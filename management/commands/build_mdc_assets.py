@@ -0,0 +1,216 @@
+import glob
+import hashlib
+import io
+import json
+import os
+import re
+from xml.etree import ElementTree
+
+from django.core.management.base import BaseCommand, CommandError
+from django.template import engines
+
+from mdc import icons
+
+OUTPUT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    'static', 'mdc',
+)
+# Japanese glyphs overriding Roboto, as `fonts.scss` does.
+UNICODE_RANGES = 'U+3040-30FF, U+31F0-33FF, U+4DF0-9FD5'
+ICON_PATTERNS = (
+    re.compile(r'class="[^"]*\bmaterial-icons\b[^"]*"[^>]*>\s*(\w+)\s*<'),
+    re.compile(r'''\bmdc_icon\s+['"](\w+)['"]'''),
+)
+# Layouts of SVG files of `@material-icons/svg` and `material-design-icons`
+# packages, and a directory of SVG files named by icons.
+SVG_PATTERNS = (
+    '{name}.svg',
+    'svg/{name}/baseline.svg',
+    '*/svg/production/ic_{name}_24px.svg',
+)
+
+
+def parse_ranges(ranges):
+    """Return code points of CSS `unicode-range` like `'U+3040-30FF'`."""
+    codepoints = set()
+    for item in ranges.split(','):
+        start, _, end = item.strip().upper().lstrip('U+').partition('-')
+        try:
+            codepoints.update(range(int(start, 16), int(end or start, 16) + 1))
+        except ValueError:
+            raise CommandError(f'Invalid unicode range: {item.strip()}')
+    return codepoints
+
+
+def format_ranges(codepoints):
+    """Return CSS `unicode-range` of `codepoints`."""
+    ranges = []
+    for codepoint in sorted(codepoints):
+        if ranges and ranges[-1][1] == codepoint - 1:
+            ranges[-1][1] = codepoint
+        else:
+            ranges.append([codepoint, codepoint])
+    return ', '.join(
+        f'U+{start:X}' if start == end else f'U+{start:X}-{end:X}'
+        for start, end in ranges
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        'Build icons and fonts served by MDC for Django without third-party '
+        'requests: an SVG sprite of the icons used by the tags and the '
+        'templates of the project, and WOFF2 fonts subset to the characters '
+        'used, for mdc_icon_sprite and mdc_fonts tags.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--icons-source', metavar='DIR',
+            help='Directory of SVG files of Material Icons, e.g.'
+                 ' node_modules/@material-icons/svg, for icons used by'
+                 ' templates besides the ones of the tags.',
+        )
+        parser.add_argument(
+            '--font', action='append', default=[], metavar='WEIGHT=PATH',
+            help='Font file to subset for the weight, e.g.'
+                 ' 400=NotoSansJP-Regular.otf. Requires fontTools and'
+                 ' brotli.',
+        )
+        parser.add_argument(
+            '--family', default='Roboto',
+            help='Font family of the fonts. Default to Roboto.',
+        )
+        parser.add_argument(
+            '--unicodes', default=UNICODE_RANGES,
+            help=f'Unicode ranges of the fonts. Default to {UNICODE_RANGES}.',
+        )
+        parser.add_argument(
+            '--text', action='append', default=[], metavar='PATH',
+            help='File of text displayed by the project, e.g. a .po file.'
+                 ' If given, fonts keep characters in the files only.',
+        )
+        parser.add_argument(
+            '--output', default=OUTPUT_DIR,
+            help='Directory of `mdc` static files to output to.',
+        )
+
+    def handle(self, *args, icons_source, font, family, unicodes, text,
+               output, **options):
+        self.build_icons(icons_source, os.path.join(output, 'icons'))
+        if font:
+            self.build_fonts(font, family, unicodes, text,
+                             os.path.join(output, 'fonts'))
+
+    def find_icon_names(self):
+        """Return names of icons used by the tags and the templates."""
+        names = set(icons.ICONS)
+        for engine in engines.all():
+            for directory in engine.template_dirs:
+                for root, dirs, files in os.walk(directory):
+                    for name in files:
+                        path = os.path.join(root, name)
+                        try:
+                            with open(path, encoding='utf-8') as f:
+                                source = f.read()
+                        except (OSError, UnicodeDecodeError):
+                            continue
+                        for pattern in ICON_PATTERNS:
+                            names.update(pattern.findall(source))
+        return sorted(names)
+
+    def read_svg(self, source, name):
+        """Return the view box and the content of the SVG of an icon."""
+        for pattern in SVG_PATTERNS:
+            for path in glob.glob(os.path.join(
+                    source, pattern.format(name=name))):
+                try:
+                    root = ElementTree.parse(path).getroot()
+                except (OSError, ElementTree.ParseError) as e:
+                    raise CommandError(f'{path}: {e}')
+                content = []
+                for child in root:
+                    if child.get('fill') == 'none':
+                        continue
+                    for element in child.iter():
+                        element.tag = element.tag.rpartition('}')[2]
+                    content.append(ElementTree.tostring(
+                        child, encoding='unicode').strip())
+                return root.get('viewBox', '0 0 24 24'), ''.join(content)
+        return None
+
+    def build_icons(self, source, output):
+        built = {}
+        for name in self.find_icon_names():
+            icon = icons.ICONS.get(name)
+            if icon is None and source:
+                icon = self.read_svg(source, name)
+            if icon is None:
+                self.stderr.write(
+                    f'Icon {name} is not found. Specify --icons-source.')
+                continue
+            built[name] = {'viewBox': icon[0], 'content': icon[1]}
+        os.makedirs(output, exist_ok=True)
+        with open(os.path.join(output, 'manifest.json'), 'w') as f:
+            json.dump({'icons': built}, f, indent=2, sort_keys=True)
+        self.stdout.write(self.style.SUCCESS(
+            f'Built {len(built)} icons into {output}'))
+
+    def build_fonts(self, fonts, family, unicodes, texts, output):
+        try:
+            from fontTools import subset
+        except ImportError:
+            raise CommandError(
+                'Subsetting fonts requires fontTools and brotli:'
+                ' pip install fonttools brotli')
+        codepoints = parse_ranges(unicodes)
+        if texts:
+            characters = set()
+            for path in texts:
+                try:
+                    with open(path, encoding='utf-8') as f:
+                        characters.update(map(ord, f.read()))
+                except (OSError, UnicodeDecodeError) as e:
+                    raise CommandError(e)
+            codepoints &= characters
+        os.makedirs(output, exist_ok=True)
+        for name in os.listdir(output):
+            if name.endswith('.woff2'):
+                os.remove(os.path.join(output, name))
+        manifest = []
+        for item in fonts:
+            weight, _, path = item.partition('=')
+            if not weight.isdigit() or not path:
+                raise CommandError(f'Invalid --font: {item}')
+            options = subset.Options()
+            options.flavor = 'woff2'
+            try:
+                font = subset.load_font(path, options)
+            except Exception as e:
+                raise CommandError(f'{path}: {e}')
+            subsetter = subset.Subsetter(options)
+            subsetter.populate(unicodes=codepoints)
+            subsetter.subset(font)
+            kept = set(font.getBestCmap() or ())
+            buffer = io.BytesIO()
+            subset.save_font(font, buffer, options)
+            content = buffer.getvalue()
+            stem = os.path.splitext(os.path.basename(path))[0]
+            hashed_name = \
+                f'{stem}.{hashlib.md5(content).hexdigest()[:12]}.woff2'
+            with open(os.path.join(output, hashed_name), 'wb') as f:
+                f.write(content)
+            manifest.append({
+                'family': family,
+                'weight': int(weight),
+                'style': 'normal',
+                'path': f'mdc/fonts/{hashed_name}',
+                'unicodeRange': format_ranges(kept),
+            })
+            self.stdout.write(
+                f'Subset {path} into {hashed_name}'
+                f' ({len(kept)} characters, {len(content):,} bytes)')
+        with open(os.path.join(output, 'manifest.json'), 'w') as f:
+            json.dump({'fonts': manifest}, f, indent=2, sort_keys=True)
+        self.stdout.write(self.style.SUCCESS(
+            f'Built {len(manifest)} fonts into {output}'))
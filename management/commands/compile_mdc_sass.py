@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from sass_processor.processor import SassProcessor
+
+from mdc import chunks
+from mdc.templatetags.mdcimport import MdcCssNode
+
+
+class Command(BaseCommand):
+    help = (
+        'Compile Sass of Material Components for the Web, complement.scss '
+        'and the themes in MDC_SASS_THEMES setting ahead of time, so that '
+        'templates never compile them.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'paths', nargs='*',
+            help='Paths of additional Sass files to compile.',
+        )
+        parser.add_argument(
+            '--chunks', action='store_true',
+            help='Compile CSS chunks of each component for mdc_css_chunks'
+                 ' tag as well.',
+        )
+
+    def handle(self, *args, paths, **options):
+        processor = SassProcessor()
+        processor.processor_enabled = True
+        targets = [MdcCssNode.SASS_PATH, 'mdc/complement.scss']
+        targets.extend(getattr(settings, 'MDC_SASS_THEMES', {}).values())
+        if options['chunks']:
+            targets.extend(map(chunks.chunk_path, chunks.CHUNKS))
+        targets.extend(paths)
+        for path in dict.fromkeys(targets):
+            try:
+                css_path = processor(path)
+            except FileNotFoundError as e:
+                raise CommandError(e)
+            self.stdout.write(f'Compiled {path} into {css_path}')
@@ -0,0 +1,98 @@
+import base64
+import hashlib
+import json
+import os
+import tarfile
+
+from django.core.management.base import BaseCommand, CommandError
+
+from mdc import SUPPORTED_MDC_VERSION
+
+PACKAGE = 'material-components-web'
+OUTPUT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    'static', 'mdc', 'vendor',
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Vendor JavaScript and CSS of Material Components for the Web into '
+        'static files with content-hashed names and SRI hashes. The source '
+        'is a tarball made by `npm pack material-components-web@VERSION` '
+        '(add --offline to make it from npm cache) or a package directory.'
+    )
+    files = (
+        f'{PACKAGE}.js', f'{PACKAGE}.min.js',
+        f'{PACKAGE}.css', f'{PACKAGE}.min.css',
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'source', nargs='?',
+            default=os.path.join('node_modules', PACKAGE),
+            help='Tarball or directory of the package.'
+                 ' Default to node_modules/material-components-web.',
+        )
+        parser.add_argument(
+            '--output', default=OUTPUT_DIR,
+            help='Directory to output the files and manifest.json.',
+        )
+        parser.add_argument(
+            '--force', action='store_true',
+            help=f'Vendor even if the version is not {SUPPORTED_MDC_VERSION}.',
+        )
+
+    def handle(self, *args, source, output, force, **options):
+        read = self.get_reader(source)
+        version = json.loads(read('package.json'))['version']
+        if version != SUPPORTED_MDC_VERSION and not force:
+            raise CommandError(
+                f'{source} is version {version}, but MDC for Django supports'
+                f' {SUPPORTED_MDC_VERSION}. Use --force to vendor it anyway.'
+            )
+        os.makedirs(output, exist_ok=True)
+        for name in os.listdir(output):
+            if name.startswith(f'{PACKAGE}.'):
+                os.remove(os.path.join(output, name))
+        manifest = {'version': version, 'files': {}}
+        for name in self.files:
+            content = read(f'dist/{name}')
+            digest = hashlib.sha384(content).digest()
+            hashed_name = name.replace(
+                PACKAGE, f'{PACKAGE}.{hashlib.md5(content).hexdigest()[:12]}',
+                1,
+            )
+            with open(os.path.join(output, hashed_name), 'wb') as f:
+                f.write(content)
+            manifest['files'][name] = {
+                'path': f'mdc/vendor/{hashed_name}',
+                'integrity': 'sha384-' + base64.b64encode(digest).decode(),
+            }
+            self.stdout.write(f'Vendored {hashed_name}')
+        with open(os.path.join(output, 'manifest.json'), 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        self.stdout.write(self.style.SUCCESS(
+            f'Vendored {PACKAGE}@{version} into {output}'))
+
+    def get_reader(self, source):
+        """Return a function reading a file of the package by the path."""
+        if os.path.isdir(source):
+            def read(path):
+                try:
+                    with open(os.path.join(source, path), 'rb') as f:
+                        return f.read()
+                except OSError as e:
+                    raise CommandError(e)
+            return read
+        try:
+            archive = tarfile.open(source)
+        except (OSError, tarfile.TarError) as e:
+            raise CommandError(e)
+
+        def read(path):
+            try:
+                return archive.extractfile(f'package/{path}').read()
+            except (KeyError, AttributeError):
+                raise CommandError(f'{path} is not found in {source}')
+        return read
@@ -0,0 +1,462 @@
+"""Paginator classes for large querysets.
+
+See also:
+    https://docs.djangoproject.com/en/1.11/ref/paginator/
+"""
+
+import binascii
+import collections.abc
+import hashlib
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.core.paginator import EmptyPage, InvalidPage
+from django.core.paginator import Paginator as DjangoPaginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.paginator import Page as DjangoPage
+from django.db import connections
+from django.db.models import Model, Q, QuerySet
+from django.utils.functional import cached_property
+
+__all__ = (
+    'ExactCount', 'CachedCount', 'CappedCount', 'EstimatedCount',
+    'ESTIMATORS', 'Paginator', 'Page',
+    'InvalidCursor', 'CursorPaginator', 'CursorPage',
+)
+
+
+def _exact_count(object_list):
+    if isinstance(object_list, QuerySet):
+        return object_list.count()
+    return len(object_list)
+
+
+class ExactCount:
+    """Count strategy that counts rows exactly on every pagination."""
+
+    approximate_format = '{}'
+
+    def count(self, object_list, per_page):
+        """Return the number of rows and whether it is approximate.
+
+        Args:
+            object_list (:obj:`QuerySet` or :obj:`list`): Paginated rows.
+            per_page (int): Maximum number of items on a page.
+        """
+        return _exact_count(object_list), False
+
+
+class CachedCount(ExactCount):
+    """Count strategy that caches the exact count by the SQL of queryset.
+
+    Args:
+        timeout (:obj:`int`, optional): Seconds until the cached count
+            expires. Default to 300.
+        cache_alias (:obj:`str`, optional): Alias of the cache in
+            `CACHES` setting. Default to `'default'`.
+        key_prefix (:obj:`str`, optional): Prefix of the cache key.
+    """
+
+    def __init__(self, timeout=300, cache_alias='default',
+                 key_prefix='mdc.paginator.count'):
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+
+    def get_cache_key(self, queryset):
+        """Return the cache key of `queryset`, or `None` if not cacheable."""
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return None
+        digest = hashlib.md5(
+            f'{queryset.db}:{sql}:{params!r}'.encode()).hexdigest()
+        return f'{self.key_prefix}:{digest}'
+
+    def count(self, object_list, per_page):
+        if not isinstance(object_list, QuerySet):
+            return super().count(object_list, per_page)
+        key = self.get_cache_key(object_list)
+        if key is None:
+            return 0, False
+        cache = caches[self.cache_alias]
+        count = cache.get(key)
+        if count is None:
+            count = object_list.count()
+            cache.set(key, count, self.timeout)
+        return count, False
+
+
+class CappedCount(ExactCount):
+    """Count strategy that stops counting at `max_pages` pages.
+
+    If there are more rows, the count is approximated by `max_pages`
+    pages and the last page is displayed as "N+".
+
+    Args:
+        max_pages (:obj:`int`, optional): Maximum number of pages to be
+            counted. Default to 100.
+    """
+
+    approximate_format = '{}+'
+
+    def __init__(self, max_pages=100):
+        self.max_pages = max_pages
+
+    def count(self, object_list, per_page):
+        limit = self.max_pages * per_page
+        count = _exact_count(object_list[:limit + 1])
+        if count > limit:
+            return limit, True
+        return count, False
+
+
+def _estimate_postgresql(queryset):
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    # psycopg2 parses the JSON, while other drivers may return the text.
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _estimate_mysql(queryset):
+    if queryset.query.where:
+        return None
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(
+            'SELECT TABLE_ROWS FROM information_schema.TABLES'
+            ' WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s',
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    return row and row[0]
+
+
+ESTIMATORS = {
+    'postgresql': _estimate_postgresql,
+    'mysql': _estimate_mysql,
+}
+"""dict: Estimators of the number of rows keyed by the database vendor.
+
+An estimator takes a queryset and returns the estimated number of rows,
+or `None` if it cannot estimate.
+"""
+
+
+class EstimatedCount(ExactCount):
+    """Count strategy that uses the estimate of the database backend.
+
+    The estimator is looked up in :obj:`ESTIMATORS` by the vendor of the
+    database unless specified. Small or unestimatable counts fall back to
+    the exact count, as well as failures of the estimator.
+
+    Args:
+        estimator (:obj:`callable`, optional): Function that takes a
+            queryset and returns the estimated number of rows or `None`.
+        threshold (:obj:`int`, optional): Estimates less than this are
+            replaced with the exact count. Default to 1000.
+    """
+
+    approximate_format = '~{}'
+
+    def __init__(self, estimator=None, threshold=1000):
+        self.estimator = estimator
+        self.threshold = threshold
+
+    def count(self, object_list, per_page):
+        if isinstance(object_list, QuerySet):
+            estimator = self.estimator or \
+                ESTIMATORS.get(connections[object_list.db].vendor)
+            try:
+                estimate = estimator and estimator(object_list)
+            except Exception:
+                estimate = None
+            if estimate is not None and estimate >= self.threshold:
+                return estimate, True
+        return super().count(object_list, per_page)
+
+
+class Paginator(DjangoPaginator):
+    """Paginator that counts rows with a pluggable strategy.
+
+    Args:
+        object_list (:obj:`QuerySet` or :obj:`list`): Rows to paginate.
+        per_page (int): Maximum number of items on a page.
+        orphans (:obj:`int`, optional): Minimum number of items on the
+            last page. Default to 0.
+        allow_empty_first_page (:obj:`bool`, optional): Whether the first
+            page may be empty. Default to `True`.
+        count_strategy (:obj:`ExactCount`, optional): Strategy to count
+            rows. Default to :obj:`ExactCount`.
+    """
+
+    def __init__(self, object_list, per_page, orphans=0,
+                 allow_empty_first_page=True, count_strategy=None):
+        super().__init__(object_list, per_page, orphans,
+                         allow_empty_first_page)
+        self.count_strategy = count_strategy or ExactCount()
+
+    @cached_property
+    def _counted(self):
+        return self.count_strategy.count(self.object_list, self.per_page)
+
+    @cached_property
+    def count(self):
+        return self._counted[0]
+
+    @property
+    def count_is_approximate(self):
+        """bool: Whether `count` is approximate."""
+        return self._counted[1]
+
+    @property
+    def approximate_format(self):
+        """str: Format of the last page number if `count` is approximate."""
+        return self.count_strategy.approximate_format
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if not self.count_is_approximate or int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number):
+        if not self.count_is_approximate:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        # One more row tells whether the next page exists.
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        return self._get_page(rows[:self.per_page], number, self,
+                              has_more=len(rows) > self.per_page)
+
+    def _get_page(self, *args, **kwargs):
+        return Page(*args, **kwargs)
+
+
+class Page(DjangoPage):
+    """A page of :obj:`Paginator`.
+
+    If the count is approximate, the page is fetched with one more row
+    than `per_page` and has the next page only if that row exists,
+    whatever the count is.
+    """
+
+    def __init__(self, object_list, number, paginator, has_more=None):
+        super().__init__(object_list, number, paginator)
+        self._has_more = has_more
+
+    def has_next(self):
+        if self._has_more is not None:
+            return self._has_more
+        return super().has_next()
+
+
+_CURSOR_TYPES = (str, int, float, bool)
+"""tuple: Types of values of the ordering key in cursors.
+
+`None` is not included, since rows cannot be sought by null values.
+"""
+
+
+class InvalidCursor(InvalidPage):
+    pass
+
+
+def _key_field(model, lookup):
+    """Return the model field storing values of the ordering `lookup`."""
+    field = None
+    for name in lookup.lstrip('-').split('__'):
+        opts = model._meta
+        field = opts.pk if name == 'pk' else opts.get_field(name)
+        model = field.related_model
+    while field.is_relation:
+        field = field.target_field
+    return field
+
+
+class CursorPaginator:
+    """Paginator that seeks rows by the ordering key instead of offset.
+
+    The paginator never counts the rows. A page is fetched by filtering
+    rows after (or before) the boundary row of the adjacent page on the
+    ordering key, so its cost does not depend on how far the page is.
+    The ordering key should be unique and indexed, and must not be null.
+    Fields of related models can be given by `__` paths like
+    `'author__name'`.
+
+    Args:
+        object_list (:obj:`QuerySet`): Queryset to be paginated.
+        per_page (int): Maximum number of items on a page.
+        ordering (:obj:`str` or :obj:`tuple`, optional): Field names of
+            the ordering key. Prefix `'-'` to a name for descending order.
+            Default to `'pk'`.
+    """
+
+    def __init__(self, object_list, per_page, ordering='pk'):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+        self.ordering = tuple(ordering)
+
+    def page(self, cursor=None):
+        """Return a :obj:`CursorPage` for the given cursor.
+
+        Args:
+            cursor (:obj:`str`, optional): Cursor returned by
+                :obj:`CursorPage`. If omitted, return the first page.
+        Raises:
+            InvalidCursor: If `cursor` is malformed.
+        """
+        if not cursor:
+            backwards, position = False, None
+        else:
+            backwards, position = self.decode_cursor(cursor)
+        queryset = self.object_list.order_by(*(
+            self._reverse(field) if backwards else field
+            for field in self.ordering
+        ))
+        if position is not None:
+            queryset = queryset.filter(self._seek(position, backwards))
+        try:
+            rows = list(queryset[:self.per_page + 1])
+        except OverflowError:
+            # SQLite rejects integers beyond 64 bits on binding them.
+            raise InvalidCursor('That cursor is invalid')
+        has_more = len(rows) > self.per_page
+        del rows[self.per_page:]
+        if backwards:
+            rows.reverse()
+            return CursorPage(rows, self, has_next=True, has_previous=has_more)
+        return CursorPage(rows, self, has_next=has_more,
+                          has_previous=position is not None)
+
+    def position(self, obj):
+        """Return values of the ordering key of `obj`."""
+        position = []
+        for field in self.ordering:
+            value = obj
+            for name in field.lstrip('-').split('__'):
+                value = getattr(value, name)
+                if value is None:
+                    break
+            if isinstance(value, Model):
+                value = value.pk
+            position.append(value)
+        return position
+
+    def encode_cursor(self, position, backwards=False):
+        """Return an opaque cursor pointing rows after `position`.
+
+        Args:
+            position (list): Values of the ordering key.
+            backwards (:obj:`bool`, optional): If `True`, the cursor points
+                rows before `position`. Default to `False`.
+        """
+        data = json.dumps([int(backwards), position], cls=DjangoJSONEncoder,
+                          separators=(',', ':'))
+        return urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """Return a tuple of the direction and the position of `cursor`.
+
+        Values of the position are converted by the model fields of the
+        ordering key and must not be null.
+        """
+        try:
+            data = urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            backwards, position = json.loads(data.decode())
+        except (binascii.Error, UnicodeError, ValueError, TypeError):
+            raise InvalidCursor('That cursor is invalid')
+        if not isinstance(backwards, int) or \
+                not isinstance(position, list) or \
+                len(position) != len(self.ordering) or \
+                not all(isinstance(value, _CURSOR_TYPES)
+                        for value in position):
+            raise InvalidCursor('That cursor is invalid')
+        try:
+            position = [self._to_python(field, value)
+                        for field, value in zip(self._key_fields, position)]
+        except (ValidationError, ValueError, TypeError, OverflowError):
+            raise InvalidCursor('That cursor is invalid')
+        return bool(backwards), position
+
+    @cached_property
+    def _key_fields(self):
+        model = self.object_list.model
+        return [_key_field(model, field) for field in self.ordering]
+
+    def _to_python(self, field, value):
+        value = field.to_python(value)
+        ops = connections[self.object_list.db].ops
+        internal_type = field.get_internal_type()
+        if internal_type in ops.integer_field_ranges:
+            low, high = ops.integer_field_range(internal_type)
+            if low is not None and not low <= value <= high:
+                raise OverflowError(f'{value} is out of range')
+        return value
+
+    @staticmethod
+    def _reverse(field):
+        return field[1:] if field.startswith('-') else '-' + field
+
+    def _seek(self, position, backwards):
+        condition = None
+        equals = {}
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') != backwards else 'gt'
+            clause = Q(**equals, **{f'{name}__{lookup}': value})
+            condition = clause if condition is None else condition | clause
+            equals[name] = value
+        return condition
+
+
+class CursorPage(collections.abc.Sequence):
+    """A page of :obj:`CursorPaginator`."""
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next and bool(object_list)
+        self._has_previous = has_previous and bool(object_list)
+
+    def __repr__(self):
+        return f'<Page of {len(self)} items>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self.has_previous() or self.has_next()
+
+    def next_cursor(self):
+        """Return the cursor of the next page, or `None` if not exists."""
+        if not self.has_next():
+            return None
+        return self.paginator.encode_cursor(
+            self.paginator.position(self.object_list[-1]))
+
+    def previous_cursor(self):
+        """Return the cursor of the previous page, or `None` if not exists."""
+        if not self.has_previous():
+            return None
+        return self.paginator.encode_cursor(
+            self.paginator.position(self.object_list[0]), backwards=True)
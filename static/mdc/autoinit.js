@@ -6,8 +6,95 @@
     const hidden = evt.currentTarget.querySelector('input[type="hidden"]');
     hidden.value = evt.detail.value;
   };
-  for (const el of document.querySelectorAll('[data-mdc-auto-init]')) {
-    switch (el.dataset.mdcAutoInit) {
+  const initAsyncSelect = (select) => {
+    const state = {
+      query: '', buffer: '', page: 0, more: true, loading: false,
+      value: select.value,
+    };
+    const moreOption = document.createElement('option');
+    moreOption.value = '';
+    moreOption.textContent = '…';
+    let timer = null;
+    const load = async (reset) => {
+      if (state.loading || (!reset && !state.more)) {
+        return;
+      }
+      state.loading = true;
+      const url = new URL(select.dataset.mdcdAsyncUrl, window.location.href);
+      url.searchParams.set('q', state.query);
+      url.searchParams.set('page', reset ? 1 : state.page + 1);
+      try {
+        const response = await fetch(url, {
+          credentials: 'same-origin',
+          headers: { Accept: 'application/json' },
+        });
+        const data = await response.json();
+        moreOption.remove();
+        if (reset) {
+          for (const option of Array.from(select.options)) {
+            if (option.value && !option.selected) {
+              option.remove();
+            }
+          }
+          state.page = 0;
+        }
+        const values = new Set(Array.from(select.options, (o) => o.value));
+        for (const choice of data.results) {
+          if (!values.has(choice.value)) {
+            select.add(new Option(choice.label, choice.value));
+          }
+        }
+        state.page += 1;
+        state.more = data.more;
+        if (state.more) {
+          select.add(moreOption);
+        }
+      } finally {
+        state.loading = false;
+      }
+    };
+    select.addEventListener('focus', () => {
+      if (state.page === 0) {
+        load(false);
+      }
+    });
+    select.addEventListener('change', () => {
+      if (select.selectedOptions[0] === moreOption) {
+        select.value = state.value;
+        load(false);
+      } else {
+        state.value = select.value;
+      }
+    });
+    select.addEventListener('keydown', (evt) => {
+      if (evt.key.length !== 1 || evt.altKey || evt.ctrlKey || evt.metaKey) {
+        return;
+      }
+      state.buffer += evt.key;
+      clearTimeout(timer);
+      timer = setTimeout(() => {
+        state.query = state.buffer;
+        state.buffer = '';
+        load(true);
+      }, 500);
+    });
+  };
+  // Async selects are initialized once, including ones inserted later.
+  const ASYNC_SELECTOR = 'select[data-mdcd-async-url]';
+  const asyncSelects = new WeakSet();
+  const initAsyncSelects = (root) => {
+    const elements = root.matches && root.matches(ASYNC_SELECTOR) ?
+      [root] : [];
+    elements.push(...root.querySelectorAll(ASYNC_SELECTOR));
+    for (const el of elements) {
+      if (!asyncSelects.has(el)) {
+        asyncSelects.add(el);
+        initAsyncSelect(el);
+      }
+    }
+  };
+  const connectComponent = (el, name) => {
+    switch (name) {
       case 'MDCCheckbox':
         if (el.parentNode.MDCFormField) {
           el.parentNode.MDCFormField.input = el.MDCCheckbox;
@@ -18,6 +105,14 @@
           el.parentNode.MDCFormField.input = el.MDCRadio;
         }
         break;
+      case 'MDCFormField': {
+        // A lazy input may be instantiated before its form field.
+        const input = el.querySelector('.mdc-checkbox, .mdc-radio');
+        if (input && (input.MDCCheckbox || input.MDCRadio)) {
+          el.MDCFormField.input = input.MDCCheckbox || input.MDCRadio;
+        }
+        break;
+      }
       case 'MDCSlider':
         if (el.querySelector('input[type="hidden"]')) {
           el.addEventListener('MDCSlider:input', setSliderHiddenField, false);
@@ -25,5 +120,213 @@
         break;
       // no default
     }
+  };
+  for (const el of document.querySelectorAll('[data-mdc-auto-init]')) {
+    connectComponent(el, el.dataset.mdcAutoInit);
+  }
+
+  // Components marked with data-mdcd-lazy-init are instantiated in idle
+  // time when they approach the viewport, including ones inserted later.
+  const LAZY_SELECTOR = '[data-mdcd-lazy-init]';
+  const pending = [];
+  let scheduled = false;
+  // Without requestIdleCallback, each task gets a budget of 8ms.
+  const requestIdle = window.requestIdleCallback || ((callback) => (
+    setTimeout(() => {
+      const start = performance.now();
+      callback({
+        timeRemaining: () => Math.max(0, 8 - (performance.now() - start)),
+      });
+    }, 1)
+  ));
+  const initLazyComponent = (el) => {
+    const name = el.dataset.mdcdLazyInit;
+    const namespace = name.charAt(3).toLowerCase() + name.slice(4);
+    const Component = mdc[namespace] && mdc[namespace][name];
+    if (!Component || el[name] || !el.isConnected) {
+      return;
+    }
+    const component = Component.attachTo(el);
+    Object.defineProperty(el, name, {
+      configurable: true, enumerable: false, value: component,
+      writable: false,
+    });
+    connectComponent(el, name);
+  };
+  const initPending = (deadline) => {
+    scheduled = false;
+    // Parents are initialized first, in the order of the document.
+    pending.sort((a, b) => (
+      a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1
+    ));
+    while (pending.length && deadline.timeRemaining() > 1) {
+      initLazyComponent(pending.shift());
+    }
+    if (pending.length) {
+      scheduled = true;
+      requestIdle(initPending);
+    }
+  };
+  const intersectionObserver = window.IntersectionObserver && (
+    new IntersectionObserver((entries, observer) => {
+      for (const entry of entries) {
+        if (entry.isIntersecting) {
+          observer.unobserve(entry.target);
+          pending.push(entry.target);
+        }
+      }
+      if (pending.length && !scheduled) {
+        scheduled = true;
+        requestIdle(initPending);
+      }
+    }, { rootMargin: '200px' })
+  );
+  const observeLazy = (root) => {
+    const elements = root.matches && root.matches(LAZY_SELECTOR) ?
+      [root] : [];
+    elements.push(...root.querySelectorAll(LAZY_SELECTOR));
+    for (const el of elements) {
+      if (intersectionObserver) {
+        intersectionObserver.observe(el);
+      } else {
+        pending.push(el);
+      }
+    }
+    if (!intersectionObserver && pending.length && !scheduled) {
+      scheduled = true;
+      requestIdle(initPending);
+    }
+  };
+  observeLazy(document);
+  initAsyncSelects(document);
+  if (window.MutationObserver) {
+    new MutationObserver((mutations) => {
+      for (const mutation of mutations) {
+        for (const node of mutation.addedNodes) {
+          if (node.nodeType === Node.ELEMENT_NODE) {
+            observeLazy(node);
+            initAsyncSelects(node);
+          }
+        }
+        if (!intersectionObserver) {
+          continue;
+        }
+        for (const node of mutation.removedNodes) {
+          if (node.nodeType === Node.ELEMENT_NODE) {
+            if (node.matches(LAZY_SELECTOR)) {
+              intersectionObserver.unobserve(node);
+            }
+            for (const el of node.querySelectorAll(LAZY_SELECTOR)) {
+              intersectionObserver.unobserve(el);
+            }
+          }
+        }
+      }
+    }).observe(document.body, { childList: true, subtree: true });
+  }
+
+  // Fields of FieldValidationMixin are validated by the server when they
+  // lose focus after changed, and replaced with the re-rendered field.
+  const FIELD_SELECTOR = '.mdcd-field[data-mdcd-validate-url]';
+  const fieldValues = new WeakMap();
+  const controllers = new WeakMap();
+  const fieldOf = (el) => (
+    el.form && el.type !== 'file' && el.closest(FIELD_SELECTOR)
+  );
+  const valueOf = (form, name) => JSON.stringify(
+    new FormData(form).getAll(name).map(String)
+  );
+  const showErrors = (field) => {
+    const error = field.dataset.mdcdError;
+    if (!error) {
+      return;
+    }
+    for (const input of field.querySelectorAll('[aria-invalid="true"]')) {
+      input.setCustomValidity(error);
+      const clear = () => input.setCustomValidity('');
+      input.addEventListener('input', clear, { once: true });
+      input.addEventListener('change', clear, { once: true });
+    }
+    const textField = field.querySelector('.mdc-text-field');
+    if (textField && textField.MDCTextField) {
+      textField.MDCTextField.valid = false;
+    }
+  };
+  const validateField = async (field, form, value) => {
+    const name = field.dataset.mdcdField;
+    const data = new FormData(form);
+    for (const [key, entry] of Array.from(data.entries())) {
+      if (entry instanceof File) {
+        data.delete(key);
+      }
+    }
+    const url = new URL(field.dataset.mdcdValidateUrl, window.location.href);
+    url.searchParams.set('field', name);
+    const token = data.get('csrfmiddlewaretoken');
+    if (controllers.has(field)) {
+      controllers.get(field).abort();
+    }
+    const controller = window.AbortController && new AbortController();
+    controllers.set(field, controller);
+    let html;
+    try {
+      const response = await fetch(url, {
+        method: 'POST',
+        body: data,
+        credentials: 'same-origin',
+        headers: token ? { 'X-CSRFToken': token } : {},
+        signal: controller && controller.signal,
+      });
+      if (!response.ok) {
+        return;
+      }
+      html = await response.text();
+    } catch (err) {
+      if (err.name === 'AbortError') {
+        return;
+      }
+      throw err;
+    }
+    // The field may be edited or focused again meanwhile.
+    if (!field.isConnected || field.contains(document.activeElement) ||
+        valueOf(form, name) !== value) {
+      return;
+    }
+    const template = document.createElement('template');
+    template.innerHTML = html.trim();
+    const replacement = template.content.firstElementChild;
+    if (!replacement) {
+      return;
+    }
+    fieldValues.set(replacement, value);
+    field.replaceWith(replacement);
+    mdc.autoInit(replacement);
+    for (const el of replacement.querySelectorAll('[data-mdc-auto-init]')) {
+      connectComponent(el, el.dataset.mdcAutoInit);
+    }
+    initAsyncSelects(replacement);
+    showErrors(replacement);
+  };
+  document.addEventListener('focusin', (evt) => {
+    const field = fieldOf(evt.target);
+    if (field && !fieldValues.has(field)) {
+      const { form } = evt.target;
+      fieldValues.set(field, valueOf(form, field.dataset.mdcdField));
+    }
+  });
+  document.addEventListener('focusout', (evt) => {
+    const field = fieldOf(evt.target);
+    if (!field || field.contains(evt.relatedTarget)) {
+      return;
+    }
+    const { form } = evt.target;
+    const value = valueOf(form, field.dataset.mdcdField);
+    if (value !== fieldValues.get(field)) {
+      fieldValues.set(field, value);
+      validateField(field, form, value);
+    }
+  });
+  for (const field of document.querySelectorAll(FIELD_SELECTOR)) {
+    showErrors(field);
   }
 })();
@@ -0,0 +1,278 @@
+"""Data tables of querysets styled by `mdcd-data-table`.
+
+:obj:`DataTable` renders rows of a queryset incrementally, so that large
+tables can be streamed by :obj:`StreamingHttpResponse` keeping memory
+flat::
+
+    table = DataTable(Book.objects.all(), [
+        Column('title'),
+        Column('author__name', header='Author'),
+        Column('price'),
+    ], request)
+    return table.streaming_response('books.html', {'title': 'Books'})
+
+In the template, `data_table` tag of `datatable` marks the place of the
+table::
+
+    {% load datatable %}
+    {% data_table table %}
+
+Tables of a page are rendered by :meth:`DataTable.paginate` with
+navigation of `paginator_number` tag in the footer.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.http import StreamingHttpResponse
+from django.template.loader import render_to_string
+from django.utils.formats import localize
+from django.utils.html import conditional_escape, escape
+from django.utils.safestring import mark_safe
+from django.utils.text import capfirst
+
+from mdc import chunks
+from mdc.paginator import Paginator
+from mdc.templatetags.pagination import PageURLBuilder, paginator_number
+
+__all__ = ('Column', 'DataTable')
+
+NUMERIC_FIELDS = (
+    models.IntegerField, models.DecimalField, models.FloatField,
+    models.DurationField,
+)
+
+
+def _get_field(model, lookup):
+    """Return the model field of `lookup` following relations."""
+    field = None
+    for name in lookup.split('__'):
+        if model is None:
+            return None
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        model = field.related_model
+    return field
+
+
+class Column:
+    """Column of :obj:`DataTable`.
+
+    Args:
+        field (str): Lookup of the value, e.g. `'author__name'`.
+        header (:obj:`str`, optional): Header of the column. Default to
+            the verbose name of the model field.
+        sortable (:obj:`bool`, optional): Specifying `True` the table can
+            be sorted by the column. Default to `True`.
+        numeric (:obj:`bool`, optional): Specifying `True` values are
+            aligned right. Default to whether the model field is numeric.
+        format (:obj:`callable`, optional): Function returning the content
+            of a cell from the value. Its result is escaped unless it is
+            marked safe. Default to the localized value.
+    """
+
+    def __init__(self, field, header=None, sortable=True, numeric=None,
+                 format=None):
+        self.field = field
+        self.header = header
+        self.sortable = sortable
+        self.numeric = numeric
+        self.format = format
+
+    def bind(self, model):
+        """Return a copy with defaults resolved from `model`."""
+        field = _get_field(model, self.field)
+        header = self.header
+        if header is None:
+            header = capfirst(getattr(field, 'verbose_name', self.field))
+        numeric = self.numeric
+        if numeric is None:
+            numeric = isinstance(field, NUMERIC_FIELDS)
+        return type(self)(self.field, header, self.sortable, numeric,
+                          self.format)
+
+    def render(self, value):
+        """Return HTML of a cell of `value`."""
+        if self.format is not None:
+            content = conditional_escape(self.format(value))
+        elif value is None:
+            content = ''
+        else:
+            content = escape(localize(value))
+        if self.numeric:
+            return ('<td class="mdcd-data-table__cell--numeric">'
+                    f'{content}</td>')
+        return f'<td>{content}</td>'
+
+
+class DataTable:
+    """Table of a queryset rendered as `mdcd-data-table` incrementally.
+
+    Args:
+        queryset (:obj:`QuerySet`): Rows of the table.
+        columns (list): :obj:`Column` instances.
+        request (:obj:`HttpRequest`, optional): Current request, required
+            to sort by headers and paginate.
+        ordering (:obj:`str`, optional): Lookup sorting rows when the
+            request doesn't specify. Default to the ordering of
+            `queryset`.
+        sort_param (:obj:`str`, optional): Name of the query parameter
+            for sorting. Default to `'sort'`.
+        chunk_size (:obj:`int`, optional): Number of rows fetched from
+            the database and yielded at once. Default to 2000.
+    Raises:
+        TypeError: If `queryset` is sliced and rows are sorted by the
+            request or `ordering`, since it cannot be sorted. Restrict
+            rows by :meth:`paginate` instead.
+    """
+
+    PLACEHOLDER = '<!-- mdc-data-table -->'
+
+    def __init__(self, queryset, columns, request=None, ordering=None,
+                 sort_param='sort', chunk_size=2000):
+        self.columns = [column.bind(queryset.model) for column in columns]
+        self.request = request
+        self.sort_param = sort_param
+        self.chunk_size = chunk_size
+        self.sort = self.get_sort(ordering)
+        if self.sort:
+            if not queryset.query.can_filter():
+                raise TypeError(
+                    'DataTable cannot sort a sliced queryset. Restrict rows'
+                    ' by paginate() instead.')
+            queryset = queryset.order_by(self.sort, 'pk')
+        self.queryset = queryset
+        self.page = None
+        self.streaming = False
+
+    def get_sort(self, default=None):
+        """Return the lookup sorting rows specified by the request."""
+        if self.request is not None:
+            sort = self.request.GET.get(self.sort_param)
+            if sort and sort.lstrip('-') in {
+                    column.field for column in self.columns
+                    if column.sortable}:
+                return sort
+        return default
+
+    def paginate(self, per_page, page_param='page', **kwargs):
+        """Restrict rows to the page specified by the request.
+
+        Without the request, rows are not paginated and `None` is
+        returned.
+
+        Args:
+            per_page (int): Maximum number of rows on a page.
+            page_param (:obj:`str`, optional): Name of the query parameter
+                for the page. Default to `'page'`.
+            **kwargs: Keyword arguments of :obj:`mdc.paginator.Paginator`,
+                e.g. `count_strategy`.
+        Returns:
+            :obj:`Page`: Current page, or `None` without the request.
+        """
+        if self.request is None:
+            return None
+        paginator = Paginator(self.queryset, per_page, **kwargs)
+        self.page = paginator.get_page(self.request.GET.get(page_param))
+        return self.page
+
+    def render_header(self):
+        """Return HTML of `<thead>`."""
+        sort_url = None
+        if self.request is not None:
+            sort_url = PageURLBuilder(self.request, self.sort_param)
+        html = ['<thead>\n<tr>']
+        for column in self.columns:
+            classes = ['mdcd-data-table__header']
+            if column.numeric:
+                classes.append('mdcd-data-table__cell--numeric')
+            header = escape(column.header)
+            if column.sortable and sort_url is not None:
+                sort = column.field
+                if self.sort == column.field:
+                    classes.append('mdcd-data-table__header--sorted-ascending')
+                    sort = f'-{column.field}'
+                elif self.sort == f'-{column.field}':
+                    classes.append(
+                        'mdcd-data-table__header--sorted-descending')
+                header = (f'<a class="mdcd-data-table__sortable-title"'
+                          f' href="{sort_url(sort)}">{header}</a>')
+            html.append(f'\n<th class="{" ".join(classes)}">{header}</th>')
+        html.append('\n</tr>\n</thead>')
+        return ''.join(html)
+
+    def render_footer(self):
+        """Return HTML of `<tfoot>` with navigation of the page."""
+        if self.page is None:
+            return ''
+        return (f'\n<tfoot>\n<tr><td class="mdcd-data-table__paginator"'
+                f' colspan="{len(self.columns)}">'
+                f'{paginator_number(self.request, self.page)}'
+                '</td></tr>\n</tfoot>')
+
+    def rows(self):
+        """Yield values of rows fetched in chunks."""
+        queryset = self.queryset
+        if self.page is not None:
+            per_page = self.page.paginator.per_page
+            bottom = (self.page.number - 1) * per_page
+            queryset = queryset[bottom:bottom + per_page]
+        fields = [column.field for column in self.columns]
+        return queryset.values_list(*fields).iterator(
+            chunk_size=self.chunk_size)
+
+    def __iter__(self):
+        """Yield HTML of the table in chunks of rows."""
+        chunks.record('data-table')
+        yield f'<table class="mdcd-data-table">\n{self.render_header()}'
+        yield '\n<tbody>'
+        renders = [column.render for column in self.columns]
+        html = []
+        for count, row in enumerate(self.rows(), 1):
+            html.append('\n<tr>')
+            html.extend(render(value) for render, value in zip(renders, row))
+            html.append('</tr>')
+            if not count % self.chunk_size:
+                yield ''.join(html)
+                html = []
+        html.append('\n</tbody>')
+        html.append(self.render_footer())
+        html.append('\n</table>')
+        yield ''.join(html)
+
+    def render(self):
+        """Return HTML of the whole table."""
+        if self.streaming:
+            return mark_safe(self.PLACEHOLDER)
+        return mark_safe(''.join(self))
+
+    def __html__(self):
+        return self.render()
+
+    def streaming_response(self, template_name=None, context=None,
+                           **kwargs):
+        """Return :obj:`StreamingHttpResponse` of the table.
+
+        Args:
+            template_name (:obj:`str`, optional): Template of the page
+                containing the table as `table` by `data_table` tag. If
+                omitted, only the table is responded.
+            context (:obj:`dict`, optional): Context of the template.
+            **kwargs: Keyword arguments of :obj:`StreamingHttpResponse`.
+        """
+        if template_name is None:
+            return StreamingHttpResponse(self, **kwargs)
+        self.streaming = True
+        try:
+            html = render_to_string(
+                template_name, dict(context or {}, table=self), self.request)
+        finally:
+            self.streaming = False
+        before, _, after = html.partition(self.PLACEHOLDER)
+
+        def content():
+            yield before
+            yield from self
+            yield after
+        return StreamingHttpResponse(content(), **kwargs)
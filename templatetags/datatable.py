@@ -0,0 +1,17 @@
+from django.template import Library
+
+register = Library()
+
+
+@register.simple_tag
+def data_table(table):
+    """Return HTML of :obj:`mdc.tables.DataTable`.
+
+    Args:
+        table (:obj:`mdc.tables.DataTable`): Table to render. In a
+            template of :meth:`DataTable.streaming_response`, its rows
+            are streamed in place of this tag.
+    Returns:
+        str: HTML of the table.
+    """
+    return table.render()
@@ -1,38 +1,170 @@
+import json
+import os
+from functools import lru_cache
+
 from django.conf import settings
+from django.contrib.staticfiles import finders
 from django.template import Library
+from django.templatetags.static import static
 from django.template.base import TemplateSyntaxError
-from django.utils.html import format_html
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+from sass_processor.processor import SassProcessor
+from sass_processor.storage import find_file
 from sass_processor.templatetags.sass_tags import SassSrcNode
 
-from mdc import SUPPORTED_MDC_VERSION
+from mdc import SUPPORTED_MDC_VERSION, chunks, icons
 
 register = Library()
 
+VENDORED_MANIFEST = 'mdc/vendor/manifest.json'
+FONTS_MANIFEST = 'mdc/fonts/manifest.json'
+
+
+@lru_cache(maxsize=None)
+def get_vendored_files():
+    """Return files vendored by `vendor_mdc` command.
+
+    Returns:
+        dict: Dictionaries with `path` and `integrity` keyed by the file
+            name, which is empty if MDC is not vendored.
+    """
+    path = finders.find(VENDORED_MANIFEST)
+    if not path:
+        return {}
+    with open(path) as f:
+        return json.load(f)['files']
+
+
+@lru_cache(maxsize=None)
+def get_fonts():
+    """Return fonts built by `build_mdc_assets` command.
+
+    Returns:
+        list: Dictionaries with `family`, `weight`, `style`, `path` and
+            `unicodeRange`, which is empty if fonts are not built.
+    """
+    path = finders.find(FONTS_MANIFEST)
+    if not path:
+        return []
+    with open(path) as f:
+        return json.load(f)['fonts']
+
+
+def vendored_tag(name):
+    """Return HTML tag importing a vendored file, or `None`."""
+    vendored = get_vendored_files().get(name)
+    if vendored is None:
+        return None
+    if name.endswith('.css'):
+        return format_html(
+            '<link rel="stylesheet" href="{}" integrity="{}"'
+            ' crossorigin="anonymous">',
+            static(vendored['path']), vendored['integrity'],
+        )
+    return format_html(
+        '<script src="{}" integrity="{}" crossorigin="anonymous"></script>',
+        static(vendored['path']), vendored['integrity'],
+    )
+
 
 class MdcCssNode(SassSrcNode):
     SASS_PATH = 'mdc/material-components-web.scss'
     LAST_PATH = 'https://unpkg.com/material-components-web/dist/' \
                 'material-components-web.css'
 
-    def __init__(self, path, uses_last=None):
+    # URLs of compiled CSS and mtimes of their sources keyed by Sass path.
+    compiled = {}
+
+    def __init__(self, path, uses_last=None, theme=None):
         super().__init__(path)
         self.uses_last = uses_last
+        self.theme = theme
 
     @classmethod
     def handle_token(cls, parser, token):
         bits = token.split_contents()
-        if len(bits) > 2:
-            raise TemplateSyntaxError("'{0}' takes no argument".format(*bits))
-        if len(bits) == 2:
-            return cls(parser.compile_filter(f"'{cls.SASS_PATH}'"),
-                       parser.compile_filter(bits[1]))
-        return cls(parser.compile_filter(f"'{cls.SASS_PATH}'"))
+        args = []
+        kwargs = {}
+        for bit in bits[1:]:
+            if bit.startswith('theme='):
+                kwargs['theme'] = parser.compile_filter(bit[len('theme='):])
+            else:
+                args.append(parser.compile_filter(bit))
+        if len(args) > 1:
+            raise TemplateSyntaxError(
+                "'{0}' takes at most one positional argument".format(*bits))
+        return cls(parser.compile_filter(f"'{cls.SASS_PATH}'"),
+                   *args, **kwargs)
+
+    def get_sass_path(self, context):
+        """Return the path of Sass for the theme given to the tag."""
+        theme = self.theme and self.theme.resolve(context)
+        if not theme:
+            return self.sass_processor.resolve_path(context)
+        try:
+            return settings.MDC_SASS_THEMES[theme]
+        except (AttributeError, KeyError):
+            raise TemplateSyntaxError(
+                f"Theme '{theme}' is not found in MDC_SASS_THEMES setting")
 
     def render(self, context):
         if settings.DEBUG and \
                 self.uses_last and self.uses_last.resolve(context):
             return self.LAST_PATH
-        return super().render(context)
+        try:
+            return self.get_url(self.get_sass_path(context))
+        except FileNotFoundError as e:
+            raise TemplateSyntaxError(
+                f"{e} while rendering tag 'mdc_sass_src' in template"
+                f" {context.template_name}")
+
+    @classmethod
+    def get_url(cls, path):
+        """Return URL of CSS compiled from Sass of `path`.
+
+        Sass is compiled only if it is not compiled yet in the process or
+        its sources are modified.
+        """
+        compiled = cls.compiled.get(path)
+        if compiled is not None and cls.is_latest(compiled[1]):
+            return compiled[0]
+        css_path = SassProcessor()(path)
+        url = SassProcessor.handle_simple(css_path)
+        cls.compiled[path] = (url, cls.get_source_mtimes(path, css_path))
+        return url
+
+    @staticmethod
+    def get_source_mtimes(path, css_path):
+        """Return mtimes of the sources of compiled CSS keyed by the path.
+
+        Returns `None` if the Sass processor is disabled, since compiled
+        CSS is never updated in the process then.
+        """
+        if not SassProcessor.processor_enabled:
+            return None
+        sourcemap = find_file(css_path + '.map')
+        if not sourcemap:
+            return {}
+        base = os.path.dirname(find_file(path))
+        with open(sourcemap) as f:
+            sources = json.load(f).get('sources', [])
+        mtimes = {sourcemap: os.stat(sourcemap).st_mtime}
+        for source in sources:
+            source = os.path.join(base, source)
+            if os.path.isfile(source):
+                mtimes[source] = os.stat(source).st_mtime
+        return mtimes
+
+    @staticmethod
+    def is_latest(mtimes):
+        if mtimes is None:
+            return True
+        try:
+            return all(os.stat(source).st_mtime == mtime
+                       for source, mtime in mtimes.items())
+        except OSError:
+            return False
 
 
 @register.tag
@@ -43,6 +175,9 @@ def mdc_sass_src(parser, token):
         debug_latest (:obj:`bool`, optional): True if use MDC of latest
             version in *DEBUG mode*. Specifying False or not DEBUG mode,
             get the supported version.
+        theme (:obj:`str`, optional): Name of the theme in
+            `MDC_SASS_THEMES` setting mapping names to paths of Sass.
+            Specify it as `theme="name"`.
     Returns:
         str: HTML link tag for downloading CSS of MDC.
     """
@@ -66,7 +201,7 @@ def import_js_tag(debug_latest=False):
             return format_html(
                 f'<script src="{settings.PRODUCT_MDC_JS_PATH}"></script>'
             )
-        return format_html(
+        return vendored_tag('material-components-web.min.js') or format_html(
             '<script src="https://unpkg.com/material-components-web@'
             f'{SUPPORTED_MDC_VERSION}/dist/material-components-web.min.js">'
             '</script>'
@@ -80,7 +215,128 @@ def import_js_tag(debug_latest=False):
         return format_html(
             f'<script src="{settings.DEPLOYMENT_MDC_JS_PATH}"></script>'
         )
-    return format_html(
+    return vendored_tag('material-components-web.js') or format_html(
         '<script src="https://unpkg.com/material-components-web@'
         f'{SUPPORTED_MDC_VERSION}/dist/material-components-web.js"></script>'
     )
+
+
+@register.simple_tag
+def import_css_tag(debug_latest=False):
+    """Return HTML link tag for CSS of *Material Components for the Web*.
+
+    The CSS vendored by `vendor_mdc` command is used with its integrity.
+    Use this tag instead of `mdc_sass_src` if you don't customize MDC
+    with Sass.
+
+    Args:
+        debug_latest (:obj:`bool`, optional): True if use MDC of latest
+            version in *DEBUG mode*. Specifying False or not DEBUG mode,
+            get the supported version.
+    Returns:
+        str: HTML link tag for CSS of MDC.
+    """
+    if settings.DEBUG and debug_latest:
+        return format_html('<link rel="stylesheet" href="{}">',
+                           MdcCssNode.LAST_PATH)
+    name = 'material-components-web.css' if settings.DEBUG \
+        else 'material-components-web.min.css'
+    return vendored_tag(name) or format_html(
+        '<link rel="stylesheet" href="https://unpkg.com/'
+        f'material-components-web@{SUPPORTED_MDC_VERSION}/dist/{name}">'
+    )
+
+
+def chunk_links(paths):
+    """Return HTML link tags for CSS compiled from Sass of `paths`."""
+    try:
+        return format_html_join(
+            '\n', '<link href="{}" rel="stylesheet" type="text/css">',
+            ((MdcCssNode.get_url(path),) for path in paths),
+        )
+    except FileNotFoundError as e:
+        raise TemplateSyntaxError(f"{e} while rendering CSS chunks of MDC")
+
+
+@register.simple_tag
+def mdc_css_chunks(*components):
+    """Return HTML link tags for CSS of MDC components used by the page.
+
+    With `mdc.chunks.CSSChunksMiddleware`, returns a placeholder replaced
+    with links of the chunks of components rendered in the response.
+    Otherwise, returns links of the whole MDC bundle and `complement.scss`.
+
+    Args:
+        *components (str): Names of components to include regardless of
+            the renders, e.g. `'card'` for cards written in templates.
+    Returns:
+        str: HTML link tags for CSS of MDC.
+    """
+    if chunks.is_recording():
+        chunks.record(*components)
+        return mark_safe(chunks.PLACEHOLDER)
+    return chunk_links((MdcCssNode.SASS_PATH, 'mdc/complement.scss'))
+
+
+@register.simple_tag
+def mdc_icon(name):
+    """Return HTML of an icon of Material Design.
+
+    The icon is a ligature of the Material Icons font by default, or a
+    reference to the sprite of `mdc_icon_sprite` if `MDC_ICONS` setting is
+    `'sprite'`.
+
+    Args:
+        name (str): Name of the icon, e.g. `'chevron_left'`.
+    Returns:
+        str: HTML of the icon.
+    """
+    return icons.icon(name)
+
+
+@register.simple_tag
+def mdc_icon_sprite():
+    """Return the inline SVG sprite of icons if `MDC_ICONS` is `'sprite'`.
+
+    Returns:
+        str: HTML of the hidden sprite, or an empty string.
+    """
+    if not icons.uses_sprite():
+        return ''
+    return icons.sprite()
+
+
+@register.simple_tag
+def mdc_fonts(*preload):
+    """Return HTML loading fonts self-hosted by `build_mdc_assets` command.
+
+    Fonts are declared by `@font-face` with preload hints, so that they
+    are fetched early from the own server. If fonts are not built, links
+    `fonts.scss` loading them from Google Fonts.
+
+    Args:
+        *preload (int): Weights of fonts to preload. Default to all.
+    Returns:
+        str: HTML link and style tags of fonts.
+    """
+    fonts = get_fonts()
+    if not fonts:
+        return chunk_links(('mdc/fonts.scss',))
+    preload = {int(weight) for weight in preload}
+    links = format_html_join(
+        '\n', '<link rel="preload" href="{}" as="font" type="font/woff2"'
+        ' crossorigin>', (
+            (static(font['path']),) for font in fonts
+            if not preload or font['weight'] in preload
+        ),
+    )
+    faces = format_html_join(
+        '\n', '@font-face {{ font-family: "{}"; font-style: {};'
+        ' font-weight: {}; src: url("{}") format("woff2");'
+        ' unicode-range: {}; font-display: swap; }}', (
+            (font['family'], font['style'], font['weight'],
+             static(font['path']), font['unicodeRange'])
+            for font in fonts
+        ),
+    )
+    return format_html('{}\n<style>\n{}\n</style>', links, faces)
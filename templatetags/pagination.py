@@ -1,60 +1,244 @@
+import hashlib
+from urllib.parse import quote
+
+from django.conf import settings
 from django.contrib.humanize.templatetags.humanize import intcomma
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.encoding import escape_uri_path
 from django.template import Library
-from django.utils.html import format_html
+from django.utils.html import escape
+from django.utils.http import urlencode
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
 
-from utilities.web import add_query_to_url
+from mdc import chunks, icons, instrumentation
+from mdc.utils import LRUCache
 
 register = Library()
 
+pagination_cache = LRUCache(maxsize=256)
+"""Cache of HTML of `paginater_num` in the process.
+
+Its `hits` and `misses` count lookups. If `MDC_PAGINATION_CACHE` setting
+names a cache in `CACHES`, HTML missing in the process is shared through
+the cache as well.
+"""
+
+_shared_caches = {}
+
+
+@receiver(setting_changed)
+def _clear_pagination_cache(*, setting, **kwargs):
+    if setting in ('MDC_PAGINATION_CACHE', 'MDC_ICONS', 'LANGUAGE_CODE',
+                   'USE_L10N',
+                   'USE_THOUSAND_SEPARATOR', 'NUMBER_GROUPING',
+                   'THOUSAND_SEPARATOR'):
+        pagination_cache.clear()
+        _shared_caches.clear()
+
+
+def _get_shared_cache():
+    try:
+        return _shared_caches['cache']
+    except KeyError:
+        pass
+    alias = getattr(settings, 'MDC_PAGINATION_CACHE', None)
+    cache = _shared_caches['cache'] = caches[alias] if alias else None
+    return cache
+
+
+NAV_ICON = {
+    'disable': '<span class="mdcd-button-like mdc-button--dense'
+               ' mdcd-button--disabled">{}</span>',
+    'able':    '<a href="{}" class="mdc-button mdc-button--dense">{}</a>'
+}
+
+
+class PageURLBuilder:
+    """Builder of URLs to pages keeping the other query of the request.
+
+    The path and the query parameters other than the page are encoded
+    only once on initialization, and calling the instance just puts the
+    page number in place of the page parameter.
+
+    Args:
+        request (:obj:`HttpRequest`): Current request.
+        page_param (:obj:`str`, optional): Name of the query parameter
+            for the page. Default to `'page'`.
+    """
+
+    def __init__(self, request, page_param='page'):
+        before, after = [], []
+        params = before
+        for key, values in request.GET.lists():
+            if key == page_param:
+                params = after
+                continue
+            params.extend((key, value) for value in values)
+        prefix = f'{escape_uri_path(request.path)}?'
+        if before:
+            prefix += urlencode(before) + '&'
+        self.prefix = escape(f'{prefix}{quote(page_param)}=')
+        self.suffix = escape('&' + urlencode(after)) if after else ''
+
+    def __call__(self, page_number):
+        """Return HTML-escaped URL to `page_number`."""
+        return f'{self.prefix}{page_number}{self.suffix}'
+
+
+def page_window(num_pages, page_number, edge_number=2, center_number=3):
+    """Generate page numbers displayed on pagination.
+
+    Only the pages around the edges and the current page are examined, so
+    the cost does not depend on `num_pages`.
+
+    Args:
+        num_pages (int): Total number of pages.
+        page_number (int): Current page number.
+        edge_number (:obj:`int`, optional): Number of pages displayed at
+            both edges. Default to 2.
+        center_number (:obj:`int`, optional): Number of pages displayed
+            on each side of the current page. Default to 3.
+    Yields:
+        int: Page number to be displayed, or `None` for an ellipsis.
+    """
+    candidates = set(range(1, min(edge_number, num_pages) + 1))
+    candidates.update(range(max(1, page_number - center_number),
+                            min(num_pages, page_number + center_number) + 1))
+    candidates.update(range(max(1, num_pages - edge_number + 1),
+                            num_pages + 1))
+    candidates.update((edge_number + 1, num_pages - edge_number))
+    for i in sorted(candidates):
+        if not 1 <= i <= num_pages:
+            continue
+        if i <= edge_number or num_pages - edge_number < i \
+                or abs(page_number - i) <= center_number:
+            yield i
+        elif edge_number + 1 == i < page_number \
+                or num_pages - edge_number == i > page_number:
+            yield None
+
 
 @register.simple_tag
-def paginator_number(request, page_obj):
+@instrumentation.instrument('pagination')
+def paginator_number(request, page_obj, edge_number=2, center_number=3):
+    paginator = page_obj.paginator
+    num_pages = paginator.num_pages
+    approximate_format = None
+    if getattr(paginator, 'count_is_approximate', False):
+        if page_obj.has_next():
+            approximate_format = paginator.approximate_format
+        else:
+            # No row follows the page, so it is the last whatever the
+            # approximate count is.
+            num_pages = page_obj.number
     return paginater_num(request,
-                         page_obj.paginator.num_pages,
-                         page_obj.number)
+                         num_pages,
+                         page_obj.number,
+                         edge_number,
+                         center_number,
+                         approximate_format)
+
+
+@register.simple_tag
+@instrumentation.instrument('pagination')
+def paginator_cursor(request, page_obj, cursor_param='cursor'):
+    """Return navigation of :obj:`mdc.paginator.CursorPage`.
+
+    Only links to the previous and the next pages are rendered, so that
+    the total number of rows is never counted.
+
+    Args:
+        request (:obj:`HttpRequest`): Current request.
+        page_obj (:obj:`mdc.paginator.CursorPage`): Current page.
+        cursor_param (:obj:`str`, optional): Name of the query parameter
+            for the cursor. Default to `'cursor'`.
+    Returns:
+        str: HTML of the navigation.
+    """
+    chunks.record('data-table')
+    page_url = PageURLBuilder(request, cursor_param)
+    results = []
+    for cursor, icon in ((page_obj.previous_cursor(), 'chevron_left'),
+                         (page_obj.next_cursor(), 'chevron_right')):
+        if cursor is None:
+            results.append(NAV_ICON['disable'].format(icons.icon(icon)))
+        else:
+            results.append(NAV_ICON['able'].format(page_url(cursor),
+                                                   icons.icon(icon)))
+    return mark_safe('\n'.join(results))
 
 
 @register.simple_tag
-def paginater_num(request, num_pages, page_number):
+@instrumentation.instrument('pagination')
+def paginater_num(request, num_pages, page_number,
+                  edge_number=2, center_number=3, approximate_format=None):
+    """Return navigation of pages around `page_number`.
+
+    The HTML is cached by the query of the request except the page, the
+    arguments and the active language. See :obj:`pagination_cache`.
+    """
+    chunks.record('data-table')
+    page_url = PageURLBuilder(request)
+    key = (page_url.prefix, page_url.suffix, num_pages, page_number,
+           edge_number, center_number, approximate_format, get_language(),
+           icons.uses_sprite())
+    html = pagination_cache.get(key)
+    if html is not None:
+        return html
+    shared_cache = _get_shared_cache()
+    if shared_cache is not None:
+        shared_key = 'mdc.pagination.' + hashlib.md5(
+            repr(key).encode()).hexdigest()
+        html = shared_cache.get(shared_key)
+        if html is not None:
+            html = mark_safe(html)
+    if html is None:
+        html = _render_paginater_num(page_url, num_pages, page_number,
+                                     edge_number, center_number,
+                                     approximate_format)
+        if shared_cache is not None:
+            shared_cache.set(shared_key, html)
+    pagination_cache.set(key, html)
+    return html
+
+
+def _render_paginater_num(page_url, num_pages, page_number,
+                          edge_number, center_number, approximate_format):
     results = []
-    edge_number = 2
-    center_number = 3
-    nav_icon = {
-        'disable': '<span class="mdcd-button-like mdc-button--dense'
-                   ' mdcd-button--disabled">'
-                   '<i class="material-icons">{}</i>'
-                   '</span>',
-        'able':    '<a href="{}" class="mdc-button mdc-button--dense">'
-                   '<i class="material-icons">{}</i>'
-                   '</a>'
-    }
+    if approximate_format:
+        num_pages = max(num_pages, page_number)
     if page_number == 1:
-        results.append(nav_icon['disable'].format('chevron_left'))
+        results.append(NAV_ICON['disable'].format(icons.icon('chevron_left')))
     else:
-        results.append(nav_icon['able'].format(
-            add_query_to_url(request, 'page', page_number - 1),
-            'chevron_left',
+        results.append(NAV_ICON['able'].format(
+            page_url(page_number - 1),
+            icons.icon('chevron_left'),
         ))
-    for i in range(1, num_pages+1):
-        if i <= edge_number or num_pages - edge_number < i \
-                or abs(page_number - i) <= center_number:
-            if i == page_number:
-                results.append('<span class="mdcd-button-like'
-                               f' mdc-button--dense current">{intcomma(i)}'
-                               '</span>')
-            else:
-                results.append(
-                    f'<a href="{add_query_to_url(request, "page", i)}"'
-                    f' class="mdc-button mdc-button--dense">{intcomma(i)}</a>'
-                )
-        elif edge_number + 1 == i < page_number \
-                or num_pages - edge_number == i > page_number:
-            results.append(nav_icon['disable'].format('more_horiz'))
-    if page_number == num_pages:
-        results.append(nav_icon['disable'].format('chevron_right'))
+    ellipsis = NAV_ICON['disable'].format(icons.icon('more_horiz'))
+    for i in page_window(num_pages, page_number, edge_number, center_number):
+        if i is None:
+            results.append(ellipsis)
+            continue
+        label = intcomma(i)
+        if approximate_format and i == num_pages:
+            label = approximate_format.format(label)
+        if i == page_number:
+            results.append('<span class="mdcd-button-like'
+                           f' mdc-button--dense current">{label}'
+                           '</span>')
+        else:
+            results.append(
+                f'<a href="{page_url(i)}"'
+                f' class="mdc-button mdc-button--dense">{label}</a>'
+            )
+    if page_number == num_pages and not approximate_format:
+        results.append(NAV_ICON['disable'].format(icons.icon('chevron_right')))
     else:
-        results.append(nav_icon['able'].format(
-            add_query_to_url(request, 'page', page_number + 1),
-            'chevron_right',
+        results.append(NAV_ICON['able'].format(
+            page_url(page_number + 1),
+            icons.icon('chevron_right'),
         ))
-    return format_html('\n'.join(results))
+    return mark_safe('\n'.join(results))
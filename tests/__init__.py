@@ -0,0 +1,6 @@
+"""Tests of MDC for Django.
+
+Run them by Django's test runner in the directory containing `mdc`::
+
+    $ python -m django test mdc.tests --settings=mdc.tests.settings
+"""
@@ -0,0 +1,38 @@
+"""Settings of the tests of MDC for Django."""
+
+SECRET_KEY = 'mdc-tests'
+
+INSTALLED_APPS = [
+    'django.contrib.contenttypes',
+    'django.contrib.auth',
+    'django.forms',
+    'mdc',
+]
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    },
+}
+
+TEMPLATES = [{
+    'BACKEND': 'django.template.backends.django.DjangoTemplates',
+    'APP_DIRS': True,
+}]
+
+FORM_RENDERER = 'django.forms.renderers.DjangoTemplates'
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
+USE_I18N = True
+USE_L10N = True
+USE_TZ = True
+
+LANGUAGES = [('en', 'English'), ('de', 'German'), ('ja', 'Japanese')]
+
+STATIC_URL = '/static/'
@@ -0,0 +1,54 @@
+from unittest import mock
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.template import engines
+from django.test import RequestFactory, SimpleTestCase
+from django.utils.html import format_html_join
+
+from mdc import chunks
+from mdc.forms import widgets
+
+
+def chunk_links(paths):
+    return format_html_join('', '<link href="{}">', ((p,) for p in paths))
+
+
+@mock.patch('mdc.templatetags.mdcimport.chunk_links', chunk_links)
+class CSSChunksMiddlewareTests(SimpleTestCase):
+
+    template = engines['django'].from_string(
+        '{% load mdcimport %}<head>{% mdc_css_chunks "card" %}</head>')
+
+    def test_response(self):
+        def get_response(request):
+            html = self.template.render() + widgets.Slider().render('f', 1)
+            return HttpResponse(html)
+
+        response = chunks.CSSChunksMiddleware(get_response)(
+            RequestFactory().get('/'))
+        self.assertContains(
+            response,
+            '<head><link href="mdc/chunks/base.scss">'
+            '<link href="mdc/chunks/card.scss">'
+            '<link href="mdc/chunks/slider.scss"></head>')
+
+    def test_streaming_response(self):
+        def get_response(request):
+            html = self.template.render()
+            middle = html.index(chunks.PLACEHOLDER) + 5
+            return StreamingHttpResponse(
+                [html[:middle], html[middle:], '<body>', '</body>'])
+
+        response = chunks.CSSChunksMiddleware(get_response)(
+            RequestFactory().get('/'))
+        html = b''.join(response.streaming_content).decode()
+        links = chunk_links(map(chunks.chunk_path, chunks.CHUNKS))
+        self.assertEqual(html, f'<head>{links}</head><body></body>')
+
+    def test_streaming_response_without_placeholder(self):
+        def get_response(request):
+            return StreamingHttpResponse(['<p>', 'a', '</p>'])
+
+        response = chunks.CSSChunksMiddleware(get_response)(
+            RequestFactory().get('/'))
+        self.assertEqual(b''.join(response.streaming_content), b'<p>a</p>')
@@ -0,0 +1,47 @@
+from django.core.validators import RegexValidator
+from django.test import SimpleTestCase
+
+from mdc.forms import fields
+from mdc.forms.fields import _translate_regex
+
+
+class TranslateRegexTests(SimpleTestCase):
+
+    def test_hyphens_in_classes(self):
+        cases = {
+            r'[a-z]': r'[a-z]',
+            r'[\w-x]': r'[\p{L}\p{N}_\-x]',
+            r'[\d-9]': r'[\p{Nd}\-9]',
+            r'[a-c-e]': r'[a-c\-e]',
+            r'[\w.-]': r'[\p{L}\p{N}_.\-]',
+            r'[-a]': r'[\-a]',
+        }
+        for pattern, expected in cases.items():
+            with self.subTest(pattern=pattern):
+                self.assertEqual(_translate_regex(pattern), expected)
+
+    def test_identity_escapes(self):
+        cases = {
+            r'^[A-Z]\-\d+$': r'^[A-Z]-\p{Nd}+$',
+            r'a\/b\.c\ d\_e\#f': r'a\/b\.c d_e#f',
+            r'[\-\#\'\_\.]': r"[\-\#'_\.]",
+            r'(a)\1\n\t\$': r'(a)\1\n\t\$',
+        }
+        for pattern, expected in cases.items():
+            with self.subTest(pattern=pattern):
+                self.assertEqual(_translate_regex(pattern), expected)
+
+    def test_ascii_classes(self):
+        self.assertEqual(_translate_regex(r'[\w-x]', unicode=False),
+                         r'[\w\-x]')
+
+    def test_pattern_attribute(self):
+        field = fields.CharField(validators=[RegexValidator(r'^[\w-]+$')])
+        self.assertEqual(field.widget.attrs['pattern'],
+                         r'(?=.*(?:^[\p{L}\p{N}_\-]+$)).*')
+
+    def test_pattern_attribute_without_identity_escapes(self):
+        field = fields.CharField(
+            validators=[RegexValidator(r'^[A-Z]\-\d+$')])
+        self.assertEqual(field.widget.attrs['pattern'],
+                         r'(?=.*(?:^[A-Z]-\p{Nd}+$)).*')
@@ -0,0 +1,89 @@
+import itertools
+import re
+
+from django import forms as django_forms
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from mdc import chunks, instrumentation
+from mdc.forms import widgets
+from mdc.forms.forms import RenderCacheMixin
+
+
+class Opaque:
+    pass
+
+
+class CachedForm(RenderCacheMixin, django_forms.Form):
+    name = django_forms.CharField(widget=widgets.TextInput(label='Name'))
+    agree = django_forms.BooleanField(
+        widget=widgets.CheckboxInput(label='Agree'))
+
+
+class NonceInput(django_forms.TextInput):
+    """Input rendering a different nonce on each render."""
+
+    nonces = itertools.count()
+
+    def render(self, *args, **kwargs):
+        return f'{super().render(*args, **kwargs)}<!-- {next(self.nonces)} -->'
+
+
+class ExcludedForm(CachedForm):
+    token = django_forms.CharField(widget=django_forms.HiddenInput)
+    nonce = django_forms.CharField(widget=NonceInput)
+
+    render_cache_exclude = ('token', 'nonce')
+
+
+class RenderCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def render(self, form):
+        with chunks.capture() as components:
+            html = form.as_p()
+        return html, components
+
+    def test_components_are_recorded_on_cache_hits(self):
+        first = self.render(CachedForm())
+        second = self.render(CachedForm())
+        self.assertEqual(first, second)
+        self.assertEqual(second[1], {'checkbox', 'text-field'})
+
+    @override_settings(MDC_INSTRUMENTATION=True)
+    def test_cache_hits_are_instrumented(self):
+        CachedForm().as_p()
+        instrumentation.reset_stats()
+        CachedForm().as_p()
+        stats = instrumentation.get_stats()
+        self.assertEqual(stats[('cached-form', 'CachedForm')]['count'], 1)
+
+    def test_initial_values_without_stable_text(self):
+        self.assertIsNotNone(
+            CachedForm(initial={'name': 'x'}).get_render_cache_key())
+        self.assertIsNone(
+            CachedForm(initial={'name': Opaque()}).get_render_cache_key())
+        self.assertNotEqual(
+            CachedForm(initial={'name': 1}).get_render_cache_key(),
+            CachedForm(initial={'name': '1'}).get_render_cache_key())
+
+    def test_excluded_fields_are_rendered_fresh(self):
+        for token in ('a', 'b'):
+            with self.subTest(token=token):
+                form = ExcludedForm(initial={'token': token})
+                form.fields['nonce'].widget = django_forms.TextInput()
+                html = form.as_p()
+                self.assertIn(f'name="token" value="{token}"', html)
+                self.assertNotIn('<!-- mdc-form-field:', html)
+        self.assertEqual(len(cache._cache), 1)
+
+    def test_excluded_fields_rendered_differently_are_not_cached(self):
+        first = ExcludedForm(initial={'token': 'a'}).as_p()
+        second = ExcludedForm(initial={'token': 'b'}).as_p()
+        self.assertIn('name="token" value="b"', second)
+        self.assertNotIn('name="token" value="a"', second)
+        nonce = re.compile(r'<!-- (\d+) -->')
+        self.assertNotEqual(nonce.search(first)[1], nonce.search(second)[1])
+        self.assertEqual(len(cache._cache), 0)
@@ -0,0 +1,62 @@
+from django import forms as django_forms
+from django.test import SimpleTestCase
+
+from mdc.forms import widgets
+from mdc.forms.formsets import BaseStreamingFormSet
+
+
+class ItemForm(django_forms.Form):
+    name = django_forms.CharField(widget=widgets.TextInput(label='Name'))
+    count = django_forms.IntegerField(
+        widget=widgets.NumberInput(label='Count'))
+
+    def clean(self):
+        if self.cleaned_data.get('name') == 'none':
+            raise django_forms.ValidationError('No such item.')
+
+
+ItemFormSet = django_forms.formset_factory(
+    ItemForm, formset=BaseStreamingFormSet, extra=2, max_num=3,
+    validate_max=True)
+
+
+class StreamingFormSetTests(SimpleTestCase):
+
+    data = {
+        'form-TOTAL_FORMS': '4', 'form-INITIAL_FORMS': '0',
+        'form-0-name': 'apple', 'form-0-count': '3',
+        'form-1-name': 'none', 'form-1-count': 'x',
+        'form-2-name': '<b>', 'form-2-count': '1',
+    }
+
+    def assertStreamEqual(self, formset):
+        chunks = list(formset.stream())
+        self.assertEqual(chunks[0], str(formset.management_form))
+        self.assertEqual(''.join(chunks), str(formset))
+        return ''.join(chunks)
+
+    def test_unbound(self):
+        html = self.assertStreamEqual(ItemFormSet())
+        self.assertIn('name="form-TOTAL_FORMS" value="2"', html)
+        self.assertEqual(html.count('<fieldset class="mdcd-fieldset">'), 2)
+        self.assertIn('name="form-1-count"', html)
+        self.assertNotIn('errorlist', html)
+
+    def test_forms_constructed_already(self):
+        formset = ItemFormSet(initial=[{'name': 'apple'}])
+        html = self.assertStreamEqual(formset)
+        formset.forms
+        self.assertEqual(self.assertStreamEqual(formset), html)
+        self.assertIn('value="apple"', html)
+
+    def test_bound(self):
+        formset = ItemFormSet(self.data)
+        html = self.assertStreamEqual(formset)
+        self.assertFalse(formset.is_valid())
+        self.assertEqual(self.assertStreamEqual(formset), html)
+        self.assertIn('name="form-TOTAL_FORMS" value="4"', html)
+        self.assertIn('Please submit 3 or fewer forms.', html)
+        self.assertIn('No such item.', html)
+        self.assertIn('Enter a whole number.', html)
+        self.assertIn('value="&lt;b&gt;"', html)
+        self.assertEqual(html.count('<fieldset class="mdcd-fieldset">'), 4)
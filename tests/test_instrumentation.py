@@ -0,0 +1,44 @@
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from mdc import instrumentation
+from mdc.forms import widgets
+from mdc.templatetags.pagination import paginater_num
+
+
+@override_settings(MDC_INSTRUMENTATION=True)
+class InstrumentationTests(SimpleTestCase):
+
+    def setUp(self):
+        instrumentation.reset_stats()
+        self.addCleanup(instrumentation.reset_stats)
+
+    def test_renders_are_logged_at_debug_level(self):
+        request = RequestFactory().get('/')
+        with self.assertLogs('mdc.instrumentation', 'DEBUG') as logs:
+            html = widgets.TextInput(label='Name').render('f', 'x')
+            paginater_num(request, 10, 2)
+        records = [(record.mdc_category, record.mdc_name, record.mdc_size)
+                   for record in logs.records]
+        self.assertEqual(records[0], ('widget', 'TextInput', len(html)))
+        self.assertEqual(records[1][:2], ('pagination', 'paginater_num'))
+        stats = instrumentation.get_stats()
+        self.assertEqual(stats['widget', 'TextInput']['count'], 1)
+        self.assertEqual(stats['pagination', 'paginater_num']['count'], 1)
+
+    def test_server_timing_header(self):
+        def get_response(request):
+            widgets.TextInput().render('f', 'x')
+            widgets.TextInput().render('g', 'y')
+            return HttpResponse()
+
+        middleware = instrumentation.ServerTimingMiddleware(get_response)
+        response = middleware(RequestFactory().get('/'))
+        self.assertRegex(response['Server-Timing'],
+                         r'^mdc-widget-TextInput;dur=[\d.]+;'
+                         r'desc="2 renders, \d+ bytes"$')
+
+    @override_settings(MDC_INSTRUMENTATION=False)
+    def test_disabled(self):
+        widgets.TextInput().render('f', 'x')
+        self.assertEqual(instrumentation.get_stats(), {})
@@ -0,0 +1,120 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.utils import translation
+
+from mdc.templatetags.pagination import (
+    PageURLBuilder, paginater_num, pagination_cache,
+)
+
+
+class PageURLBuilderTests(SimpleTestCase):
+
+    def test_query_is_kept(self):
+        request = RequestFactory().get('/list/', {
+            'q': 'a&b', 'page': '3', 'sort': ['-name', 'pk']})
+        self.assertEqual(
+            PageURLBuilder(request)(4),
+            '/list/?q=a%26b&amp;page=4&amp;sort=-name&amp;sort=pk')
+
+    def test_path_is_encoded(self):
+        for path, expected in (
+                ('/café/', '/caf%C3%A9/'),
+                ('/a b/%3F"<x>/', '/a%20b/%3F%22%3Cx%3E/'),
+                ('/a;b=c/', '/a%3Bb%3Dc/')):
+            with self.subTest(path=path):
+                request = RequestFactory().get(path)
+                self.assertEqual(PageURLBuilder(request)(2),
+                                 f'{expected}?page=2')
+                self.assertTrue(request.get_full_path().startswith(expected))
+
+
+@override_settings(USE_THOUSAND_SEPARATOR=True)
+class PaginationCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        pagination_cache.clear()
+        cache.clear()
+        self.request = RequestFactory().get('/list/', {'q': 'x'})
+
+    def render(self, num_pages=10000, page_number=5000, **kwargs):
+        return paginater_num(self.request, num_pages, page_number, **kwargs)
+
+    def shared_keys(self):
+        return [key for key in cache._cache if 'mdc.pagination.' in key]
+
+    def test_hits_and_misses(self):
+        html = self.render()
+        self.assertEqual((pagination_cache.hits, pagination_cache.misses),
+                         (0, 1))
+        self.assertEqual(self.render(), html)
+        self.assertEqual((pagination_cache.hits, pagination_cache.misses),
+                         (1, 1))
+        self.assertNotEqual(self.render(page_number=5001), html)
+        self.render(center_number=1)
+        self.render(approximate_format='{}+')
+        paginater_num(RequestFactory().get('/list/', {'q': 'y'}), 10000,
+                      5000)
+        self.assertEqual((pagination_cache.hits, pagination_cache.misses),
+                         (1, 5))
+        self.assertEqual(self.shared_keys(), [])
+
+    def test_languages(self):
+        htmls = {}
+        for language in ('en', 'de', 'ja', 'en'):
+            with translation.override(language):
+                htmls[language] = self.render()
+        self.assertIn('>10,000</a>', htmls['en'])
+        self.assertIn('>10.000</a>', htmls['de'])
+        self.assertEqual(len(pagination_cache), 3)
+        self.assertEqual(pagination_cache.hits, 1)
+
+    def test_icon_modes(self):
+        font = self.render()
+        with mock.patch('mdc.icons.uses_sprite', return_value=True):
+            sprite = self.render()
+        self.assertNotEqual(font, sprite)
+        self.assertIn('<svg', sprite)
+        self.assertNotIn('<svg', font)
+        self.assertEqual(self.render(), font)
+        self.assertEqual(len(pagination_cache), 2)
+
+    @override_settings(MDC_PAGINATION_CACHE='default')
+    def test_shared_cache(self):
+        html = self.render()
+        key, = self.shared_keys()
+        cache.set(key[len(':1:'):], 'shared')
+        self.assertEqual(self.render(), html)
+        pagination_cache.clear()
+        self.assertEqual(self.render(), 'shared')
+        pagination_cache.clear()
+        with translation.override('de'):
+            self.render()
+        with mock.patch('mdc.icons.uses_sprite', return_value=True):
+            self.render()
+        self.assertEqual(len(self.shared_keys()), 3)
+
+    def test_invalidation_on_setting_changes(self):
+        settings = {
+            'MDC_ICONS': 'sprite', 'MDC_PAGINATION_CACHE': 'default',
+            'LANGUAGE_CODE': 'de', 'USE_L10N': False,
+            'USE_THOUSAND_SEPARATOR': False, 'NUMBER_GROUPING': 2,
+            'THOUSAND_SEPARATOR': "'",
+        }
+        for name, value in settings.items():
+            with self.subTest(setting=name):
+                self.render()
+                self.render()
+                self.assertEqual(len(pagination_cache), 1)
+                with override_settings(**{name: value}):
+                    self.assertEqual(len(pagination_cache), 0)
+                    self.assertEqual(pagination_cache.hits, 0)
+                    self.render()
+                self.assertEqual(len(pagination_cache), 0)
+        with override_settings(MDC_PAGINATION_CACHE='default'):
+            self.render()
+            self.assertEqual(len(self.shared_keys()), 1)
+        cache.clear()
+        self.render()
+        self.assertEqual(self.shared_keys(), [])
@@ -0,0 +1,171 @@
+import json
+from base64 import urlsafe_b64encode
+
+from django.contrib.auth.models import Group, Permission
+from django.test import RequestFactory, TestCase
+
+from mdc.paginator import (
+    CappedCount, CursorPaginator, EstimatedCount, InvalidCursor, Paginator,
+)
+from mdc.templatetags.pagination import paginator_number
+
+
+def _cursor(data):
+    return urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+
+def _fail(queryset):
+    raise ValueError('EXPLAIN failed')
+
+
+class PaginatorTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Group.objects.bulk_create([Group(name=f'g{i:02d}') for i in range(25)])
+
+    def paginator(self, estimator):
+        return Paginator(Group.objects.order_by('pk'), 10,
+                         count_strategy=EstimatedCount(estimator, 1))
+
+    def test_short_page_is_last_if_count_is_estimated(self):
+        paginator = self.paginator(lambda queryset: 5000)
+        self.assertTrue(paginator.count_is_approximate)
+        self.assertEqual(paginator.count, 5000)
+        self.assertTrue(paginator.page(2).has_next())
+        page = paginator.page(3)
+        self.assertFalse(page.has_next())
+        html = paginator_number(RequestFactory().get('/'), page)
+        self.assertNotIn('?page=4', html)
+        self.assertNotIn('~', html)
+
+    def test_pages_around_the_cap(self):
+        paginator = Paginator(Group.objects.order_by('pk'), 10,
+                              count_strategy=CappedCount(max_pages=2))
+        self.assertTrue(paginator.count_is_approximate)
+        self.assertEqual(paginator.num_pages, 2)
+        request = RequestFactory().get('/')
+        with self.assertNumQueries(1):
+            page = paginator.page(2)
+            self.assertTrue(page.has_next())
+        self.assertEqual(len(page), 10)
+        html = paginator_number(request, page)
+        self.assertIn('>2+</span>', html)
+        self.assertIn('href="/?page=3"', html)
+        page = paginator.page(3)
+        self.assertEqual(len(page), 5)
+        self.assertFalse(page.has_next())
+        html = paginator_number(request, page)
+        self.assertNotIn('+', html)
+        self.assertNotIn('?page=4', html)
+
+    def test_full_last_page_if_count_is_approximate(self):
+        paginator = Paginator(Group.objects.order_by('pk'), 5,
+                              count_strategy=CappedCount(max_pages=2))
+        self.assertEqual(paginator.count, 10)
+        self.assertTrue(paginator.page(4).has_next())
+        page = paginator.page(5)
+        self.assertEqual(len(page), 5)
+        self.assertFalse(page.has_next())
+        self.assertNotIn('?page=6',
+                         paginator_number(RequestFactory().get('/'), page))
+
+    def test_failing_estimator_falls_back_to_exact_count(self):
+        paginator = self.paginator(_fail)
+        self.assertEqual(paginator.count, 25)
+        self.assertFalse(paginator.count_is_approximate)
+
+
+class CursorPaginatorTests(TestCase):
+    """Keyset pagination over a large generated table of SQLite."""
+
+    rows = 20000
+    per_page = 500
+
+    @classmethod
+    def setUpTestData(cls):
+        # Names are shuffled against primary keys by a multiplicative step.
+        Group.objects.bulk_create([
+            Group(name=f'g{i * 7919 % cls.rows:07d}')
+            for i in range(cls.rows)
+        ], batch_size=500)
+
+    def walk(self, paginator):
+        pages = [paginator.page()]
+        while pages[-1].has_next():
+            pages.append(paginator.page(pages[-1].next_cursor()))
+        return pages
+
+    def test_pages_cover_all_rows_in_order(self):
+        for ordering in ('pk', '-name', ('name', '-pk')):
+            with self.subTest(ordering=ordering):
+                paginator = CursorPaginator(
+                    Group.objects.all(), self.per_page, ordering)
+                pages = self.walk(paginator)
+                rows = [group.pk for page in pages for group in page]
+                expected = list(Group.objects.order_by(
+                    *paginator.ordering).values_list('pk', flat=True))
+                self.assertEqual(rows, expected)
+                self.assertEqual(len(pages), self.rows // self.per_page)
+                self.assertFalse(pages[0].has_previous())
+
+    def test_previous_pages_match_next_pages(self):
+        paginator = CursorPaginator(Group.objects.all(), self.per_page,
+                                    '-name')
+        pages = self.walk(paginator)
+        page = pages[-1]
+        for expected in reversed(pages[:-1]):
+            page = paginator.page(page.previous_cursor())
+            self.assertEqual(list(page), list(expected))
+        self.assertFalse(page.has_previous())
+        self.assertIsNone(page.previous_cursor())
+
+    def test_page_is_fetched_by_one_query(self):
+        paginator = CursorPaginator(Group.objects.all(), self.per_page)
+        cursor = self.walk(paginator)[-2].next_cursor()
+        with self.assertNumQueries(1):
+            page = paginator.page(cursor)
+        self.assertEqual(len(page), self.per_page)
+
+    def test_related_ordering(self):
+        paginator = CursorPaginator(
+            Permission.objects.all(), 5, ('content_type__model', 'codename'))
+        rows = [obj.pk for page in self.walk(paginator) for obj in page]
+        expected = list(Permission.objects.order_by(
+            'content_type__model', 'codename').values_list('pk', flat=True))
+        self.assertEqual(rows, expected)
+
+    def test_invalid_cursors(self):
+        paginator = CursorPaginator(Group.objects.all(), self.per_page)
+        cursors = (
+            'garbage!', _cursor(5), _cursor([0]), _cursor([0, [1, 2]]),
+            _cursor([0, [{}]]), _cursor([0, [[1]]]), _cursor(['x', [1]]),
+        )
+        for cursor in cursors:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(InvalidCursor):
+                    paginator.page(cursor)
+
+    def test_values_of_invalid_cursors(self):
+        cases = [
+            ('pk', [0, ['abc']]), ('pk', [0, ['1.5x']]), ('pk', [0, [None]]),
+            ('pk', [1, [2 ** 70]]), ('-pk', [0, [-2 ** 64]]),
+            ('name', [0, [None]]), (('name', 'pk'), [0, ['g1', 'x']]),
+        ]
+        for ordering, data in cases:
+            with self.subTest(ordering=ordering, data=data):
+                paginator = CursorPaginator(
+                    Group.objects.all(), self.per_page, ordering)
+                with self.assertRaises(InvalidCursor):
+                    paginator.page(_cursor(data))
+        paginator = CursorPaginator(
+            Permission.objects.all(), 5, ('content_type', 'codename'))
+        for data in ([0, ['x', 'add_group']], [0, [1, None]]):
+            with self.subTest(data=data):
+                with self.assertRaises(InvalidCursor):
+                    paginator.page(_cursor(data))
+
+    def test_values_of_cursors_are_converted(self):
+        paginator = CursorPaginator(Group.objects.all(), self.per_page)
+        self.assertEqual(list(paginator.page(_cursor([0, ['10']]))),
+                         list(paginator.page(_cursor([0, [10]]))))
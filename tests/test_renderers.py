@@ -0,0 +1,175 @@
+import datetime
+import os
+import tempfile
+
+from django import forms as django_forms
+from django.forms.renderers import DjangoTemplates, TemplatesSetting
+from django.test import SimpleTestCase, override_settings
+from django.utils import translation
+from django.utils.safestring import mark_safe
+from django.utils.translation import gettext_lazy
+
+from mdc.forms import widgets
+from mdc.forms.renderers import (
+    CompiledDjangoTemplates, CompiledTemplatesSetting, Jinja2,
+)
+
+CHOICES = [('a', 'Apple'), ('b', 'Banana <b>'), ('', 'None')]
+GROUPED_CHOICES = [
+    ('Fruits', [('a', 'Apple'), ('b', 'Banana')]),
+    ('c', 'Carrot & "Co"'),
+    (1, 1234.5),
+]
+
+WIDGETS = [
+    ('text', lambda: widgets.TextInput(), 'a <b> & "c"'),
+    ('text-label', lambda: widgets.TextInput(label='Name'), None),
+    ('text-lazy-label', lambda: widgets.TextInput(
+        label=gettext_lazy('Password'), auto_init='lazy'), 'x'),
+    ('text-hint', lambda: widgets.TextInput(
+        label=mark_safe('<b>Name</b>'), hint='Your name', persistent=True,
+        valid_msg=True, dense=True), ''),
+    ('text-no-auto-init', lambda: widgets.TextInput(auto_init=False), 'x'),
+    ('number', lambda: widgets.NumberInput(label='Number'), 1234.5),
+    ('email', lambda: widgets.EmailInput(label='Email'), 'a@example.com'),
+    ('url', lambda: widgets.URLInput(label='URL'), 'https://a.b/?c=d&e'),
+    ('password', lambda: widgets.PasswordInput(
+        label='Password', auth_validate=True, hint='Secret'), 'x'),
+    ('password-no-hint', lambda: widgets.PasswordInput(), None),
+    ('textarea', lambda: widgets.Textarea(label='Text'), 'a\n<b>'),
+    ('textarea-empty', lambda: widgets.Textarea(auto_init=False), None),
+    ('checkbox', lambda: widgets.CheckboxInput(label='Check'), True),
+    ('checkbox-off', lambda: widgets.CheckboxInput(
+        auto_init='lazy'), False),
+    ('select', lambda: widgets.Select(choices=CHOICES, label='Fruit'), 'b'),
+    ('select-grouped', lambda: widgets.Select(
+        choices=GROUPED_CHOICES), 'b'),
+    ('select-compiled', lambda: widgets.Select(
+        choices=GROUPED_CHOICES, label='Fruit', compile_options=True), 1),
+    ('radio', lambda: widgets.RadioSelect(choices=CHOICES, label='Fruit'),
+     'a'),
+    ('radio-grouped', lambda: widgets.RadioSelect(
+        choices=GROUPED_CHOICES, auto_init=False), 'c'),
+    ('radio-compiled', lambda: widgets.RadioSelect(
+        choices=CHOICES, compile_options=True), ''),
+    ('slider', lambda: widgets.Slider(label='Volume'), 30),
+    ('slider-discrete', lambda: widgets.Slider(
+        discrete=True, step=5, display_merkers=True, uses_form=True),
+     '<30>'),
+]
+"""Names, factories and values of widgets rendered by the tests."""
+
+DJANGO_WIDGETS = [
+    ('django-text', lambda: django_forms.TextInput(), 'a <b>'),
+    ('django-number', lambda: django_forms.NumberInput(), 1234.5),
+    ('django-date', lambda: django_forms.DateInput(),
+     datetime.date(2020, 1, 2)),
+    ('django-textarea', lambda: django_forms.Textarea(), 'a\n<b>'),
+    ('django-checkbox', lambda: django_forms.CheckboxInput(), True),
+    ('django-file', lambda: django_forms.ClearableFileInput(), None),
+    ('django-hidden', lambda: django_forms.MultipleHiddenInput(),
+     ['a', 'b']),
+    ('django-select', lambda: django_forms.Select(
+        choices=GROUPED_CHOICES), 1),
+    ('django-select-multiple', lambda: django_forms.SelectMultiple(
+        choices=GROUPED_CHOICES), ['a', 'c']),
+    ('django-null-boolean', lambda: django_forms.NullBooleanSelect(), True),
+    ('django-radio', lambda: django_forms.RadioSelect(
+        choices=GROUPED_CHOICES), 'a'),
+    ('django-checkbox-multiple', lambda: django_forms.CheckboxSelectMultiple(
+        choices=GROUPED_CHOICES), ['a', 'c']),
+    ('django-select-date', lambda: django_forms.SelectDateWidget(
+        years=[2019, 2020]), datetime.date(2020, 1, 2)),
+    ('django-split-datetime', lambda: django_forms.SplitDateTimeWidget(),
+     datetime.datetime(2020, 1, 2, 3, 4)),
+    ('multiwidget', lambda: django_forms.MultiWidget([
+        widgets.TextInput(label='Name', hint='Hint'),
+        widgets.Select(choices=CHOICES),
+        widgets.CheckboxInput(label='Check'),
+    ]), ['x', 'b', True]),
+]
+"""Widgets of Django, and a multi-widget of MDC widgets."""
+
+ATTRS = [
+    None,
+    {'id': 'id_f'},
+    {'id': 'id_f', 'disabled': True, 'autofocus': True, 'required': False,
+     'class': 'extra', 'data-x': '<&">'},
+]
+
+LANGUAGES = ['en', 'de', 'ja']
+
+
+class ParityTestMixin:
+    """Mixin to tests rendering all widgets with two renderers."""
+
+    expected_renderer = DjangoTemplates
+    renderer = None
+
+    def assertRenderParity(self, cases=WIDGETS):
+        expected_renderer = self.expected_renderer()
+        renderer = self.renderer()
+        for name, factory, value in cases:
+            for language in LANGUAGES:
+                for attrs in ATTRS:
+                    with self.subTest(widget=name, language=language,
+                                      attrs=attrs), \
+                            translation.override(language):
+                        self.assertEqual(
+                            factory().render('f', value, attrs, renderer),
+                            factory().render('f', value, attrs,
+                                             expected_renderer),
+                        )
+
+
+class CompiledDjangoTemplatesTests(ParityTestMixin, SimpleTestCase):
+
+    renderer = CompiledDjangoTemplates
+
+    def test_parity(self):
+        self.assertRenderParity()
+
+    def test_templates_are_compiled(self):
+        renderer = self.renderer()
+        for template_name in renderer.compiled_templates:
+            with self.subTest(template_name=template_name):
+                self.assertIsNotNone(renderer.get_compiled(template_name))
+
+
+class CompiledTemplatesSettingTests(ParityTestMixin, SimpleTestCase):
+
+    expected_renderer = TemplatesSetting
+    renderer = CompiledTemplatesSetting
+
+    def test_parity(self):
+        self.assertRenderParity()
+
+    def test_overridden_templates_are_rendered(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'mdc', 'forms', 'widgets')
+            os.makedirs(path)
+            with open(os.path.join(path, 'text.html'), 'w') as f:
+                f.write('<input name="{{ widget.name }}" data-project>')
+            with override_settings(TEMPLATES=[{
+                'BACKEND': 'django.template.backends.django.DjangoTemplates',
+                'DIRS': [directory],
+                'APP_DIRS': True,
+            }]):
+                renderer = self.renderer()
+                html = widgets.TextInput().render('f', 'x', None, renderer)
+                self.assertHTMLEqual(html, '<input name="f" data-project>')
+                self.assertIsNone(renderer.get_compiled(
+                    'mdc/forms/widgets/text.html'))
+                self.assertIsNotNone(renderer.get_compiled(
+                    'mdc/forms/widgets/select.html'))
+
+
+class Jinja2Tests(ParityTestMixin, SimpleTestCase):
+
+    renderer = Jinja2
+
+    def test_parity(self):
+        self.assertRenderParity()
+
+    def test_django_widgets_parity(self):
+        self.assertRenderParity(DJANGO_WIDGETS)
@@ -0,0 +1,49 @@
+from django.contrib.auth.models import Group
+from django.test import RequestFactory, TestCase
+
+from mdc.tables import Column, DataTable
+
+
+class DataTableTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Group.objects.bulk_create([Group(name=f'g{i:02d}') for i in range(30)])
+
+    def test_sorted_page(self):
+        request = RequestFactory().get('/', {'sort': '-name', 'page': '2'})
+        table = DataTable(Group.objects.all(), [Column('name')], request)
+        page = table.paginate(10)
+        self.assertEqual(page.number, 2)
+        html = table.render()
+        self.assertIn('<td>g19</td>', html)
+        self.assertNotIn('<td>g20</td>', html)
+        self.assertIn('<tfoot>', html)
+
+    def test_sliced_queryset(self):
+        request = RequestFactory().get('/', {'sort': 'name'})
+        with self.assertRaises(TypeError):
+            DataTable(Group.objects.all()[:5], [Column('name')], request)
+        with self.assertRaises(TypeError):
+            DataTable(Group.objects.all()[:5], [Column('name')],
+                      ordering='name')
+
+    def test_sliced_queryset_without_sort(self):
+        request = RequestFactory().get('/', {'page': '2'})
+        table = DataTable(Group.objects.order_by('name')[:15],
+                          [Column('name')], request)
+        self.assertEqual(len(table.paginate(10)), 5)
+        html = table.render()
+        self.assertEqual(html.count('<td>'), 5)
+        self.assertIn('<td>g14</td>', html)
+        self.assertNotIn('<td>g15</td>', html)
+        html = DataTable(Group.objects.order_by('name')[:15],
+                         [Column('name')]).render()
+        self.assertEqual(html.count('<td>'), 15)
+
+    def test_without_request(self):
+        table = DataTable(Group.objects.order_by('name'), [Column('name')])
+        self.assertIsNone(table.paginate(10))
+        html = table.render()
+        self.assertEqual(html.count('<td>'), 30)
+        self.assertNotIn('<tfoot>', html)
@@ -0,0 +1,90 @@
+from django import forms as django_forms
+from django.core.exceptions import ValidationError
+from django.test import RequestFactory, SimpleTestCase
+
+from mdc import forms
+from mdc.views import FieldValidationView
+
+
+class SignupForm(forms.FieldValidationMixin, forms.Form):
+    validation_url = '/validate/'
+    field_dependencies = {'password2': ('password1',)}
+    field_checks = {'username': ('check_username_available',)}
+
+    username = forms.CharField(max_length=10)
+    password1 = forms.CharField(widget=forms.PasswordInput)
+    password2 = forms.CharField(widget=forms.PasswordInput)
+    agree = django_forms.BooleanField()
+
+    def clean_password2(self):
+        password2 = self.cleaned_data['password2']
+        if self.cleaned_data.get('password1') != password2:
+            raise ValidationError("Passwords don't match.")
+        return password2
+
+    def check_username_available(self):
+        if self.cleaned_data['username'] == 'admin':
+            raise ValidationError('The username is taken.')
+
+
+class FieldValidationViewTests(SimpleTestCase):
+
+    view = staticmethod(FieldValidationView.as_view(form_class=SignupForm))
+
+    def post(self, field, data):
+        request = RequestFactory().post(f'/validate/?field={field}', data)
+        return self.view(request)
+
+    def test_valid_field(self):
+        response = self.post('password2', {
+            'username': '', 'password1': 'secret', 'password2': 'secret'})
+        self.assertEqual(response.status_code, 200)
+        html = response.content.decode()
+        self.assertIn('data-mdcd-field="password2"', html)
+        self.assertIn('data-mdcd-validate-url="/validate/"', html)
+        self.assertNotIn('aria-invalid', html)
+        self.assertNotIn('data-mdcd-error', html)
+        self.assertNotIn('name="username"', html)
+
+    def test_field_dependencies(self):
+        response = self.post('password2', {
+            'password1': 'secret', 'password2': 'other'})
+        html = response.content.decode()
+        self.assertIn('aria-invalid="true"', html)
+        self.assertIn('data-mdcd-error="Passwords don&#39;t match."', html)
+        self.assertIn('mdc-text-field-helper-text--persistent', html)
+        self.assertNotIn('name="password1"', html)
+
+    def test_field_checks(self):
+        html = self.post('username', {'username': 'admin'}).content.decode()
+        self.assertIn('data-mdcd-error="The username is taken."', html)
+        self.assertIn('value="admin"', html)
+        html = self.post('username', {'username': 'a' * 11}).content.decode()
+        self.assertIn('aria-invalid="true"', html)
+        self.assertNotIn('The username is taken.', html)
+        html = self.post('username', {'username': 'alice'}).content.decode()
+        self.assertNotIn('aria-invalid', html)
+
+    def test_field_checks_of_the_form(self):
+        form = SignupForm({'username': 'admin', 'password1': 'a',
+                           'password2': 'b', 'agree': 'on'})
+        self.assertEqual(form.errors, {
+            'username': ['The username is taken.'],
+            'password2': ["Passwords don't match."],
+        })
+
+    def test_errors_of_the_field_only(self):
+        form = SignupForm({'password1': 'a', 'password2': 'b'})
+        errors = form.validate_field('password2')
+        self.assertEqual(errors, ["Passwords don't match."])
+        self.assertEqual(list(form.errors), ['password2'])
+
+    def test_unknown_field(self):
+        for field in ('', 'unknown', 'password'):
+            with self.subTest(field=field):
+                response = self.post(field, {'username': 'alice'})
+                self.assertEqual(response.status_code, 400)
+
+    def test_get_is_not_allowed(self):
+        response = self.view(RequestFactory().get('/validate/?field=agree'))
+        self.assertEqual(response.status_code, 405)
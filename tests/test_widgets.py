@@ -0,0 +1,112 @@
+from django import forms as django_forms
+from django.contrib.auth.models import Group
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import translation
+
+from mdc.forms import widgets
+
+
+class CompiledOptionsTests(SimpleTestCase):
+
+    def test_subwidgets(self):
+        class Form(django_forms.Form):
+            radio = django_forms.ChoiceField(
+                choices=[('a', 'A'), ('b', 'B')],
+                widget=widgets.RadioSelect(compile_options=True))
+
+        form = Form(initial={'radio': 'b'})
+        radios = list(form['radio'])
+        self.assertEqual([radio.choice_label for radio in radios], ['A', 'B'])
+        self.assertTrue(radios[1].data['selected'])
+        self.assertIn('value="b"', str(form['radio']))
+
+    def test_cache_key_of_equal_choices(self):
+        for choices in ([(1, 'Yes')], [(True, 'Yes')], [('1', 1.5)],
+                        [('1', '1.5')]):
+            with self.subTest(choices=choices):
+                widget = widgets.Select(choices=choices, compile_options=True)
+                expected = widgets.Select(choices=choices).render('f', None)
+                self.assertEqual(widget.render('f', None), expected)
+
+
+class AsyncSelectTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = Group.objects.create(name='Staff')
+
+    def form(self, data=None):
+        class Form(django_forms.Form):
+            group = django_forms.ModelChoiceField(
+                Group.objects.all(),
+                widget=widgets.AsyncSelect(url='/groups/'))
+
+        return Form(data)
+
+    def test_selected_choice(self):
+        html = str(self.form({'group': self.group.pk})['group'])
+        self.assertIn('data-mdcd-async-url="/groups/"', html)
+        self.assertIn(f'<option value="{self.group.pk}" selected>Staff',
+                      html)
+
+    def test_invalid_values(self):
+        for value in ('abc', '1.5', '99999'):
+            with self.subTest(value=value):
+                form = self.form({'group': value})
+                self.assertFalse(form.is_valid())
+                self.assertIn('group', form.errors)
+                self.assertNotIn('selected', str(form['group']))
+
+    def test_without_url(self):
+        html = widgets.AsyncSelect(choices=[('a', 'A')]).render('f', 'a')
+        self.assertNotIn('data-mdcd-async-url', html)
+        self.assertIn('<option value="a" selected>A</option>', html)
+
+
+VALIDATORS = [
+    {'NAME': 'django.contrib.auth.password_validation.'
+             'MinimumLengthValidator', 'OPTIONS': {'min_length': 10}},
+    {'NAME': 'django.contrib.auth.password_validation.'
+             'NumericPasswordValidator'},
+]
+
+
+@override_settings(AUTH_PASSWORD_VALIDATORS=VALIDATORS)
+class PasswordInputTests(SimpleTestCase):
+
+    def context(self):
+        widget = widgets.PasswordInput(auth_validate=True)
+        context = widget.get_context('password', None, None)
+        return context['widget']['attrs']['pattern'], context['hint']
+
+    def test_validation_per_language(self):
+        validations = {}
+        for language in ('en', 'de', 'ja'):
+            with translation.override(language):
+                validations[language] = self.context()
+                self.assertIs(widgets._auth_validations[language],
+                              widgets._get_auth_validation())
+        self.assertEqual(validations['en'], (
+            r'(?=.{10})(?=.*[^\d]).*',
+            'Your password must contain at least 10 characters.'
+            " Your password can't be entirely numeric.",
+        ))
+        # The pattern doesn't depend on the language, unlike the hint.
+        self.assertEqual({pattern for pattern, _ in validations.values()},
+                         {validations['en'][0]})
+        self.assertEqual(len({hint for _, hint in validations.values()}), 3)
+        with translation.override('de'):
+            self.assertEqual(self.context(), validations['de'])
+
+    def test_cache_is_cleared_by_setting_changes(self):
+        with translation.override('en'):
+            self.context()
+            self.assertIn('en', widgets._auth_validations)
+            with override_settings(AUTH_PASSWORD_VALIDATORS=VALIDATORS[:1]):
+                self.assertEqual(widgets._auth_validations, {})
+                self.assertEqual(self.context(), (
+                    '(?=.{10}).*',
+                    'Your password must contain at least 10 characters.',
+                ))
+            self.assertEqual(widgets._auth_validations, {})
+            self.assertEqual(self.context()[0], r'(?=.{10})(?=.*[^\d]).*')
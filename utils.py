@@ -0,0 +1,52 @@
+"""Utilities for MDC for Django."""
+
+import threading
+from collections import OrderedDict
+
+__all__ = ('LRUCache',)
+
+
+class LRUCache:
+    """Thread-safe cache discarding the least recently used items.
+
+    Args:
+        maxsize (:obj:`int`, optional): Maximum number of items. Default to
+            128.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """Return the item of `key`, or `default` if not cached."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """Cache `value` as `key`, discarding the oldest item if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Discard all items and reset counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,106 @@
+"""View classes for MDC for Django."""
+
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse, HttpResponseBadRequest, JsonResponse
+from django.views.generic import View
+
+__all__ = ('AsyncChoicesView', 'FieldValidationView')
+
+
+class AsyncChoicesView(View):
+    """View providing choices of :obj:`mdc.forms.widgets.AsyncSelect`.
+
+    The view responds the JSON of the choices in pages, which are filtered
+    by prefix of `search_field` with `q` query parameter. The page is
+    specified by `page` query parameter, and rows are never counted::
+
+        {"results": [{"value": "1", "label": "Apple"}], "more": true}
+
+    Attributes:
+        queryset (:obj:`QuerySet`): Queryset of choices.
+        search_field (str): Field name searched by prefix.
+        to_field_name (str): Field name used as the value of choices.
+            Default to the primary key.
+        paginate_by (int): Number of choices in a page. Default to 50.
+    """
+
+    queryset = None
+    search_field = None
+    to_field_name = None
+    paginate_by = 50
+
+    def get_queryset(self):
+        if self.queryset is None:
+            raise ImproperlyConfigured(
+                f'{self.__class__.__name__} is missing a queryset.')
+        queryset = self.queryset.all()
+        if not queryset.ordered:
+            queryset = queryset.order_by(self.search_field or 'pk')
+        return queryset
+
+    def label_from_instance(self, obj):
+        return str(obj)
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        query = request.GET.get('q', '')
+        if query and self.search_field:
+            queryset = queryset.filter(
+                **{f'{self.search_field}__istartswith': query})
+        try:
+            page = max(int(request.GET.get('page', 1)), 1)
+        except ValueError:
+            page = 1
+        bottom = (page - 1) * self.paginate_by
+        rows = list(queryset[bottom:bottom + self.paginate_by + 1])
+        key = self.to_field_name or 'pk'
+        return JsonResponse({
+            'results': [
+                {
+                    'value': str(getattr(obj, key)),
+                    'label': self.label_from_instance(obj),
+                }
+                for obj in rows[:self.paginate_by]
+            ],
+            'more': len(rows) > self.paginate_by,
+        })
+
+
+class FieldValidationView(View):
+    """View validating a field of :obj:`mdc.forms.FieldValidationMixin`.
+
+    The view binds the form to the posted data, validates the field whose
+    HTML name is `field` query parameter, and responds the HTML of the
+    field only, in the error state if it is invalid. Unknown fields are
+    responded with status 400.
+
+    Attributes:
+        form_class (type): Form class with
+            :obj:`mdc.forms.FieldValidationMixin`.
+        prefix (str): Prefix of the form. Default to `None`.
+    """
+
+    form_class = None
+    prefix = None
+    http_method_names = ['post']
+
+    def get_form_kwargs(self):
+        return {
+            'data': self.request.POST,
+            'files': self.request.FILES,
+            'prefix': self.prefix,
+        }
+
+    def get_form(self):
+        if self.form_class is None:
+            raise ImproperlyConfigured(
+                f'{self.__class__.__name__} is missing a form_class.')
+        return self.form_class(**self.get_form_kwargs())
+
+    def post(self, request, *args, **kwargs):
+        form = self.get_form()
+        name = form.field_name_of(request.GET.get('field', ''))
+        if name is None:
+            return HttpResponseBadRequest('No such field.')
+        form.validate_field(name)
+        return HttpResponse(str(form[name]))